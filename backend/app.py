@@ -1,8 +1,68 @@
-from fastapi import FastAPI
+import asyncio
+import time
+import warnings
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from routers import tailor_routes, reformat_routes
+from fastapi.responses import Response
+from core.config import settings
+from routers import tailor_routes, reformat_routes, preview_routes, session_routes, history_routes
+from services.history_store import HISTORY_HEADER
+from services import metrics
+from services.pdf_cache import PDF_CACHE_HEADER
+from services.pdf_writer import RENDER_TIMING_HEADER
+from services.resume_cache import CACHE_HEADER
+from services.server_timing import SERVER_TIMING_HEADER, format_server_timing, start_request
+from services.upload_handler import RequestSizeLimitMiddleware
+
+
+
+def _warm_up() -> None:
+    """Import and build what the first tailoring request needs, off the startup path."""
+    import pdfplumber  # noqa: F401  (text/layout extraction)
+
+    from services.html_preview import get_html_template
+    from services.llm_client import get_client
+    from services.pdf_writer import get_resume_template
+
+    get_client()
+    get_resume_template()
+    get_html_template()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        settings.validate_api_key()
+    except ValueError as e:
+        warnings.warn(str(e), UserWarning)
+    if settings.warm_up_on_start:
+        # Not awaited: the server starts accepting traffic while this runs
+        asyncio.get_running_loop().run_in_executor(None, _warm_up)
+    yield
+
+
+app = FastAPI(title="Auto Resume Tailor", lifespan=lifespan)
+
+
+# Reject oversized uploads (by Content-Length, and while the body streams in).
+# Registered before CORS so CORS stays the outermost middleware and the 413 still
+# carries CORS headers for the browser.
+app.add_middleware(RequestSizeLimitMiddleware)
+
+
+# Per-stage durations of every response in a Server-Timing header. The handler
+# runs in a child context that shares this request's timings dict.
+@app.middleware("http")
+async def server_timing(request: Request, call_next):
+    timings = start_request()
+    start = time.perf_counter()
+    response = await call_next(request)
+    timings["total"] = (time.perf_counter() - start) * 1000
+    response.headers[SERVER_TIMING_HEADER] = format_server_timing(timings)
+    return response
 
-app = FastAPI(title="Auto Resume Tailor")
 
 # CORS middleware to allow frontend requests
 app.add_middleware(
@@ -17,11 +77,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the frontend read cache/history status, stage/render timings and preview ETags
+    expose_headers=[CACHE_HEADER, PDF_CACHE_HEADER, HISTORY_HEADER, RENDER_TIMING_HEADER, SERVER_TIMING_HEADER, "ETag"],
 )
 
 # Register routers
 app.include_router(tailor_routes.router, prefix="/api")
 app.include_router(reformat_routes.router, prefix="/api")
+app.include_router(preview_routes.router, prefix="/api")
+app.include_router(session_routes.router, prefix="/api")
+app.include_router(history_routes.router, prefix="/api")
 
 @app.get("/")
 def root():
@@ -31,6 +96,7 @@ def root():
         "version": "1.0.0",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "docs": "/docs",
             "api": "/api"
         }
@@ -39,3 +105,8 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+@app.get("/metrics")
+def metrics_endpoint():
+    """Per-stage latency histograms, token/cache/error counters and LaTeX pool stats (Prometheus text format)."""
+    return Response(content=metrics.render(), media_type=metrics.METRICS_MEDIA_TYPE)
@@ -0,0 +1,125 @@
+"""
+Cold-start benchmark: `import app` time (python -X importtime) and time
+from launching uvicorn to the first 200 from GET /health.
+
+Each measurement runs in a fresh interpreter. The slowest imports
+(cumulative, top-level packages and our own modules) are listed so a
+regression points at the module that caused it. Exits with status 1 when
+a median exceeds its target, so it can gate CI / deploy checks.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs 5] [--import-target-ms 900] [--health-target-ms 1000]
+"""
+
+import argparse
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile_import() -> Tuple[float, Dict[str, float]]:
+    """(total ms, top-level module -> cumulative ms) for `import app` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    modules: Dict[str, float] = {}
+    total = 0.0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        cumulative_ms = int(match.group(2)) / 1000
+        depth = len(match.group(3)) // 2
+        name = match.group(4)
+        if name == "app":
+            total = cumulative_ms
+        # Direct imports of a package/module, plus every module of ours
+        if depth <= 1 or name.split(".")[0] in ("services", "routers", "models", "core"):
+            modules[name] = max(modules.get(name, 0.0), cumulative_ms)
+    return total, modules
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_health(timeout: float = 30.0) -> float:
+    """ms from spawning uvicorn until GET /health answers 200."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"/health did not answer within {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--import-target-ms", type=float, default=900, help="Median `import app` budget")
+    parser.add_argument("--health-target-ms", type=float, default=1000, help="Median time-to-first-/health budget")
+    parser.add_argument("--top", type=int, default=12, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    profile_import()  # warm the OS file cache and .pyc files
+
+    import_totals: List[float] = []
+    slowest: Dict[str, List[float]] = {}
+    for _ in range(args.runs):
+        total, modules = profile_import()
+        import_totals.append(total)
+        for name, ms in modules.items():
+            slowest.setdefault(name, []).append(ms)
+    health_times = [time_to_first_health() for _ in range(args.runs)]
+
+    import_ms = statistics.median(import_totals)
+    health_ms = statistics.median(health_times)
+
+    print("=" * 60)
+    print(f"Slowest imports under `import app` (median cumulative ms, {args.runs} runs)")
+    print("=" * 60)
+    ranked = sorted(((statistics.median(times), name) for name, times in slowest.items() if name != "app"), reverse=True)
+    for ms, name in ranked[:args.top]:
+        print(f"{name:<44} {ms:9.1f} ms")
+    print("=" * 60)
+    checks = [
+        ("import app", import_ms, args.import_target_ms),
+        ("first /health", health_ms, args.health_target_ms),
+    ]
+    failed = False
+    for label, value, target in checks:
+        ok = value <= target
+        failed |= not ok
+        print(f"{label:<20} {value:9.1f} ms   target {target:7.0f} ms   {'OK' if ok else 'OVER'}")
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Font-metric page estimate vs measuring a real render.
+
+For the sample resume padded to increasing lengths, compares the estimated
+page fill (services/page_estimate.py) with the fill measured from a native
+render (services/fit_solver.measure_pdf), and the time each takes.
+
+Usage:
+    python benchmarks/bench_page_estimate.py [--runs 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_latex_render import sample_resume
+from core.config import settings
+from services.fit_solver import measure_pdf
+from services.page_estimate import PAGE_TEXT_HEIGHT, estimate_page_height
+from services.pdf_writer import render_resume_pdf
+
+
+def _per_call(fn, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200, help="Estimates per resume size")
+    args = parser.parse_args()
+
+    settings.embed_resume_json = False  # measure rendering only
+
+    print("=" * 72)
+    print(f"{'bullets':>8} {'estimated':>10} {'measured':>10} {'estimate':>12} {'render+measure':>16}")
+    print("=" * 72)
+    for copies in (1, 2, 3, 4):
+        resume = sample_resume()
+        for exp in resume.experience:
+            exp.bullets = exp.bullets * copies
+        bullets = sum(len(exp.bullets) for exp in resume.experience)
+
+        # Unmemoized (estimate_page_fill would hit the ResumeStats memo after the first call)
+        estimated = estimate_page_height(resume) / PAGE_TEXT_HEIGHT
+        estimate_time = _per_call(lambda: estimate_page_height(resume), args.runs)
+
+        start = time.perf_counter()
+        pages, fill = measure_pdf(render_resume_pdf(resume, backend="native"))
+        render_time = time.perf_counter() - start
+        measured = pages - 1 + fill
+
+        print(f"{bullets:>8} {estimated:>10.3f} {measured:>10.3f} "
+              f"{estimate_time * 1e6:>9.0f} us {render_time * 1000:>13.1f} ms")
+    print("=" * 72)
+    print("fill is in pages (1.000 = one full page)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare the PDF render backends: pdflatex ("latex") vs in-process ("native").
+
+Reports median render time and output size per backend on a sample resume,
+and the on-disk size of the TeX installation the latex backend needs (the
+part of the Docker image a native-only build leaves out). The latex rows
+are skipped when pdflatex is not installed.
+
+Usage:
+    python benchmarks/bench_pdf_backends.py [--runs 20]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_latex_render import sample_resume
+from core.config import settings
+from services.pdf_writer import render_resume_pdf
+
+
+def _time_backend(backend: str, runs: int) -> tuple:
+    resume = sample_resume()
+    pdf_bytes = render_resume_pdf(resume, backend=backend)  # warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render_resume_pdf(resume, backend=backend)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), len(pdf_bytes)
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _texlive_size() -> int:
+    """Bytes under the TeX trees kpathsea knows about (distribution + system vars)."""
+    total = 0
+    for var in ("TEXMFDIST", "TEXMFSYSVAR", "TEXMFSYSCONFIG"):
+        result = subprocess.run(["kpsewhich", f"-var-value={var}"], capture_output=True, text=True)
+        path = result.stdout.strip()
+        if path and os.path.isdir(path):
+            total += _dir_size(path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Renders per backend")
+    args = parser.parse_args()
+
+    settings.embed_resume_json = False  # measure rendering only
+    has_latex = shutil.which("pdflatex") is not None
+
+    print("=" * 64)
+    print(f"PDF render backends ({args.runs} runs, median)")
+    print("=" * 64)
+    native_time, native_size = _time_backend("native", args.runs)
+    print(f"native   {native_time * 1000:9.1f} ms / render   {native_size / 1024:6.1f} KiB PDF")
+    if has_latex:
+        latex_time, latex_size = _time_backend("latex", args.runs)
+        print(f"latex    {latex_time * 1000:9.1f} ms / render   {latex_size / 1024:6.1f} KiB PDF"
+              f"   ({latex_time / native_time:.0f}x slower)")
+        print(f"\nTeX installation on disk: {_texlive_size() / 1024 ** 2:,.0f} MiB (not needed by native)")
+    else:
+        print("latex    skipped (pdflatex not installed)")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark PDF text-extraction backends on a corpus of sample resumes.
+Reports median extraction time per backend and text similarity against
+the pdfplumber baseline, plus which backend "auto" settled on.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py path/to/resumes/ [--runs 5]
+"""
+
+import argparse
+import difflib
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.pdf_reader import EXTRACTION_BACKENDS, extract_text_from_pdf, looks_garbled
+
+
+BASELINE = "pdfplumber"
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _similarity(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, _normalize(a), _normalize(b), autojunk=False).ratio()
+
+
+def _time_backend(backend: str, path: Path, runs: int) -> tuple[float, str]:
+    timings = []
+    text = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        text = extract_text_from_pdf(str(path), backend=backend)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", help="Directory containing sample resume PDFs")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per backend per file (median is reported)")
+    args = parser.parse_args()
+
+    pdfs = sorted(Path(args.corpus).glob("*.pdf"))
+    if not pdfs:
+        print(f"❌ No PDFs found in {args.corpus}")
+        sys.exit(1)
+
+    backends = list(EXTRACTION_BACKENDS) + ["auto"]
+    totals = {name: 0.0 for name in backends}
+    similarities = {name: [] for name in backends}
+    garbled = {name: 0 for name in backends}
+
+    print("=" * 78)
+    print(f"PDF extraction benchmark: {len(pdfs)} file(s), {args.runs} run(s) each")
+    print("=" * 78)
+
+    for path in pdfs:
+        baseline_time, baseline_text = _time_backend(BASELINE, path, args.runs)
+        print(f"\n{path.name}")
+        for name in backends:
+            if name == BASELINE:
+                elapsed, text = baseline_time, baseline_text
+            else:
+                try:
+                    elapsed, text = _time_backend(name, path, args.runs)
+                except Exception as e:
+                    print(f"  {name:<11} failed: {e}")
+                    continue
+            sim = _similarity(baseline_text, text)
+            totals[name] += elapsed
+            similarities[name].append(sim)
+            if looks_garbled(text):
+                garbled[name] += 1
+            print(f"  {name:<11} {elapsed * 1000:8.1f} ms   similarity {sim:6.3f}   {len(text):6d} chars")
+
+    print("\n" + "=" * 78)
+    print(f"{'backend':<11} {'total ms':>10} {'speedup':>9} {'mean sim':>9} {'min sim':>8} {'garbled':>8}")
+    baseline_total = totals[BASELINE] or 1e-9
+    for name in backends:
+        sims = similarities[name]
+        if not sims:
+            continue
+        print(
+            f"{name:<11} {totals[name] * 1000:10.1f} {baseline_total / (totals[name] or 1e-9):8.2f}x "
+            f"{statistics.mean(sims):9.3f} {min(sims):8.3f} {garbled[name]:8d}"
+        )
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
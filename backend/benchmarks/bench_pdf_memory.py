@@ -0,0 +1,65 @@
+"""
+Measure latency and peak memory of pdfplumber extraction on long CVs,
+serial vs page-parallel. Each measurement runs in a fresh process so the
+peak RSS numbers are not polluted by earlier runs.
+
+Usage:
+    python benchmarks/bench_pdf_memory.py path/to/long_cv.pdf [--workers 4]
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _measure(path: str, workers: int) -> dict:
+    from services.pdf_reader import _peak_rss_kb, extract_pdfplumber_pages
+
+    baseline_rss_kb = _peak_rss_kb()
+    start = time.perf_counter()
+    text, stats = extract_pdfplumber_pages(path, workers=workers)
+    stats["elapsed_ms"] = (time.perf_counter() - start) * 1000
+    stats["chars"] = len(text)
+    stats["baseline_rss_kb"] = baseline_rss_kb
+    # In serial mode the extraction happened in this process
+    stats["parent_peak_rss_kb"] = _peak_rss_kb()
+    return stats
+
+
+def _measure_in_fresh_process(path: str, workers: int) -> dict:
+    # ProcessPoolExecutor workers (unlike multiprocessing.Pool) may spawn children
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_measure, path, workers).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", help="PDF to extract (ideally a 10-20 page CV)")
+    parser.add_argument("--workers", type=int, default=4, help="Workers for the parallel run")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"pdfplumber extraction memory benchmark: {Path(args.pdf).name}")
+    print("=" * 72)
+    print(f"{'mode':<10} {'pages':>5} {'chunks':>6} {'ms':>9} {'worker peak MiB':>16} {'parent peak MiB':>16}")
+
+    for label, workers in [("serial", 1), ("parallel", args.workers)]:
+        stats = _measure_in_fresh_process(args.pdf, workers)
+        print(
+            f"{label:<10} {stats['pages']:>5} {stats['chunks']:>6} {stats['elapsed_ms']:9.1f} "
+            f"{stats['peak_rss_kb'] / 1024:16.1f} {stats['parent_peak_rss_kb'] / 1024:16.1f}"
+        )
+
+    print("=" * 72)
+    print("Size per-worker memory limits from 'worker peak MiB' plus headroom.")
+
+
+if __name__ == "__main__":
+    main()
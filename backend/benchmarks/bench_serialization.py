@@ -0,0 +1,76 @@
+"""
+Benchmark response and cache serialization on a large resume + JD.
+
+Responses: FastAPI's default path (jsonable_encoder + json.dumps) vs
+FastJSONResponse (pydantic_core.to_json) for the /tailor/pdf JSON body.
+Cache payloads: model_dump_json / model_validate_json strings vs the
+compressed encode_model / decode_model payloads in services/serialization.py.
+
+Usage:
+    python benchmarks/bench_serialization.py [--entries 12] [--bullets 8] [--runs 200]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder
+
+from bench_tailor_data_path import BULLET, large_resume
+from models.job_models import JobDescription
+from models.resume_models import Resume
+from services.serialization import FastJSONResponse, decode_model, encode_model
+
+
+def _median(fn, runs: int) -> float:
+    fn()  # warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _row(label: str, elapsed: float, size: int):
+    print(f"{label:<34} {elapsed * 1000:8.3f} ms {size / 1024:9.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=12, help="Entries per section")
+    parser.add_argument("--bullets", type=int, default=8, help="Bullets per entry")
+    parser.add_argument("--runs", type=int, default=200, help="Timed runs per path")
+    args = parser.parse_args()
+
+    resume = large_resume(args.entries, args.bullets)
+    jd = JobDescription(title="Platform Engineer", must_have_skills=["Kubernetes"] * 20, raw_text=BULLET * 30)
+    body = {"resume_id": "x" * 22, "session_id": "x" * 22, "resume": resume, "job_description": jd}
+    fast_body = dict(body, job_description=jd.model_dump(mode="json", exclude={"raw_text"}))
+
+    print("=" * 60)
+    print("Response body")
+    print("=" * 60)
+    default = lambda: json.dumps(jsonable_encoder(body), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    fast = lambda: FastJSONResponse(fast_body).body
+    _row("jsonable_encoder + json.dumps", _median(default, args.runs), len(default()))
+    _row("FastJSONResponse (no raw_text)", _median(fast, args.runs), len(fast()))
+
+    print("=" * 60)
+    print("Cache payload (encode + decode)")
+    print("=" * 60)
+    as_json = lambda: Resume.model_validate_json(resume.model_dump_json())
+    as_payload = lambda: decode_model(encode_model(resume), Resume)
+    _row("model_dump_json / validate_json", _median(as_json, args.runs), len(resume.model_dump_json()))
+    _row("encode_model / decode_model", _median(as_payload, args.runs), len(encode_model(resume)))
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
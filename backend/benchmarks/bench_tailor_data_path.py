@@ -0,0 +1,144 @@
+"""
+Benchmark the data handling around the tailoring LLM call on a large resume:
+the previous path (json.loads(model_dump_json()) for resume and JD, deep
+copies of three section lists, json.loads + model_validate of the response)
+vs the current one in tailor_engine (model_dump(mode="json"), shallow
+snapshots, Resume.model_validate_json straight from the response string).
+
+The LLM response is stood in for by the resume's own JSON, so no API key is
+needed. Reports median latency per path and per step (snapshot, serialize,
+validate) and peak traced allocations per path.
+
+Usage:
+    python benchmarks/bench_tailor_data_path.py [--entries 12] [--bullets 8] [--runs 200]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from models.job_models import JobDescription
+from models.resume_models import Experience, Leadership, Project, Resume
+
+BULLET = (
+    "Led a cross-functional team of 8 engineers to migrate 40+ legacy services to Kubernetes, "
+    "cutting infrastructure cost by 35% and raising deployment frequency from weekly to daily releases"
+)
+
+
+def large_resume(entries: int, bullets: int) -> Resume:
+    dated = {"start_date": "Jan 2020", "end_date": "Present", "location": "Austin, TX"}
+    return Resume(
+        name="Jane Doe",
+        skills=[f"Skill {i}" for i in range(40)],
+        experience=[
+            Experience(company=f"Company {i}", title="Engineer", bullets=[BULLET] * bullets, **dated)
+            for i in range(entries)
+        ],
+        projects=[Project(name=f"Project {i}", role="Lead", bullets=[BULLET] * bullets) for i in range(entries)],
+        leadership=[
+            Leadership(organization=f"Club {i}", role="President", bullets=[BULLET] * bullets, **dated)
+            for i in range(entries)
+        ],
+    )
+
+
+def legacy_snapshot(resume: Resume, jd: JobDescription, response: str):
+    return (
+        [exp.model_copy(deep=True) for exp in resume.experience],
+        [proj.model_copy(deep=True) for proj in resume.projects],
+        [lead.model_copy(deep=True) for lead in resume.leadership],
+    )
+
+
+def legacy_serialize(resume: Resume, jd: JobDescription, response: str):
+    return json.loads(resume.model_dump_json()), json.loads(jd.model_dump_json())
+
+
+def legacy_validate(resume: Resume, jd: JobDescription, response: str) -> Resume:
+    return Resume.model_validate(json.loads(response))
+
+
+def current_snapshot(resume: Resume, jd: JobDescription, response: str):
+    return list(resume.experience), list(resume.projects), list(resume.leadership)
+
+
+def current_serialize(resume: Resume, jd: JobDescription, response: str):
+    return resume.model_dump(mode="json"), jd.model_dump(mode="json")
+
+
+def current_validate(resume: Resume, jd: JobDescription, response: str) -> Resume:
+    return Resume.model_validate_json(response)
+
+
+# Path -> its steps, in the order tailor_engine runs them
+PATHS = {
+    "legacy": [("snapshot", legacy_snapshot), ("serialize", legacy_serialize), ("validate", legacy_validate)],
+    "current": [("snapshot", current_snapshot), ("serialize", current_serialize), ("validate", current_validate)],
+}
+
+
+def _run_path(steps, resume, jd, response, timings: Dict[str, List[float]]) -> list:
+    # Step outputs stay alive until the path ends, as the snapshots do in tailor_engine
+    outputs = []
+    for name, step in steps:
+        start = time.perf_counter()
+        outputs.append(step(resume, jd, response))
+        timings[name].append(time.perf_counter() - start)
+    return outputs
+
+
+def _measure(steps, resume, jd, response, runs: int) -> Tuple[Dict[str, float], int]:
+    """Median seconds per step (plus "total") and peak traced allocations of the whole path."""
+    timings: Dict[str, List[float]] = {name: [] for name, _ in steps}
+    for _ in range(runs):
+        _run_path(steps, resume, jd, response, timings)
+    medians = {name: statistics.median(values) for name, values in timings.items()}
+    medians["total"] = statistics.median(sum(run) for run in zip(*timings.values()))
+
+    tracemalloc.start()
+    _run_path(steps, resume, jd, response, {name: [] for name, _ in steps})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return medians, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=12, help="Entries per section")
+    parser.add_argument("--bullets", type=int, default=8, help="Bullets per entry")
+    parser.add_argument("--runs", type=int, default=200, help="Timed runs per path")
+    args = parser.parse_args()
+
+    resume = large_resume(args.entries, args.bullets)
+    jd = JobDescription(title="Platform Engineer", must_have_skills=["Kubernetes"] * 20, raw_text=BULLET * 30)
+    response = resume.model_dump_json()
+
+    print("=" * 64)
+    print(f"Tailor data path: {args.entries * 3} entries, {args.entries * 3 * args.bullets} bullets, "
+          f"{len(response) / 1024:.0f} KiB response")
+    print("=" * 64)
+    results = {}
+    for label, steps in PATHS.items():
+        _run_path(steps, resume, jd, response, {name: [] for name, _ in steps})  # warm-up
+        results[label] = _measure(steps, resume, jd, response, args.runs)
+        medians, peak = results[label]
+        print(f"{label:<8} {medians['total'] * 1000:8.2f} ms   peak alloc {peak / 1024:8.0f} KiB")
+        for name, _ in steps:
+            print(f"  {name:<10} {medians[name] * 1000:8.2f} ms")
+    print("-" * 64)
+    print(f"speedup {results['legacy'][0]['total'] / results['current'][0]['total']:.1f}x, "
+          f"peak alloc {results['current'][1] / results['legacy'][1]:.0%} of legacy")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,7 @@ def main():
 
     # Parse & tailor
     jd = parse_job_description(jd_text)
-    tailored_resume = tailor_resume(resume, jd)
+    tailored_resume, _ = tailor_resume(resume, jd)
 
     # Print JSON
     print("\n=== Tailored Resume JSON ===\n")
@@ -4,6 +4,60 @@ from typing import Optional
 class Settings(BaseSettings):
     openai_api_key: Optional[str] = None  # we'll use this later
 
+    # PDF text extraction backend: "auto", "pdfplumber", "pypdf" or "pdfminer"
+    pdf_extract_backend: str = "auto"
+    # Worker processes for page-parallel extraction of long PDFs (0 = min(4, CPU count))
+    pdf_extract_workers: int = 0
+    # Largest resume PDF accepted by the upload endpoints
+    max_upload_mb: int = 10
+    # Parsed resumes kept in memory by upload content hash (0 disables the cache)
+    resume_cache_size: int = 256
+    # Resume parsing: "sections" (local segmentation + parallel per-section LLM calls,
+    # falling back to "single" when segmentation is unreliable) or "single" (one big call)
+    resume_parse_strategy: str = "sections"
+    # Attach the structured Resume JSON to every rendered PDF for zero-cost re-uploads
+    embed_resume_json: bool = True
+    # Start pdflatex from a precompiled format of the static template preamble
+    latex_precompiled_format: bool = True
+    # Where precompiled LaTeX formats are stored (empty = system temp directory)
+    latex_format_dir: str = ""
+    # PDF renderer: "latex" (pdflatex, needs TeX Live) or "native" (pure Python, no TeX);
+    # the PDF endpoints also accept a per-request "renderer" form field
+    pdf_render_backend: str = "latex"
+    # Tailored resumes kept in memory for GET /api/preview/{resume_id} (0 disables)
+    preview_store_size: int = 256
+    # Concurrent pdflatex compiles (0 = CPU count)
+    latex_workers: int = 0
+    # Renders allowed to wait for a compile slot before the API answers 503
+    latex_max_queue: int = 16
+    # Parent of the reusable compile directories (empty = /dev/shm if writable, else temp dir)
+    latex_workdir_root: str = ""
+    # Seconds before a single pdflatex pass is killed
+    latex_compile_timeout: int = 60
+    # Development only: re-read Jinja templates from disk on every render
+    template_hot_reload: bool = False
+    # Rendered PDFs cached on disk by resume content + template version (0 disables)
+    pdf_cache_max_mb: int = 200
+    # Where rendered PDFs are cached (empty = system temp directory)
+    pdf_cache_dir: str = ""
+    # Tighten spacing/font size locally (measured renders) until resumes fit on one page
+    fit_one_page: bool = True
+    # Renders the one-page fit solver may spend per resume
+    fit_max_renders: int = 6
+    # Editing sessions kept in memory for PATCH /api/sessions/{id} (0 disables)
+    edit_session_store_size: int = 256
+    # Minutes an editing session survives without being used
+    edit_session_ttl_minutes: int = 120
+    # Keep parsed resumes, JDs and tailored variants in a local SQLite history
+    history_enabled: bool = True
+    # SQLite history database file (empty = system temp directory)
+    history_db_path: str = ""
+    # Drop history rows (and unused owner tokens) older than this (0 = keep forever)
+    history_max_age_days: int = 90
+    # After startup, import the OpenAI client, pdfplumber and compile templates in the
+    # background so the first real request does not pay for them (/health is served at once)
+    warm_up_on_start: bool = True
+
     model_config = {
         "env_file": ".env"
     }
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, PrivateAttr
+from typing import Any, List, Optional
 
 
 class Contact(BaseModel):
@@ -98,4 +98,9 @@ class Resume(BaseModel):
     additional_info: Optional[AdditionalInfo] = None
     
     # Formatting control
-    compact_mode: bool = False  # If True, use minimal spacing to fit on one page
\ No newline at end of file
+    compact_mode: bool = False  # If True, use minimal spacing to fit on one page
+    # 0 = template spacing/font size, 1 = tightest; set by services/fit_solver.py
+    layout_tightness: float = 0.0
+
+    # (content snapshot, ResumeStats) memo for services/resume_stats.py; not serialized
+    _stats: Optional[Any] = PrivateAttr(default=None)
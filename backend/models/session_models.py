@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Literal, Optional
+
+from models.job_models import JobDescription
+from models.resume_models import Resume
+
+
+BulletSection = Literal["experience", "projects", "leadership", "volunteer_work"]
+
+
+class EditSession(BaseModel):
+    session_id: str
+    resume: Resume                    # current tailored state
+    job_description: JobDescription
+    domain: Optional[Dict[str, Any]] = None  # detect_domain result, filled on the first re-tailor
+    renderer: Optional[str] = None    # PDF backend the session was tailored for
+    updated_at: float = 0.0
+
+
+class BulletEdit(BaseModel):
+    section: BulletSection
+    # Index into the section, e.g. experience[entry]; None = every entry of the section (retailor only)
+    entry: Optional[int] = None
+    bullet: Optional[int] = None      # index into its bullets; None = every bullet of the entry
+    text: Optional[str] = None        # replacement text (single bullet only)
+    retailor: bool = False            # re-tailor to the JD with the LLM instead
+
+
+class SessionPatch(BaseModel):
+    bullets: List[BulletEdit] = []
+    # Set to replace; send null to remove. Omitted fields are left alone.
+    headline: Optional[str] = None
+    summary: Optional[str] = None
+    skills: Optional[List[str]] = None
+    output: str = "json"              # "json" or "pdf"
+    renderer: Optional[str] = None    # PDF backend for output=pdf (defaults to the session's)
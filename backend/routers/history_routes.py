@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Header, HTTPException
+
+from services.edit_sessions import create_session
+from services.history_store import (
+    OWNER_HEADER,
+    is_owner_token,
+    issue_owner_token,
+    list_owner_resumes,
+    list_tailored_variants,
+    load_resume,
+    load_variant_by_id,
+)
+from services.html_preview import store_preview_resume
+from services.serialization import FastJSONResponse
+
+router = APIRouter(tags=["History"])
+
+
+def _require_owner(owner: str) -> str:
+    if not is_owner_token(owner):
+        raise HTTPException(status_code=403, detail=f"Unknown {OWNER_HEADER} token; get one from POST /api/history/owners.")
+    return owner
+
+
+@router.post("/history/owners")
+def create_owner():
+    """
+    Issue an owner token. Pass it as the owner form field of /tailor/pdf to
+    record uploads under it, and in the X-History-Owner header to read them back.
+    """
+    owner = issue_owner_token()
+    if owner is None:
+        raise HTTPException(status_code=503, detail="The history is disabled or unavailable.")
+    return FastJSONResponse({"owner": owner})
+
+
+@router.get("/history/resumes")
+def list_resumes(owner: str = Header(..., alias=OWNER_HEADER)):
+    """Resumes uploaded under this owner token, most recently used first."""
+    owner = _require_owner(owner)
+    return FastJSONResponse({"resumes": list_owner_resumes(owner)})
+
+
+@router.get("/history/resumes/{content_hash}")
+def get_resume_history(content_hash: str, owner: str = Header(..., alias=OWNER_HEADER)):
+    """One of this owner's parsed resumes and every variant tailored from it (newest first)."""
+    resume = load_resume(content_hash, _require_owner(owner))
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume not found in the history.")
+    return FastJSONResponse({
+        "content_hash": content_hash,
+        "resume": resume,
+        "variants": list_tailored_variants(content_hash),
+    })
+
+
+@router.get("/history/variants/{resume_id}")
+def get_tailored_variant(resume_id: str, owner: str = Header(..., alias=OWNER_HEADER)):
+    """
+    A resume previously tailored from one of this owner's uploads, by
+    resume_id, in the same shape as the /tailor/pdf JSON response (with
+    fresh preview and editing session ids).
+    """
+    variant = load_variant_by_id(resume_id, _require_owner(owner))
+    if variant is None:
+        raise HTTPException(status_code=404, detail="Tailored resume not found in the history.")
+    tailored_resume, jd = variant["resume"], variant["job_description"]
+    return FastJSONResponse({
+        "resume_id": store_preview_resume(tailored_resume),
+        "session_id": create_session(tailored_resume, jd, None),
+        "resume": tailored_resume,
+        "job_description": jd.model_dump(mode="json", exclude={"raw_text"}),
+        "compatibility": variant["compatibility"],
+    })
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException, Request
+
+from models.resume_models import Resume
+from services.html_preview import get_preview_resume, html_preview_response
+
+router = APIRouter(tags=["Preview"])
+
+
+@router.post("/preview/html")
+def preview_resume_html(resume: Resume, request: Request):
+    """
+    Render a Resume to HTML for an instant on-page preview.
+    Send the previous ETag in If-None-Match to get a 304 when nothing changed.
+    """
+    return html_preview_response(request, resume)
+
+
+@router.get("/preview/{resume_id}")
+def preview_stored_resume(resume_id: str, request: Request):
+    """
+    HTML preview of a tailored resume by the resume_id returned from /tailor/pdf.
+    Supports If-None-Match / ETag conditional requests.
+    """
+    resume = get_preview_resume(resume_id)
+    if resume is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume preview not found. It may have expired; tailor the resume again.",
+        )
+    return html_preview_response(request, resume)
@@ -1,11 +1,18 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import StreamingResponse
-from openai import AuthenticationError
+from typing import Optional
+
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 
 from core.config import settings
-from services.pdf_resume_parser import parse_pdf_resume_to_json
-from services.pdf_writer import render_resume_pdf
+from services.resume_cache import CACHE_HEADER, parse_pdf_resume_cached
+from services.fit_solver import estimate_fit, fit_to_one_page
+from services.latex_pool import RenderQueueFull
+from services.llm_client import LLMAuthenticationError
+from services.metrics import record_error
+from services.pdf_cache import rendered_pdf_response
+from services.pdf_writer import resolve_render_backend
 from services.reformat_engine import reformat_resume
+from services.server_timing import mark_stage
+from services.upload_handler import open_pdf_upload
 
 router = APIRouter(tags=["Reformatter"])
 
@@ -13,22 +20,24 @@ router = APIRouter(tags=["Reformatter"])
 @router.post("/reformat/pdf")
 async def reformat_resume_from_pdf(
     pdf: UploadFile = File(...),
+    renderer: Optional[str] = Form(None),
 ):
     """
     Upload a resume PDF and get a reformatted, ATS-friendly PDF back.
     No JD input and no bullet rewriting.
+    renderer optionally picks the PDF backend ("latex" or "native").
     """
     try:
         settings.validate_api_key()
+        render_backend = resolve_render_backend(renderer)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    temp_path = f"/tmp/{pdf.filename}"
-    with open(temp_path, "wb") as f:
-        f.write(await pdf.read())
-
     try:
-        resume = parse_pdf_resume_to_json(temp_path)
+        pdf_file = open_pdf_upload(pdf)
+        mark_stage("upload")
+
+        resume, _, cache_status = parse_pdf_resume_cached(pdf_file)
 
         # Normalize skills from computer/technical skills strings into list
         if getattr(resume.additional_info, "computer_skills", None):
@@ -47,25 +56,37 @@ async def reformat_resume_from_pdf(
                 resume.skills = parsed_skills
 
         reformatted = reformat_resume(resume)
-        pdf_bytes = render_resume_pdf(reformatted)
+        # Start the measured fit from the page-estimate tightness
+        estimate_fit(reformatted)
+        await fit_to_one_page(reformatted, render_backend)
 
-        return StreamingResponse(
-            iter([pdf_bytes]),
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": 'attachment; filename="ats_resume.pdf"'
-            },
+        # Served from the rendered-PDF cache when this exact resume was rendered before
+        return await rendered_pdf_response(
+            reformatted,
+            "ats_resume.pdf",
+            headers={CACHE_HEADER: cache_status},
+            backend=render_backend,
         )
-    except AuthenticationError as e:
+    except RenderQueueFull as e:
+        record_error(e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except LLMAuthenticationError as e:
+        record_error(e)
         raise HTTPException(
             status_code=401,
             detail=f"OpenAI API authentication failed. Please check your API key in the .env file.\n"
                    f"Error: {str(e)}\n"
                    f"Get your API key from: https://platform.openai.com/account/api-keys"
         )
+    except HTTPException:
+        # Upload validation (413/415) keeps its status
+        raise
     except Exception as e:
+        record_error(e)
         raise HTTPException(
             status_code=500,
             detail=f"An error occurred while processing your request: {str(e)}"
         )
+    finally:
+        await pdf.close()
 
@@ -0,0 +1,97 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+
+from models.session_models import SessionPatch
+from services.edit_sessions import apply_patch, get_session, patch_lock, save_session
+from services.fit_solver import estimate_fit, fit_to_one_page
+from services.html_preview import store_preview_resume
+from services.latex_pool import RenderQueueFull
+from services.llm_client import LLMAuthenticationError, LLMRewriteError
+from services.metrics import record_error
+from services.pdf_cache import rendered_pdf_response
+from services.pdf_writer import resolve_render_backend
+from services.serialization import FastJSONResponse
+
+router = APIRouter(tags=["Editing Sessions"])
+
+SESSION_NOT_FOUND = "Editing session not found. It may have expired; tailor the resume again."
+
+
+@router.get("/sessions/{session_id}")
+def get_editing_session(session_id: str):
+    """Current state of an editing session opened by /tailor/pdf."""
+    session = get_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=SESSION_NOT_FOUND)
+    return FastJSONResponse({
+        "session_id": session.session_id,
+        "resume_id": store_preview_resume(session.resume),
+        "resume": session.resume,
+        "job_description": session.job_description.model_dump(mode="json", exclude={"raw_text"}),
+    })
+
+
+@router.patch("/sessions/{session_id}")
+async def patch_editing_session(session_id: str, patch: SessionPatch):
+    """
+    Edit or re-tailor parts of a tailored resume without re-running the pipeline:
+    - bullets: replace a bullet's text, or retailor=true to rewrite one bullet
+      (or every bullet of an entry when bullet is omitted, or of the whole
+      section when entry is omitted too) toward the JD
+    - headline / summary / skills: replace (null removes headline/summary)
+    Only re-tailored bullets reach the LLM. Returns the updated resume JSON
+    (with the changed field paths) or, with output="pdf", the re-rendered PDF.
+    """
+    # Concurrent PATCHes of one session run one after the other, each on the previous result
+    async with patch_lock(session_id):
+        session = get_session(session_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail=SESSION_NOT_FOUND)
+
+        try:
+            render_backend = resolve_render_backend(patch.renderer or session.renderer)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        try:
+            # Re-tailoring is a blocking LLM call; keep it off the event loop
+            changed = await asyncio.to_thread(apply_patch, session, patch)
+            if changed:
+                estimate_fit(session.resume)
+            if patch.output.lower() == "pdf":
+                await fit_to_one_page(session.resume, render_backend)
+            save_session(session)
+
+            if patch.output.lower() == "pdf":
+                return await rendered_pdf_response(session.resume, "tailored_resume.pdf", backend=render_backend)
+
+            return FastJSONResponse({
+                "session_id": session.session_id,
+                "resume_id": store_preview_resume(session.resume),
+                "resume": session.resume,
+                "changed": changed,
+            })
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except RenderQueueFull as e:
+            record_error(e)
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        except LLMAuthenticationError as e:
+            record_error(e)
+            raise HTTPException(
+                status_code=401,
+                detail=f"OpenAI API authentication failed. Please check your API key in the .env file.\n"
+                       f"Error: {str(e)}\n"
+                       f"Get your API key from: https://platform.openai.com/account/api-keys"
+            )
+        except LLMRewriteError as e:
+            # Nothing was saved: the session is unchanged and the patch can be retried
+            record_error(e)
+            raise HTTPException(status_code=502, detail=str(e))
+        except Exception as e:
+            record_error(e)
+            raise HTTPException(
+                status_code=500,
+                detail=f"An error occurred while processing your request: {str(e)}"
+            )
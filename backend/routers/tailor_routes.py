@@ -1,14 +1,30 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from services.pdf_resume_parser import parse_pdf_resume_to_json
-from services.job_parser import parse_job_description_from_text
+from services.resume_cache import CACHE_HEADER, parse_pdf_resume_cached
+from services.job_parser import parse_job_description_cached
+from services.history_store import (
+    HISTORY_HEADER,
+    HISTORY_HIT,
+    HISTORY_MISS,
+    is_owner_token,
+    load_tailored_variant,
+    save_tailored_variant,
+)
 from services.tailor_engine import tailor_resume
 from services.keyword_extractor import extract_skills_and_keywords
-from services.pdf_writer import render_resume_pdf
-from fastapi.responses import StreamingResponse
-from openai import AuthenticationError
+from services.latex_pool import RenderQueueFull
+from services.llm_client import LLMAuthenticationError
+from services.metrics import record_error
+from services.fit_solver import estimate_fit, fit_to_one_page
+from services.edit_sessions import create_session
+from services.html_preview import store_preview_resume
+from services.pdf_cache import rendered_pdf_response
+from services.pdf_writer import resolve_render_backend
+from services.serialization import FastJSONResponse
+from services.server_timing import mark_stage, request_timings
+from services.upload_handler import open_pdf_upload
 from core.config import settings
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 router = APIRouter(tags=["Tailoring"])
 
@@ -105,13 +121,24 @@ async def tailor_resume_from_pdf(
     pdf: UploadFile = File(...),
     jd_text: str = Form(...),
     output: str = Form("json"),
+    renderer: Optional[str] = Form(None),
+    owner: Optional[str] = Form(None),
+    timings: bool = Form(False),
 ):
     """
     Upload:
     - Resume PDF
     - JD text
+    - Optional renderer for output=pdf ("latex" or "native")
+    - Optional owner token from POST /api/history/owners, to list this resume
+      later under GET /api/history/resumes
+    - Optional timings=true to add the per-stage "timings" (ms) to the JSON
+      (every response carries them in the Server-Timing header)
     Returns:
-    - Tailored resume JSON
+    - Tailored resume JSON (with a resume_id for the HTML preview endpoint
+      and a session_id for incremental edits)
+    A resume + JD pair tailored before (same PDF, same JD text, same prompts)
+    is served from the history without any LLM call (X-Tailor-History: HIT).
     """
     
     # Validate API key before processing
@@ -123,14 +150,21 @@ async def tailor_resume_from_pdf(
             detail=str(e)
         )
 
-    # Save PDF to /tmp
-    temp_path = f"/tmp/{pdf.filename}"
-    with open(temp_path, "wb") as f:
-        f.write(await pdf.read())
+    try:
+        render_backend = resolve_render_backend(renderer)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if owner and not is_owner_token(owner):
+        raise HTTPException(status_code=403, detail="Unknown owner token; get one from POST /api/history/owners.")
 
     try:
-        # 1) PDF -> Resume Object
-        resume = parse_pdf_resume_to_json(temp_path)
+        # Validate the upload and read it straight from its spooled buffer
+        pdf_file = open_pdf_upload(pdf)
+        mark_stage("upload")
+
+        # 1) PDF -> Resume Object (served from cache for repeat uploads of the same PDF)
+        resume, resume_hash, cache_status = parse_pdf_resume_cached(pdf_file, owner)
 
         # Parse any dedicated skills line and MERGE with extracted skills (do not overwrite).
         line_skills: List[str] = []
@@ -141,8 +175,8 @@ async def tailor_resume_from_pdf(
 
         resume.skills = _merge_and_dedupe_skills(resume.skills or [], line_skills)
 
-        # 2) JD text -> JobDescription
-        jd = parse_job_description_from_text(jd_text)
+        # 2) JD text -> JobDescription (reused from the history for a JD parsed before)
+        jd, jd_hash = parse_job_description_cached(jd_text)
 
         # 2b) Extract skills from JD and add to resume if they appear in the resume text
         # This helps identify skills that were mentioned in experience but not explicitly listed.
@@ -156,38 +190,74 @@ async def tailor_resume_from_pdf(
         # Skills should be extracted from the resume itself during parsing.
         # The JD skills are used for tailoring/emphasis, not for adding new skills.
 
-        # 3) Tailor
-        tailored_resume = tailor_resume(resume, jd)
+        # 3) Tailor, unless this upload was already tailored to this JD with the current prompts
+        tailored_resume = load_tailored_variant(resume_hash, jd_hash, render_backend)
+        history_status = HISTORY_HIT
+        rewritten = True
+        if tailored_resume is None:
+            history_status = HISTORY_MISS
+            tailored_resume, rewritten = tailor_resume(resume, jd)
+            # 3a) Pick spacing/font size from the page estimate (no renders)
+            estimate_fit(tailored_resume)
 
-        # 3b) Compatibility report
+        # 3b) PDF output: tune spacing/font size by measured renders until it fits one page
+        fit = {"renders": 0}
+        if output.lower() == "pdf":
+            fit = await fit_to_one_page(tailored_resume, render_backend)
+
+        # 3c) Compatibility report
         jd_data = jd.model_dump()
         compatibility = _compute_compatibility(tailored_resume.skills or [], jd_data)
+        # A measured fit replaces the estimated layout in the history. An
+        # untailored fallback (rewrite failed validation) is never stored, so
+        # the next request retries the rewrite instead of hitting it.
+        if rewritten and (history_status == HISTORY_MISS or fit["renders"]):
+            save_tailored_variant(resume_hash, jd_hash, render_backend, tailored_resume, compatibility)
+        headers = {CACHE_HEADER: cache_status, HISTORY_HEADER: history_status}
 
         # 4) Output mode
         if output.lower() == "pdf":
-            pdf_bytes = render_resume_pdf(tailored_resume)
-            return StreamingResponse(
-                iter([pdf_bytes]),
-                media_type="application/pdf",
-                headers={
-                    "Content-Disposition": 'attachment; filename="tailored_resume.pdf"'
-                },
+            # Served from the rendered-PDF cache when this exact resume was rendered before
+            return await rendered_pdf_response(
+                tailored_resume,
+                "tailored_resume.pdf",
+                headers=headers,
+                backend=render_backend,
             )
 
-        return {
+        body = {
+            # Lets the results page show GET /api/preview/{resume_id} right away
+            "resume_id": store_preview_resume(tailored_resume),
+            # PATCH /api/sessions/{session_id} edits or re-tailors single bullets
+            "session_id": create_session(tailored_resume, jd, render_backend),
             "resume": tailored_resume,
-            "job_description": jd,
+            # The client sent the JD text; echoing raw_text back only bloats the response
+            "job_description": jd.model_dump(mode="json", exclude={"raw_text"}),
             "compatibility": compatibility,
         }
-    except AuthenticationError as e:
+        if timings:
+            body["timings"] = request_timings()
+        # Serialized in one pass by pydantic-core (no jsonable_encoder walk)
+        return FastJSONResponse(body, headers=headers)
+    except RenderQueueFull as e:
+        record_error(e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except LLMAuthenticationError as e:
+        record_error(e)
         raise HTTPException(
             status_code=401,
             detail=f"OpenAI API authentication failed. Please check your API key in the .env file.\n"
                    f"Error: {str(e)}\n"
                    f"Get your API key from: https://platform.openai.com/account/api-keys"
         )
+    except HTTPException:
+        # Upload validation (413/415) keeps its status
+        raise
     except Exception as e:
+        record_error(e)
         raise HTTPException(
             status_code=500,
             detail=f"An error occurred while processing your request: {str(e)}"
-        )
\ No newline at end of file
+        )
+    finally:
+        await pdf.close()
\ No newline at end of file
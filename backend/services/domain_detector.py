@@ -111,9 +111,10 @@ Return ONLY valid JSON. No markdown, no explanations.
 
     try:
         # Lazy import to avoid circular dependency
-        from services.llm_client import client
+        from services.llm_client import chat_completion
         
-        response = client.chat.completions.create(
+        response = chat_completion(
+            "domain",
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0,
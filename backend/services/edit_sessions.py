@@ -0,0 +1,174 @@
+"""
+Server-side editing sessions for tailored resumes.
+
+/tailor/pdf opens a session holding the tailored Resume and the parsed
+JobDescription. PATCH /api/sessions/{session_id} then edits or re-tailors
+individual bullets (or all bullets of one entry, or of a whole section), the
+headline, summary or skills: only the bullets marked for re-tailoring go to
+the LLM, in one small call, and nothing is re-uploaded or re-parsed. The JD's domain is detected on
+the first re-tailor and kept in the session, so opening a session (also for
+a variant served from the history) costs no LLM call.
+
+Sessions live in an in-memory LRU (EDIT_SESSION_STORE_SIZE) and expire
+EDIT_SESSION_TTL_MINUTES after their last use. Like the other caches they
+are stored as encode_model payloads, so every request works on its own copy;
+PATCHes of one session hold its patch_lock from load to save, so concurrent
+edits apply one after the other instead of the last save dropping the rest.
+"""
+import asyncio
+import secrets
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+from core.config import settings
+from models.job_models import JobDescription
+from models.resume_models import Resume
+from models.session_models import BulletEdit, EditSession, SessionPatch
+from services.llm_client import get_domain_info, retailor_bullets
+from services.serialization import decode_model, encode_model
+
+
+# session_id -> EditSession payload, most recently used last
+_sessions: "OrderedDict[str, bytes]" = OrderedDict()
+_sessions_lock = threading.Lock()
+# session_id -> lock serializing its PATCHes; an entry disappears once no
+# request holds or waits on it. Only used from the event loop thread.
+_patch_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _expired(session: EditSession) -> bool:
+    return time.time() - session.updated_at > settings.edit_session_ttl_minutes * 60
+
+
+def save_session(session: EditSession) -> None:
+    if settings.edit_session_store_size <= 0:
+        return
+    session.updated_at = time.time()
+    payload = encode_model(session)
+    with _sessions_lock:
+        _sessions[session.session_id] = payload
+        _sessions.move_to_end(session.session_id)
+        while len(_sessions) > settings.edit_session_store_size:
+            _sessions.popitem(last=False)
+
+
+def create_session(resume: Resume, jd: JobDescription, renderer: Optional[str] = None) -> str:
+    """Open an editing session for a freshly tailored resume; returns its id."""
+    session = EditSession(
+        session_id=secrets.token_urlsafe(16),
+        resume=resume,
+        job_description=jd,
+        renderer=renderer,
+    )
+    save_session(session)
+    return session.session_id
+
+
+def patch_lock(session_id: str) -> asyncio.Lock:
+    """The lock a PATCH holds from get_session to save_session."""
+    lock = _patch_locks.get(session_id)
+    if lock is None:
+        lock = _patch_locks[session_id] = asyncio.Lock()
+    return lock
+
+
+def get_session(session_id: str) -> Optional[EditSession]:
+    with _sessions_lock:
+        payload = _sessions.get(session_id)
+        if payload is None:
+            return None
+        _sessions.move_to_end(session_id)
+    session = decode_model(payload, EditSession)
+    if session is None or _expired(session):
+        with _sessions_lock:
+            _sessions.pop(session_id, None)
+        return None
+    return session
+
+
+def _edit_targets(resume: Resume, edit: BulletEdit) -> List[Tuple[int, List[str]]]:
+    """(entry index, that entry's bullets) for every entry the edit touches."""
+    entries = getattr(resume, edit.section)
+    if edit.entry is None:
+        if not edit.retailor or edit.bullet is not None:
+            raise ValueError("Only retailor=true without a bullet index can target a whole section")
+        return [(index, entry.bullets) for index, entry in enumerate(entries)]
+    if not 0 <= edit.entry < len(entries):
+        raise ValueError(f"{edit.section}[{edit.entry}] does not exist")
+    bullets = entries[edit.entry].bullets
+    if edit.bullet is not None and not 0 <= edit.bullet < len(bullets):
+        raise ValueError(f"{edit.section}[{edit.entry}] has no bullet {edit.bullet}")
+    return [(edit.entry, bullets)]
+
+
+def apply_patch(session: EditSession, patch: SessionPatch) -> List[str]:
+    """
+    Apply patch to session.resume in place. Re-tailoring is batched into a
+    single LLM call covering only the requested bullets.
+    Returns the paths of the fields that changed, e.g. "experience[0].bullets[2]".
+    Raises ValueError for edits that point at missing entries or bullets, and
+    for bullets targeted by more than one edit (e.g. a text edit and a
+    re-tailor of the same bullet, where the LLM result would silently win).
+    Re-tailoring failures propagate from retailor_bullets (LLMRewriteError,
+    LLMAuthenticationError) before the session is saved.
+    """
+    resume = session.resume
+    changed: List[str] = []
+
+    # Validate every edit before changing anything
+    to_retailor: List[Tuple[List[str], int, str]] = []
+    targeted: Set[str] = set()
+    for edit in patch.bullets:
+        if not edit.retailor and (edit.bullet is None or not (edit.text or "").strip()):
+            raise ValueError("Bullet edits need a bullet index and non-empty text, or retailor=true")
+        for entry, bullets in _edit_targets(resume, edit):
+            indexes = range(len(bullets)) if edit.bullet is None else [edit.bullet]
+            for index in indexes:
+                path = f"{edit.section}[{entry}].bullets[{index}]"
+                if path in targeted:
+                    raise ValueError(f"{path} is targeted by more than one bullet edit")
+                targeted.add(path)
+                if edit.retailor:
+                    to_retailor.append((bullets, index, path))
+
+    for edit in patch.bullets:
+        if edit.retailor:
+            continue
+        [(_, bullets)] = _edit_targets(resume, edit)
+        text = edit.text.strip()
+        if text != bullets[edit.bullet]:
+            bullets[edit.bullet] = text
+            changed.append(f"{edit.section}[{edit.entry}].bullets[{edit.bullet}]")
+
+    if to_retailor:
+        job_json = session.job_description.model_dump(mode="json")
+        if session.domain is None:
+            session.domain = get_domain_info(job_json)
+        current = [bullets[index] for bullets, index, _ in to_retailor]
+        rewritten = retailor_bullets(
+            current,
+            job_json,
+            session.domain,
+            resume.skills,
+        )
+        for (bullets, index, path), old, new in zip(to_retailor, current, rewritten):
+            if new != old:
+                bullets[index] = new
+                changed.append(path)
+
+    for field in ("headline", "summary", "skills"):
+        if field not in patch.model_fields_set:
+            continue
+        value = getattr(patch, field)
+        if field == "skills":
+            value = [skill.strip() for skill in value or [] if skill and skill.strip()]
+        else:
+            value = (value or "").strip() or None
+        if value != getattr(resume, field):
+            setattr(resume, field, value)
+            changed.append(field)
+
+    return changed
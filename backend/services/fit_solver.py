@@ -0,0 +1,160 @@
+"""
+One-page fit solver: tunes Resume.layout_tightness by measuring real renders.
+
+The resume is first rendered at the tightness estimate_fit picked from the
+font-metric page estimate, then at a few values searched outward from it
+over page_layout's spacing and font-size range. Each PDF is measured for
+its page count and how far down the last page the text reaches. The
+smallest tightness that fits one page wins, so the layout is fixed locally
+in a few fast compiles instead of by asking the LLM to shrink the text
+again. When the estimate is right, that costs one or two renders.
+
+The winning PDF is stored in the rendered-PDF cache, so the download that
+follows is served without another compile. Only requests that return a PDF
+run the solver; JSON responses use estimate_fit, which picks the tightness
+from the font-metric page estimate without compiling anything.
+"""
+import asyncio
+import io
+import time
+from typing import Dict, Optional, Tuple
+
+from core.config import settings
+from models.resume_models import Resume
+from services.latex_pool import RenderQueueFull
+from services.page_estimate import PAGE_TEXT_HEIGHT, estimate_page_height
+from services.page_layout import layout_params
+from services.pdf_cache import get_cached_pdf, pdf_cache_key, store_rendered_pdf
+from services.pdf_native import MARGIN
+from services.pdf_writer import render_resume_pdf_async, resolve_render_backend
+from services.server_timing import add_stage
+
+
+# Stop searching once the interval is this narrow (about 0.03pt of font size)
+MIN_STEP = 1 / 32
+# A fitting layout that already fills this much of the page is good enough
+FULL_PAGE = 0.97
+# First step away from the estimated tightness (doubled until the fit is bracketed)
+FIRST_STEP = 1 / 8
+
+
+def measure_pdf(pdf_bytes: bytes) -> Tuple[int, float]:
+    """Page count and vertical fill of the last page (0..1 of the text area)."""
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        pages = len(pdf.pages)
+        last = pdf.pages[-1]
+        bottom = max((char["bottom"] for char in last.chars), default=MARGIN)
+        fill = (bottom - MARGIN) / (float(last.height) - 2 * MARGIN)
+    return pages, min(max(fill, 0.0), 1.0)
+
+
+def estimate_fit(resume: Resume) -> float:
+    """
+    Set resume.layout_tightness to the loosest layout whose estimated page
+    height (services/page_estimate.py) fits one page, with no renders.
+    Resumes that do not fit even at the tightest layout get tightness 1.
+    """
+    if not settings.fit_one_page:
+        return resume.layout_tightness
+
+    def fits(tightness: float) -> bool:
+        resume.layout_tightness = tightness
+        return estimate_page_height(resume, layout_params(resume)) <= PAGE_TEXT_HEIGHT
+
+    if fits(0.0):
+        return 0.0
+    if not fits(1.0):
+        return 1.0
+    low, high = 0.0, 1.0
+    while high - low > MIN_STEP:
+        mid = (low + high) / 2
+        if fits(mid):
+            high = mid
+        else:
+            low = mid
+    resume.layout_tightness = high
+    return high
+
+
+async def _probe(resume: Resume, tightness: float, backend: str) -> Tuple[bytes, int, float]:
+    resume.layout_tightness = tightness
+    pdf_bytes = await render_resume_pdf_async(resume, backend=backend)
+    pages, fill = await asyncio.to_thread(measure_pdf, pdf_bytes)
+    return pdf_bytes, pages, fill
+
+
+async def fit_to_one_page(
+    resume: Resume,
+    backend: Optional[str] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Set resume.layout_tightness to the loosest layout that fits one page
+    (at most settings.fit_max_renders renders). Resumes that do not fit even
+    at the tightest layout keep tightness 1. Records "fit" (ms) into timings.
+
+    Returns {"tightness", "pages", "fill", "renders"} for the chosen layout;
+    renders is 0 when fitting was skipped (disabled, render error, the
+    compile queue is full, or this exact layout is already in the PDF cache,
+    i.e. it was fitted or served as a PDF before), in which case resume is
+    left unchanged.
+    """
+    report = {"tightness": resume.layout_tightness, "pages": 0, "fill": 0.0, "renders": 0}
+    if not settings.fit_one_page or settings.fit_max_renders <= 0:
+        return report
+
+    backend = resolve_render_backend(backend)
+    if settings.pdf_cache_max_mb > 0 and get_cached_pdf(pdf_cache_key(resume, backend)) is not None:
+        return report
+
+    start = time.perf_counter()
+    original = resume.layout_tightness
+    try:
+        # Start at the tightness estimate_fit chose and search outward from it:
+        # gallop looser while it fits (tighter while it overflows) with doubling
+        # steps until the loosest fit is bracketed, then bisect the bracket.
+        fitting = None      # (tightness, pdf, pages, fill) of the loosest layout seen that fits
+        overflowing = None  # the same for the tightest layout seen that overflows
+        low, high = 0.0, 1.0  # the loosest fitting tightness lies in [low, high]
+        tightness, step = min(max(original, 0.0), 1.0), FIRST_STEP
+        renders = 0
+        while renders < settings.fit_max_renders:
+            pdf_bytes, pages, fill = await _probe(resume, tightness, backend)
+            renders += 1
+            if pages == 1:
+                fitting = (tightness, pdf_bytes, pages, fill)
+                high = tightness
+                if fill >= FULL_PAGE or high <= low:
+                    break
+            else:
+                overflowing = (tightness, pdf_bytes, pages, fill)
+                low = tightness
+                if low >= high:
+                    break  # overflows even at the tightest layout
+            if fitting is None:
+                tightness, step = min(1.0, low + step), step * 2
+            elif overflowing is None:
+                tightness, step = max(0.0, high - step), step * 2
+            elif high - low > MIN_STEP:
+                tightness = (low + high) / 2
+            else:
+                break
+        best = fitting or overflowing
+    except (RuntimeError, RenderQueueFull):
+        # Fitting is an optimisation; the normal render reports real errors
+        resume.layout_tightness = original
+        return report
+    finally:
+        elapsed = time.perf_counter() - start
+        add_stage("fit", elapsed)
+        if timings is not None:
+            timings["fit"] = elapsed * 1000
+
+    tightness, pdf_bytes, pages, fill = best
+    resume.layout_tightness = tightness
+    if settings.pdf_cache_max_mb > 0:
+        store_rendered_pdf(pdf_cache_key(resume, backend), pdf_bytes)
+
+    return {"tightness": tightness, "pages": pages, "fill": round(fill, 3), "renders": renders}
@@ -0,0 +1,34 @@
+"""
+Glyph widths for the standard Times fonts (what the LaTeX template's
+mathptmx package typesets with, and what PDF viewers ship built in).
+
+The AFM widths come from pdfminer.six, which pdfplumber already depends on,
+so no font files or extra packages are needed.
+"""
+from typing import Dict
+
+FONT_REGULAR = "Times-Roman"
+FONT_BOLD = "Times-Bold"
+FONT_ITALIC = "Times-Italic"
+FONT_BOLD_ITALIC = "Times-BoldItalic"
+
+# Width (1/1000 em) used for characters missing from the AFM tables
+DEFAULT_GLYPH_WIDTH = 500
+
+_widths: Dict[str, Dict[str, float]] = {}
+
+
+def glyph_widths(font: str) -> Dict[str, float]:
+    """Character -> width in 1/1000 em for a standard font."""
+    widths = _widths.get(font)
+    if widths is None:
+        from pdfminer.fontmetrics import FONT_METRICS
+
+        widths = _widths[font] = FONT_METRICS[font][1]
+    return widths
+
+
+def text_width(text: str, font: str, size: float) -> float:
+    """Advance width of text in points."""
+    widths = glyph_widths(font)
+    return sum(widths.get(ch, DEFAULT_GLYPH_WIDTH) for ch in text) * size / 1000
@@ -0,0 +1,390 @@
+"""
+Persistent history of parsed resumes, parsed JDs and tailored variants.
+
+A local SQLite database (HISTORY_DB_PATH) keeps everything the expensive
+steps produce, so a returning user gets previous results in milliseconds:
+- parsed_resumes: parsed Resume by upload content hash (SHA-256 of the PDF
+  bytes) + parser version, with resume_owners indexing them by owner token
+- owner_tokens: the owner tokens issued by POST /history/owners; a client
+  can only list or read back resumes it uploaded under its own token
+- job_descriptions: parsed JobDescription by a hash of the normalized JD text
+- tailored_variants: the final tailored Resume (after the one-page fit) by
+  resume hash + JD hash + prompt version
+
+The prompt version hashes the tailoring code and the renderer's layout files
+(like the PDF cache's template version), and the parser version hashes the
+extraction/parsing code and the Resume schema, so editing a prompt, parser or
+template makes older rows unreachable instead of serving stale output.
+Rows older than HISTORY_MAX_AGE_DAYS are deleted, at most once an hour.
+
+Models are stored as encode_model payloads; rows from an older schema decode
+to None and count as misses. Storage errors never fail a request: reads
+return None and writes are dropped.
+"""
+import hashlib
+import json
+import os
+import re
+import secrets
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from core.config import settings
+from models.job_models import JobDescription
+from models.resume_models import Resume
+from services.metrics import record_cache
+from services.pdf_cache import template_version
+from services.pdf_metadata import resume_content_hash
+from services.serialization import decode_model, encode_model
+
+
+HISTORY_HEADER = "X-Tailor-History"
+HISTORY_HIT = "HIT"
+HISTORY_MISS = "MISS"
+# Request header carrying the owner token on the /history routes
+OWNER_HEADER = "X-History-Owner"
+
+# Files whose contents define what tailor_resume produces for a given resume + JD
+_SERVICES_DIR = os.path.dirname(__file__)
+PROMPT_FILES = [
+    os.path.join(_SERVICES_DIR, name)
+    for name in ("tailor_engine.py", "llm_client.py", "domain_prompts.py", "domain_detector.py", "skill_matcher.py")
+]
+# Files whose contents define what parse_pdf_resume produces for a given PDF
+PARSER_FILES = [
+    os.path.join(_SERVICES_DIR, name)
+    for name in (
+        "pdf_resume_parser.py", "section_segmenter.py", "template_parser.py", "pdf_reader.py", "skill_matcher.py",
+    )
+] + [os.path.join(os.path.dirname(_SERVICES_DIR), "models", "resume_models.py")]
+
+_PRUNE_INTERVAL_SECONDS = 3600
+
+SCHEMA = """
+-- Superseded by parsed_resumes, whose rows carry the parser version
+DROP TABLE IF EXISTS resumes;
+CREATE TABLE IF NOT EXISTS parsed_resumes (
+    content_hash TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    name TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, parser_version)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS resume_owners (
+    owner TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (owner, content_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS owner_tokens (
+    token TEXT PRIMARY KEY,
+    created_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS job_descriptions (
+    text_hash TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tailored_variants (
+    resume_hash TEXT NOT NULL,
+    jd_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    resume_id TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    compatibility TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (resume_hash, jd_hash, prompt_version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tailored_variants_resume_id ON tailored_variants (resume_id);
+"""
+
+T = TypeVar("T")
+
+_db: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()
+# File list name ("prompt", "parser") -> hash of those files' contents
+_file_hashes: Dict[str, str] = {}
+_last_prune = 0.0
+
+
+def db_path() -> str:
+    return settings.history_db_path or os.path.join(tempfile.gettempdir(), "resume-history.sqlite3")
+
+
+def _connect() -> sqlite3.Connection:
+    global _db
+    if _db is None:
+        path = db_path()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        _db = db
+    return _db
+
+
+def _prune(db: sqlite3.Connection) -> None:
+    """Delete rows older than HISTORY_MAX_AGE_DAYS, and owner tokens no longer linked to any resume."""
+    cutoff = time.time() - settings.history_max_age_days * 86400
+    for table in ("parsed_resumes", "job_descriptions", "tailored_variants"):
+        db.execute(f"DELETE FROM {table} WHERE created_at < ?", (cutoff,))
+    db.execute("DELETE FROM resume_owners WHERE used_at < ?", (cutoff,))
+    db.execute(
+        "DELETE FROM owner_tokens WHERE created_at < ? AND token NOT IN (SELECT owner FROM resume_owners)",
+        (cutoff,),
+    )
+
+
+def _run(operation: Callable[[sqlite3.Connection], T]) -> Optional[T]:
+    """Run operation on the shared connection; None when history is disabled or SQLite fails."""
+    global _last_prune
+    if not settings.history_enabled:
+        return None
+    with _db_lock:
+        try:
+            db = _connect()
+            now = time.time()
+            if settings.history_max_age_days > 0 and now - _last_prune > _PRUNE_INTERVAL_SECONDS:
+                _last_prune = now
+                with db:
+                    _prune(db)
+            with db:  # one transaction, committed on success
+                return operation(db)
+        except (sqlite3.Error, OSError):
+            return None
+
+
+def normalize_jd_text(text: str) -> str:
+    """JD text with case and whitespace differences removed, so re-pasted JDs hash the same."""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def jd_text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_jd_text(text).encode("utf-8")).hexdigest()
+
+
+def _files_hash(name: str, paths: List[str]) -> str:
+    """Hash of the contents of paths, computed once (or on every call with TEMPLATE_HOT_RELOAD)."""
+    if name not in _file_hashes or settings.template_hot_reload:
+        digest = hashlib.sha256()
+        for path in paths:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        _file_hashes[name] = digest.hexdigest()[:16]
+    return _file_hashes[name]
+
+
+def prompt_version(backend: str) -> str:
+    """Version of the tailoring prompts/code plus the renderer layout the one-page fit ran against."""
+    fit = "fit" if settings.fit_one_page else "nofit"
+    return f"{_files_hash('prompt', PROMPT_FILES)}:{backend}:{template_version(backend)}:{fit}"
+
+
+def parser_version() -> str:
+    """Version of the PDF extraction/parsing code and prompts and of the Resume schema."""
+    return _files_hash("parser", PARSER_FILES)
+
+
+# ---- Owner tokens ----
+
+def issue_owner_token() -> Optional[str]:
+    """A new unguessable owner token, or None when the history is disabled or unavailable."""
+    token = secrets.token_urlsafe(24)
+    stored = _run(lambda db: db.execute(
+        "INSERT INTO owner_tokens (token, created_at) VALUES (?, ?)", (token, time.time())
+    ))
+    return token if stored is not None else None
+
+
+def is_owner_token(token: Optional[str]) -> bool:
+    """Whether token was issued by issue_owner_token."""
+    if not token:
+        return False
+    row = _run(lambda db: db.execute("SELECT 1 FROM owner_tokens WHERE token = ?", (token,)).fetchone())
+    return row is not None
+
+
+# ---- Parsed resumes ----
+
+def save_resume(content_hash: str, resume: Resume, owner: Optional[str] = None) -> None:
+    payload = encode_model(resume)
+    version = parser_version()
+    now = time.time()
+
+    def write(db: sqlite3.Connection) -> None:
+        db.execute(
+            """
+            INSERT OR REPLACE INTO parsed_resumes (content_hash, parser_version, name, payload, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (content_hash, version, resume.name or "", payload, now),
+        )
+        if owner:
+            _link_owner(db, owner, content_hash, now)
+
+    _run(write)
+
+
+def load_resume(content_hash: str, owner: Optional[str] = None) -> Optional[Resume]:
+    """
+    Parsed resume for an upload hash, as parsed by the current parser
+    version. With owner, only a resume linked to that owner is returned.
+    """
+    version = parser_version()
+    if owner is None:
+        row = _run(lambda db: db.execute(
+            "SELECT payload FROM parsed_resumes WHERE content_hash = ? AND parser_version = ?",
+            (content_hash, version),
+        ).fetchone())
+    else:
+        row = _run(lambda db: db.execute(
+            """
+            SELECT r.payload FROM parsed_resumes r
+            JOIN resume_owners o ON o.content_hash = r.content_hash
+            WHERE r.content_hash = ? AND r.parser_version = ? AND o.owner = ?
+            """,
+            (content_hash, version, owner),
+        ).fetchone())
+    payload = row[0] if row else None
+    resume = decode_model(payload, Resume) if payload is not None else None
+    record_cache("history_resume", resume is not None)
+    return resume
+
+
+def link_owner(owner: str, content_hash: str) -> None:
+    _run(lambda db: _link_owner(db, owner, content_hash, time.time()))
+
+
+def _link_owner(db: sqlite3.Connection, owner: str, content_hash: str, now: float) -> None:
+    db.execute(
+        "INSERT OR REPLACE INTO resume_owners (owner, content_hash, used_at) VALUES (?, ?, ?)",
+        (owner, content_hash, now),
+    )
+
+
+def list_owner_resumes(owner: str) -> List[Dict[str, Any]]:
+    """An owner's resumes, most recently used first, with their number of tailored variants."""
+    rows = _run(lambda db: db.execute(
+        """
+        SELECT r.content_hash, r.name, o.used_at,
+               (SELECT COUNT(*) FROM tailored_variants t WHERE t.resume_hash = r.content_hash)
+        FROM resume_owners o JOIN parsed_resumes r ON r.content_hash = o.content_hash
+        WHERE o.owner = ? AND r.parser_version = ?
+        ORDER BY o.used_at DESC
+        """,
+        (owner, parser_version()),
+    ).fetchall()) or []
+    return [
+        {"content_hash": content_hash, "name": name, "used_at": used_at, "variants": variants}
+        for content_hash, name, used_at, variants in rows
+    ]
+
+
+# ---- Parsed job descriptions ----
+
+def save_job_description(text_hash: str, jd: JobDescription) -> None:
+    payload = encode_model(jd)
+    _run(lambda db: db.execute(
+        "INSERT OR REPLACE INTO job_descriptions (text_hash, title, company, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+        (text_hash, jd.title, jd.company, payload, time.time()),
+    ))
+
+
+def load_job_description(text_hash: str) -> Optional[JobDescription]:
+    row = _run(lambda db: db.execute(
+        "SELECT payload FROM job_descriptions WHERE text_hash = ?", (text_hash,)
+    ).fetchone())
+    jd = decode_model(row[0], JobDescription) if row else None
+    record_cache("history_jd", jd is not None)
+    return jd
+
+
+# ---- Tailored variants ----
+
+def save_tailored_variant(
+    resume_hash: str,
+    jd_hash: str,
+    backend: str,
+    tailored: Resume,
+    compatibility: Dict[str, Any],
+) -> str:
+    """Store a tailored resume and return its resume_id (content hash of the tailored resume)."""
+    resume_id = resume_content_hash(tailored)
+    payload = encode_model(tailored)
+    _run(lambda db: db.execute(
+        """
+        INSERT OR REPLACE INTO tailored_variants
+            (resume_hash, jd_hash, prompt_version, resume_id, payload, compatibility, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (resume_hash, jd_hash, prompt_version(backend), resume_id, payload, json.dumps(compatibility), time.time()),
+    ))
+    return resume_id
+
+
+def load_tailored_variant(resume_hash: str, jd_hash: str, backend: str) -> Optional[Resume]:
+    """The resume previously tailored from this upload and JD with the current prompts, or None."""
+    row = _run(lambda db: db.execute(
+        "SELECT payload FROM tailored_variants WHERE resume_hash = ? AND jd_hash = ? AND prompt_version = ?",
+        (resume_hash, jd_hash, prompt_version(backend)),
+    ).fetchone())
+    tailored = decode_model(row[0], Resume) if row else None
+    record_cache("history_tailored", tailored is not None)
+    return tailored
+
+
+def list_tailored_variants(resume_hash: str) -> List[Dict[str, Any]]:
+    """Every variant tailored from an upload, newest first, with its JD title/company and score."""
+    rows = _run(lambda db: db.execute(
+        """
+        SELECT t.resume_id, t.jd_hash, j.title, j.company, t.compatibility, t.created_at
+        FROM tailored_variants t LEFT JOIN job_descriptions j ON j.text_hash = t.jd_hash
+        WHERE t.resume_hash = ?
+        ORDER BY t.created_at DESC
+        """,
+        (resume_hash,),
+    ).fetchall()) or []
+    return [
+        {
+            "resume_id": resume_id,
+            "jd_hash": jd_hash,
+            "title": title,
+            "company": company,
+            "score": json.loads(compatibility).get("score"),
+            "created_at": created_at,
+        }
+        for resume_id, jd_hash, title, company, compatibility, created_at in rows
+    ]
+
+
+def load_variant_by_id(resume_id: str, owner: str) -> Optional[Dict[str, Any]]:
+    """
+    A tailored variant by resume_id, if it was tailored from one of owner's
+    uploads: {"resume", "job_description", "compatibility"}, or None.
+    """
+    row = _run(lambda db: db.execute(
+        """
+        SELECT t.payload, j.payload, t.compatibility
+        FROM tailored_variants t
+        JOIN resume_owners o ON o.content_hash = t.resume_hash
+        LEFT JOIN job_descriptions j ON j.text_hash = t.jd_hash
+        WHERE t.resume_id = ? AND o.owner = ?
+        ORDER BY t.created_at DESC
+        LIMIT 1
+        """,
+        (resume_id, owner),
+    ).fetchone())
+    if row is None or row[1] is None:
+        return None
+    resume = decode_model(row[0], Resume)
+    jd = decode_model(row[1], JobDescription)
+    if resume is None or jd is None:
+        return None
+    return {"resume": resume, "job_description": jd, "compatibility": json.loads(row[2])}
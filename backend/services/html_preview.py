@@ -0,0 +1,121 @@
+"""
+Instant HTML previews of a Resume using templates/resume_template.html.
+
+Rendering the cached Jinja template takes a few milliseconds, so the results
+page can show a tailored resume immediately and only ask for the (LaTeX)
+PDF on download. Responses carry an ETag derived from the resume content
+and template, so unchanged previews revalidate with a bodiless 304.
+
+Tailored resumes are kept in a small in-memory LRU by content hash so the
+frontend can fetch their preview by id (GET /api/preview/{resume_id}).
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+
+from core.config import settings
+from models.resume_models import Resume
+from services.metrics import record_cache, timed
+from services.pdf_metadata import canonical_resume_json, resume_content_hash
+from services.serialization import decode_model, encode_model
+
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "templates")
+HTML_TEMPLATE = "resume_template.html"
+
+# Browsers may reuse a preview but must revalidate it (cheap thanks to the ETag)
+PREVIEW_CACHE_CONTROL = "private, no-cache"
+
+# Jinja environment and compiled template, created on first use (app warm-up)
+_html_env = None
+_html_template = None
+_html_template_version: Optional[str] = None
+
+# resume_id (content hash) -> encode_model payload, most recently used last
+_preview_resumes: "OrderedDict[str, bytes]" = OrderedDict()
+_store_lock = threading.Lock()
+
+
+def _template_version() -> str:
+    global _html_template_version
+    if _html_template_version is None or settings.template_hot_reload:
+        with open(os.path.join(TEMPLATES_DIR, HTML_TEMPLATE), "rb") as f:
+            _html_template_version = hashlib.sha256(f.read()).hexdigest()[:16]
+    return _html_template_version
+
+
+def get_html_template():
+    """The compiled preview template: compiled once unless hot reload is on."""
+    global _html_env, _html_template
+    if _html_env is None:
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+        _html_env = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=settings.template_hot_reload,
+            cache_size=0 if settings.template_hot_reload else 50,
+        )
+    if settings.template_hot_reload:
+        return _html_env.get_template(HTML_TEMPLATE)
+    if _html_template is None:
+        _html_template = _html_env.get_template(HTML_TEMPLATE)
+    return _html_template
+
+
+def render_resume_html(resume: Resume) -> str:
+    template = get_html_template()
+    with timed("template_render_seconds", "template", template="html"):
+        return template.render(resume=resume)
+
+
+def preview_etag(resume: Resume) -> str:
+    digest = hashlib.sha256(canonical_resume_json(resume))
+    digest.update(_template_version().encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison (RFC 9110 13.1.2): ignore W/ prefixes
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def html_preview_response(request: Request, resume: Resume) -> Response:
+    """HTML preview of resume, or 304 when the client's If-None-Match is current."""
+    etag = preview_etag(resume)
+    headers = {"ETag": etag, "Cache-Control": PREVIEW_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(render_resume_html(resume), headers=headers)
+
+
+def store_preview_resume(resume: Resume) -> str:
+    """Keep resume available for GET /api/preview/{resume_id}; returns the id."""
+    resume_id = resume_content_hash(resume)
+    if settings.preview_store_size <= 0:
+        return resume_id
+    payload = encode_model(resume)
+    with _store_lock:
+        _preview_resumes[resume_id] = payload
+        _preview_resumes.move_to_end(resume_id)
+        while len(_preview_resumes) > settings.preview_store_size:
+            _preview_resumes.popitem(last=False)
+    return resume_id
+
+
+def get_preview_resume(resume_id: str) -> Optional[Resume]:
+    with _store_lock:
+        payload = _preview_resumes.get(resume_id)
+        record_cache("preview", payload is not None)
+        if payload is None:
+            return None
+        _preview_resumes.move_to_end(resume_id)
+    return decode_model(payload, Resume)
@@ -1,46 +1,10 @@
 import json
-import re
-from typing import List
-from models.job_models import JobDescription
-from services.llm_client import client
-
-
-NON_SKILL_PATTERNS = [
-    r"\b\d+\s*(\+)?\s*(years|year|yrs)\b",
-    r"\bexperience\b",
-    r"\bdegree\b",
-    r"\bbachelor",
-    r"\bmaster",
-    r"\bph\.?d",
-    r"\bself[-\s]?starter\b",
-    r"\bmotivated\b",
-    r"\bability to\b",
-    r"\bstrong\b",
-    r"\bcustomer service\b",
-    r"\bcommunication\b",
-    r"\binteract with vendors\b",
-    r"\borganized\b",
-]
-
-
-def _filter_concrete_skills(skills: List[str]) -> List[str]:
-    filtered: List[str] = []
-    seen = set()
-
-    for skill in skills:
-        cleaned = skill.strip()
-        if not cleaned:
-            continue
-
-        lowered = cleaned.lower()
-        if any(re.search(pattern, lowered, re.IGNORECASE) for pattern in NON_SKILL_PATTERNS):
-            continue
+from typing import Tuple
 
-        if lowered not in seen:
-            filtered.append(cleaned)
-            seen.add(lowered)
-
-    return filtered
+from models.job_models import JobDescription
+from services.history_store import jd_text_hash, load_job_description, save_job_description
+from services.llm_client import chat_completion
+from services.skill_matcher import filter_concrete_skills
 
 
 def parse_job_description_from_text(text: str) -> JobDescription:
@@ -79,7 +43,8 @@ JOB DESCRIPTION TEXT:
 \"\"\"{text}\"\"\"
 """
 
-    response = client.chat.completions.create(
+    response = chat_completion(
+        "jd_parse",
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}],
         temperature=0,
@@ -105,9 +70,22 @@ JOB DESCRIPTION TEXT:
             + raw[:500]
         ) from e
 
-    parsed["must_have_skills"] = _filter_concrete_skills(parsed.get("must_have_skills", []))
-    parsed["nice_to_have_skills"] = _filter_concrete_skills(parsed.get("nice_to_have_skills", []))
+    parsed["must_have_skills"] = filter_concrete_skills(parsed.get("must_have_skills", []))
+    parsed["nice_to_have_skills"] = filter_concrete_skills(parsed.get("nice_to_have_skills", []))
 
     # Validate against the JobDescription model
     jd_obj = JobDescription.model_validate(parsed)
-    return jd_obj
\ No newline at end of file
+    return jd_obj
+
+
+def parse_job_description_cached(text: str) -> Tuple[JobDescription, str]:
+    """
+    Parse JD text, reusing the stored result when the same JD (ignoring case
+    and whitespace) was parsed before. Returns (jd, jd_hash).
+    """
+    jd_hash = jd_text_hash(text)
+    jd = load_job_description(jd_hash)
+    if jd is None:
+        jd = parse_job_description_from_text(text)
+        save_job_description(jd_hash, jd)
+    return jd, jd_hash
@@ -1,45 +1,7 @@
 from typing import List, Tuple
 import json
-import re
-from services.llm_client import client
-
-
-NON_SKILL_PATTERNS = [
-    r"\b\d+\s*(\+)?\s*(years|year|yrs)\b",
-    r"\bexperience\b",
-    r"\bdegree\b",
-    r"\bbachelor",
-    r"\bmaster",
-    r"\bph\.?d",
-    r"\bself[-\s]?starter\b",
-    r"\bmotivated\b",
-    r"\bability to\b",
-    r"\bstrong\b",
-    r"\bcustomer service\b",
-    r"\bcommunication\b",
-    r"\binteract with vendors\b",
-    r"\borganized\b",
-]
-
-
-def _filter_concrete_skills(skills: List[str]) -> List[str]:
-    filtered: List[str] = []
-    seen = set()
-
-    for skill in skills:
-        cleaned = skill.strip()
-        if not cleaned:
-            continue
-
-        lowered = cleaned.lower()
-        if any(re.search(pattern, lowered, re.IGNORECASE) for pattern in NON_SKILL_PATTERNS):
-            continue
-
-        if lowered not in seen:
-            filtered.append(cleaned)
-            seen.add(lowered)
-
-    return filtered
+from services.llm_client import chat_completion
+from services.skill_matcher import filter_concrete_skills
 
 
 def extract_skills_and_keywords(text: str) -> Tuple[List[str], List[str], List[str]]:
@@ -86,7 +48,8 @@ JOB DESCRIPTION TEXT:
 """
 
     try:
-        response = client.chat.completions.create(
+        response = chat_completion(
+            "keywords",
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0,
@@ -103,8 +66,8 @@ JOB DESCRIPTION TEXT:
 
         parsed = json.loads(raw_content)
         
-        must_have = _filter_concrete_skills(parsed.get("must_have_skills", []))
-        nice_to_have = _filter_concrete_skills(parsed.get("nice_to_have_skills", []))
+        must_have = filter_concrete_skills(parsed.get("must_have_skills", []))
+        nice_to_have = filter_concrete_skills(parsed.get("nice_to_have_skills", []))
         keywords = parsed.get("keywords", [])
         
         return must_have, nice_to_have, keywords
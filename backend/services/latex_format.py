@@ -0,0 +1,144 @@
+"""
+Precompiled pdflatex format for the resume preamble.
+
+Loading the document class and packages in resume_preamble.tex is most of a
+pdflatex run. We dump that state once into a .fmt file and start every
+compile from it (pdflatex -fmt=...), so each run only typesets the resume.
+
+The format name embeds a hash of the preamble and the pdflatex version, so
+editing the preamble or upgrading TeX Live produces a fresh format instead
+of loading a stale or incompatible one. Run `python -m services.latex_format`
+at image build time to have it ready before the first request.
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from typing import Optional
+
+from core.config import settings
+
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "templates")
+PREAMBLE_TEMPLATE = "resume_preamble.tex"
+FORMAT_PREFIX = "resume_preamble-"
+
+_build_lock = threading.Lock()
+# Formats that failed to build or to compile a document; not retried until restart
+_broken_formats = set()
+_pdflatex_version: Optional[str] = None
+
+
+def format_dir() -> str:
+    return settings.latex_format_dir or os.path.join(tempfile.gettempdir(), "resume-latex-formats")
+
+
+def _get_pdflatex_version() -> str:
+    global _pdflatex_version
+    if _pdflatex_version is None:
+        try:
+            result = subprocess.run(["pdflatex", "--version"], capture_output=True, text=True, timeout=10)
+            _pdflatex_version = result.stdout.split("\n", 1)[0]
+        except (OSError, subprocess.SubprocessError):
+            _pdflatex_version = ""
+    return _pdflatex_version
+
+
+def format_name() -> str:
+    """Format (job) name for the current preamble and pdflatex install."""
+    with open(os.path.join(TEMPLATES_DIR, PREAMBLE_TEMPLATE), "rb") as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(_get_pdflatex_version().encode("utf-8"))
+    return FORMAT_PREFIX + digest.hexdigest()[:16]
+
+
+def format_path(name: str) -> str:
+    return os.path.join(format_dir(), name + ".fmt")
+
+
+def build_preamble_format(name: Optional[str] = None) -> str:
+    """
+    Dump resume_preamble.tex into <format_dir>/<name>.fmt and return its path.
+    Raises RuntimeError when pdflatex fails.
+    """
+    name = name or format_name()
+    out_dir = format_dir()
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Build next to the final location so the move into place is atomic
+    # even when several workers race to build the same format
+    build_dir = tempfile.mkdtemp(prefix="build-", dir=out_dir)
+    try:
+        shutil.copy(os.path.join(TEMPLATES_DIR, PREAMBLE_TEMPLATE), build_dir)
+        result = subprocess.run(
+            [
+                "pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={name}",
+                f"&pdflatex {PREAMBLE_TEMPLATE}\\dump",
+            ],
+            cwd=build_dir,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        built = os.path.join(build_dir, name + ".fmt")
+        if result.returncode != 0 or not os.path.exists(built):
+            raise RuntimeError(f"Could not build LaTeX format {name}:\n{result.stdout[-1000:]}")
+        os.replace(built, format_path(name))
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    # Drop formats of older preambles / TeX installs
+    for entry in os.listdir(out_dir):
+        if entry.startswith(FORMAT_PREFIX) and entry.endswith(".fmt") and entry != name + ".fmt":
+            try:
+                os.remove(os.path.join(out_dir, entry))
+            except OSError:
+                pass
+
+    return format_path(name)
+
+
+def get_preamble_format() -> Optional[str]:
+    """
+    Path of the precompiled preamble format, building it on first use.
+    None when the format is disabled or cannot be built; callers then
+    compile the full preamble as before.
+    """
+    if not settings.latex_precompiled_format:
+        return None
+
+    try:
+        name = format_name()
+    except OSError:
+        return None
+    if name in _broken_formats:
+        return None
+
+    path = format_path(name)
+    if os.path.exists(path):
+        return path
+
+    with _build_lock:
+        if os.path.exists(path):
+            return path
+        try:
+            return build_preamble_format(name)
+        except (OSError, RuntimeError, subprocess.SubprocessError):
+            _broken_formats.add(name)
+            return None
+
+
+def discard_format(path: str) -> None:
+    """Stop using a format that failed to compile a document (e.g. a TeX Live upgrade in place)."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    _broken_formats.add(name)
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    print(build_preamble_format())
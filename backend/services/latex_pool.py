@@ -0,0 +1,142 @@
+"""
+Bounded pool of pdflatex compile slots for request handlers.
+
+- At most LATEX_WORKERS compiles run at once (default: CPU count); more
+  concurrent pdflatex processes only thrash the CPU.
+- Each slot owns a work directory, created once on a RAM-backed filesystem
+  (/dev/shm when available) and emptied between jobs instead of a fresh
+  on-disk mkdtemp per render.
+- Up to LATEX_MAX_QUEUE renders may wait for a slot; beyond that
+  compile_slot raises RenderQueueFull so the API can answer 503 at once.
+- Queue-wait and compile times are aggregated in stats().
+"""
+import asyncio
+import atexit
+import os
+import shutil
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+from core.config import settings
+from services.server_timing import add_stage
+
+
+SHM_DIR = "/dev/shm"
+
+
+class RenderQueueFull(Exception):
+    """Raised when more renders are waiting for a compile slot than LATEX_MAX_QUEUE allows."""
+
+
+_slots: Optional[asyncio.Queue] = None
+_work_dirs: List[str] = []
+_waiting = 0
+_stats = {
+    "completed": 0,
+    "failed": 0,
+    "rejected": 0,
+    "queue_wait_ms_total": 0.0,
+    "queue_wait_ms_max": 0.0,
+    "compile_ms_total": 0.0,
+    "compile_ms_max": 0.0,
+}
+
+
+def pool_size() -> int:
+    return settings.latex_workers or os.cpu_count() or 1
+
+
+def workdir_root() -> str:
+    if settings.latex_workdir_root:
+        return settings.latex_workdir_root
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        return SHM_DIR
+    return tempfile.gettempdir()
+
+
+def _get_slots() -> asyncio.Queue:
+    global _slots
+    if _slots is None:
+        root = workdir_root()
+        os.makedirs(root, exist_ok=True)
+        _slots = asyncio.Queue()
+        for _ in range(pool_size()):
+            work_dir = tempfile.mkdtemp(prefix="resume-latex-", dir=root)
+            _work_dirs.append(work_dir)
+            _slots.put_nowait(work_dir)
+    return _slots
+
+
+def _clear_dir(path: str) -> None:
+    """Empty a work directory so the next job starts clean (no stale .aux/.pdf)."""
+    for entry in os.scandir(path):
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+@atexit.register
+def _remove_work_dirs() -> None:
+    for work_dir in _work_dirs:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+@asynccontextmanager
+async def compile_slot(timings: Optional[Dict[str, float]] = None) -> AsyncIterator[str]:
+    """
+    Wait for a free compile slot and yield its (empty) work directory.
+    Records the wait as timings["queue"] in ms.
+    """
+    global _waiting
+    slots = _get_slots()
+
+    if slots.empty() and _waiting >= settings.latex_max_queue:
+        _stats["rejected"] += 1
+        raise RenderQueueFull("The PDF renderer is busy. Please try again in a few seconds.")
+
+    _waiting += 1
+    start = time.perf_counter()
+    try:
+        work_dir = await slots.get()
+    finally:
+        _waiting -= 1
+
+    queue_wait_ms = (time.perf_counter() - start) * 1000
+    add_stage("render_queue", queue_wait_ms / 1000)
+    _stats["queue_wait_ms_total"] += queue_wait_ms
+    _stats["queue_wait_ms_max"] = max(_stats["queue_wait_ms_max"], queue_wait_ms)
+    if timings is not None:
+        timings["queue"] = queue_wait_ms
+
+    start = time.perf_counter()
+    try:
+        yield work_dir
+    except BaseException:
+        _stats["failed"] += 1
+        raise
+    else:
+        _stats["completed"] += 1
+    finally:
+        compile_ms = (time.perf_counter() - start) * 1000
+        _stats["compile_ms_total"] += compile_ms
+        _stats["compile_ms_max"] = max(_stats["compile_ms_max"], compile_ms)
+        _clear_dir(work_dir)
+        slots.put_nowait(work_dir)
+
+
+def stats() -> Dict[str, float]:
+    """Pool configuration, current load and cumulative timing counters."""
+    busy = pool_size() - _slots.qsize() if _slots is not None else 0
+    return {
+        "workers": pool_size(),
+        "busy": busy,
+        "waiting": _waiting,
+        "max_queue": settings.latex_max_queue,
+        **_stats,
+    }
@@ -1,80 +1,134 @@
 import json
-from openai import OpenAI
+from typing import List, Optional
 from core.config import settings
+from models.resume_models import Resume
 from services.domain_detector import detect_domain
 from services.domain_prompts import get_domain_prompt
+from services.metrics import record_cache, record_llm_usage, timed
+from services.resume_stats import ResumeStats, resume_stats
 
-# Validate API key on import
-try:
-    settings.validate_api_key()
-except ValueError as e:
-    import warnings
-    warnings.warn(str(e), UserWarning)
+# Created on first use: importing openai is the most expensive part of app startup
+_client = None
+
+
+class LLMAuthenticationError(Exception):
+    """The OpenAI API rejected the API key (re-raised from openai.AuthenticationError)."""
+
+
+class LLMRewriteError(Exception):
+    """An LLM rewrite the caller asked for explicitly failed or returned unusable output."""
+
+
+def get_client():
+    """The shared OpenAI client, or None when no API key is configured."""
+    global _client
+    if _client is None and settings.openai_api_key:
+        from openai import OpenAI
+        _client = OpenAI(api_key=settings.openai_api_key)
+    return _client
+
+
+# LLM stages whose Server-Timing name differs from their /metrics stage label
+LLM_REQUEST_STAGES = {"resume_parse": "parse_llm", "jd_parse": "jd_llm"}
+
+
+def chat_completion(stage: str, **kwargs):
+    """client.chat.completions.create, timed and token-counted under stage in /metrics."""
+    from openai import AuthenticationError
+
+    with timed("llm_seconds", LLM_REQUEST_STAGES.get(stage, stage), stage=stage):
+        try:
+            response = get_client().chat.completions.create(**kwargs)
+        except AuthenticationError as e:
+            raise LLMAuthenticationError(str(e)) from e
+    record_llm_usage(stage, response)
+    return response
 
-client = OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
 
 # Simple in-memory cache for domain detection (to avoid duplicate API calls)
 _domain_cache = {}
 
 
-def rewrite_resume_sections(resume_json: dict, job_json: dict) -> str:
+def get_domain_info(job_json: dict) -> dict:
+    """detect_domain, cached by JD title to avoid duplicate calls."""
+    jd_title = job_json.get("title", "") or ""
+    cache_key = jd_title.lower()[:50]
+    
+    record_cache("domain", cache_key in _domain_cache)
+    if cache_key in _domain_cache:
+        return _domain_cache[cache_key]
+    domain_info = detect_domain(job_json)
+    _domain_cache[cache_key] = domain_info
+    return domain_info
+
+
+def rewrite_resume_sections(
+    resume_json: dict,
+    job_json: dict,
+    bullet_targets: Optional[List[int]] = None,
+    stats: Optional[ResumeStats] = None,
+) -> str:
     """
     Call the LLM to strongly tailor the resume to any job description:
     - Rewrite summary (if present)
     - Rewrite ALL bullets in experience, projects, and volunteer work
     - Keep the SAME number of bullets per entry
-    - Match original bullet lengths character-for-character
+    - Match original bullet lengths character-for-character, or the
+      per-bullet character budgets in bullet_targets (experience, projects,
+      leadership, volunteer work order; see page_estimate.bullet_length_targets)
     - Adapt to any domain (tech, healthcare, finance, marketing, etc.)
+
+    stats is the resume's ResumeStats (computed from resume_json when omitted).
     """
 
-    # Calculate original resume structure and bullet lengths
-    experience_bullet_counts = [len(exp.get("bullets", [])) for exp in resume_json.get("experience", [])]
-    project_bullet_counts = [len(proj.get("bullets", [])) for proj in resume_json.get("projects", [])]
-    leadership_bullet_counts = [len(lead.get("bullets", [])) for lead in resume_json.get("leadership", [])]
-    volunteer_bullet_counts = [len(vol.get("bullets", [])) for vol in resume_json.get("volunteer_work", [])]
-    
+    # Counts and lengths come from the request's shared ResumeStats
+    if stats is None:
+        stats = resume_stats(Resume.model_validate(resume_json))
+
     # Get all bullets with their lengths for the prompt
-    bullet_examples = []
-    for exp in resume_json.get("experience", []):
-        for bullet in exp.get("bullets", []):
-            bullet_examples.append(f"Original ({len(bullet)} chars): \"{bullet}\"")
-    for proj in resume_json.get("projects", []):
-        for bullet in proj.get("bullets", []):
-            bullet_examples.append(f"Original ({len(bullet)} chars): \"{bullet}\"")
-    for lead in resume_json.get("leadership", []):
-        for bullet in lead.get("bullets", []):
-            bullet_examples.append(f"Original ({len(bullet)} chars): \"{bullet}\"")
+    bullet_examples = [f"Original ({len(bullet)} chars): \"{bullet}\"" for bullet in stats.prompt_bullets]
     
     # Show first 5 as examples
     bullet_examples_str = "\n".join(bullet_examples[:5])
+
+    # Per-bullet budgets from the font-metric page estimate, when provided
+    length_targets_str = ""
+    if bullet_targets:
+        target_lines = []
+        sections = [
+            ("Experience", "experience"),
+            ("Project", "projects"),
+            ("Leadership", "leadership"),
+            ("Volunteer", "volunteer_work"),
+        ]
+        targets = iter(bullet_targets)
+        for label, key in sections:
+            for entry_index, entry in enumerate(resume_json.get(key, []), start=1):
+                for bullet_index, bullet in enumerate(entry.get("bullets", []), start=1):
+                    target = next(targets, None)
+                    if target is not None:
+                        target_lines.append(
+                            f"{label} {entry_index}, bullet {bullet_index}: ~{target} chars (now {len(bullet)})"
+                        )
+        length_targets_str = (
+            "\n=========================================\n"
+            "PER-BULLET LENGTH TARGETS\n"
+            "=========================================\n"
+            "Measured with the resume's font and page width so the result fits on one page.\n"
+            "Stay within ±10 characters of each target; these override the general length guidance.\n"
+            + "\n".join(target_lines)
+            + "\n"
+        )
     
-    # Calculate bullet lengths
-    all_bullets = []
-    for exp in resume_json.get("experience", []):
-        all_bullets.extend(exp.get("bullets", []))
-    for proj in resume_json.get("projects", []):
-        all_bullets.extend(proj.get("bullets", []))
-    for lead in resume_json.get("leadership", []):
-        all_bullets.extend(lead.get("bullets", []))
-    
-    bullet_lengths = [len(bullet) for bullet in all_bullets if bullet]
-    avg_bullet_length = sum(bullet_lengths) / len(bullet_lengths) if bullet_lengths else 150
-    
-    total_bullets = sum(experience_bullet_counts + project_bullet_counts + leadership_bullet_counts + volunteer_bullet_counts)
+    avg_bullet_length = stats.avg_bullet_length
+    total_bullets = stats.total_bullets
     
     # Use compact_mode from the resume object (already calculated in tailor_engine.py)
     # This determines whether we need tight spacing AND short bullets
     is_compact = resume_json.get("compact_mode", False)
     
     # Stage 1: Detect domain (with caching to avoid duplicate calls)
-    jd_title = job_json.get("title", "")
-    cache_key = jd_title.lower()[:50]
-    
-    if cache_key in _domain_cache:
-        domain_info = _domain_cache[cache_key]
-    else:
-        domain_info = detect_domain(job_json)
-        _domain_cache[cache_key] = domain_info
+    domain_info = get_domain_info(job_json)
     
     industry = domain_info.get("industry", "General / Hybrid")
     sub_domain = domain_info.get("sub_domain", "General Business")
@@ -185,7 +239,7 @@ ORIGINAL BULLETS (with character counts):
 
 AVERAGE BULLET LENGTH: {avg_bullet_length:.0f} characters
 TOTAL BULLETS: {total_bullets}
-
+{length_targets_str}
 =========================================
 JOB DESCRIPTION FOCUS
 =========================================
@@ -199,7 +253,7 @@ TAILORING RULES
 =========================================
 
 1. **KEEP EXACT BULLET COUNT** - Same number of bullets per job/project as original
-2. {"**MATCH CHARACTER COUNTS** - Each tailored bullet should be within ±15 chars of original" if is_compact else "**EXPAND BULLETS** - Each bullet should be 180-250 characters (2.5-3 lines)"}
+2. {"**HIT THE LENGTH TARGETS** - Each bullet should be within ±10 chars of its per-bullet target" if bullet_targets else "**MATCH CHARACTER COUNTS** - Each tailored bullet should be within ±15 chars of original" if is_compact else "**EXPAND BULLETS** - Each bullet should be 180-250 characters (2.5-3 lines)"}
 3. {"**SWAP, DON'T ADD** - Replace generic terms with JD-specific keywords" if is_compact else "**ADD DETAIL** - Include technologies, context, metrics, and impact"}
 4. **PRESERVE STRUCTURE** - Do NOT change job titles, companies, dates, or locations
 5. **KEEP METRICS** - Preserve all numbers and percentages from original bullets
@@ -237,7 +291,8 @@ JOB DESCRIPTION JSON:
 
     system_message = f"You are a resume editor specializing in {industry}. Your PRIMARY goal: tailor content while matching original bullet lengths character-for-character."
     
-    response = client.chat.completions.create(
+    response = chat_completion(
+        "rewrite",
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": system_message},
@@ -257,7 +312,7 @@ def generate_headline_summary(resume_json: dict) -> dict:
     - Do NOT alter bullets or any other fields
     - Keep it concise and truthful to provided data
     """
-    if not client:
+    if not settings.openai_api_key:
         return {"headline": None, "summary": None}
 
     system_message = (
@@ -279,7 +334,8 @@ Instructions:
 """
 
     try:
-        response = client.chat.completions.create(
+        response = chat_completion(
+            "headline_summary",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_message},
@@ -294,4 +350,70 @@ Instructions:
             "summary": data.get("summary") or None,
         }
     except Exception:
-        return {"headline": None, "summary": None}
\ No newline at end of file
+        return {"headline": None, "summary": None}
+
+def retailor_bullets(bullets: List[str], job_json: dict, domain_info: dict, skills: List[str]) -> List[str]:
+    """
+    Re-tailor just these bullets to the job description (editing sessions).
+    - One call for all bullets, returning the SAME number in the same order
+    - Each bullet keeps its length within ±10 characters, so the page fit holds
+    Raises LLMAuthenticationError for a rejected API key and LLMRewriteError
+    for anything else that leaves the bullets unchanged (no API key, API
+    errors such as rate limits or timeouts, malformed output), so the edit
+    is never reported as done when nothing happened.
+    """
+    if not bullets:
+        return []
+    if not settings.openai_api_key:
+        raise LLMRewriteError("OPENAI_API_KEY is not set, so bullets cannot be re-tailored.")
+
+    industry = domain_info.get("industry", "General / Hybrid")
+    sub_domain = domain_info.get("sub_domain", "General Business")
+    must = job_json.get("must_have_skills", []) or []
+    nice = job_json.get("nice_to_have_skills", []) or []
+    numbered = "\n".join(f'{i}. ({len(bullet)} chars) "{bullet}"' for i, bullet in enumerate(bullets, start=1))
+
+    system_message = (
+        f"You are a resume editor specializing in {industry}. Rewrite only the given "
+        "bullets to match the job description while keeping their facts, metrics and lengths."
+    )
+
+    prompt = f"""
+JOB: {job_json.get("title", "N/A")} ({industry} > {sub_domain})
+KEY SKILLS: {", ".join(must + nice) or "General"}
+SKILLS AVAILABLE (use ONLY these): {skills}
+
+BULLETS TO RE-TAILOR:
+{numbered}
+
+Instructions:
+- Only output JSON: {{"bullets": ["...", "..."]}} with exactly {len(bullets)} strings, in the same order
+- Keep each bullet within ±10 characters of its current length
+- Keep every number, metric and fact; swap generic wording for JD keywords
+- Do not invent experience or skills
+"""
+
+    try:
+        response = chat_completion(
+            "retailor",
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+        )
+        data = json.loads(response.choices[0].message.content)
+    except LLMAuthenticationError:
+        raise
+    except Exception as e:
+        raise LLMRewriteError(f"Re-tailoring failed: {e}") from e
+
+    rewritten = data.get("bullets") if isinstance(data, dict) else None
+    if (
+        not isinstance(rewritten, list)
+        or len(rewritten) != len(bullets)
+        or not all(isinstance(b, str) and b.strip() for b in rewritten)
+    ):
+        raise LLMRewriteError(f"Re-tailoring returned malformed output for {len(bullets)} bullet(s); try again.")
+    return [b.strip() for b in rewritten]
@@ -0,0 +1,157 @@
+"""
+In-process metrics, served by GET /metrics in Prometheus text format.
+
+Instrumentation is a few calls that cost a dict lookup and a lock:
+- timed(name, **labels): context manager adding the block's duration to a
+  latency histogram
+- observe(name, seconds, **labels): the same for a duration measured elsewhere
+  (both also add it to the request's Server-Timing breakdown when given
+  request_stage=..., see services/server_timing.py)
+- count(name, value=1, **labels): counter increment
+- record_llm_usage / record_cache / record_error: the common counters
+
+Names and label values are fixed by the call sites (stage, cache, backend,
+exception type), so the number of series stays small. Metrics are per
+process; with several uvicorn workers each worker reports its own.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from services import latex_pool
+from services.server_timing import add_stage
+
+
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "resume_"
+
+# Upper bounds in seconds; covers a Jinja render (ms) up to a slow LLM call (tens of s)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HELP = {
+    "pdf_extract_seconds": "PDF text extraction time by backend",
+    "llm_seconds": "LLM call latency by pipeline stage",
+    "template_render_seconds": "Jinja template render time",
+    "pdflatex_pass_seconds": "Time of each pdflatex pass, by pass number",
+    "llm_tokens_total": "LLM tokens by stage and kind (prompt, completion, cached)",
+    "cache_requests_total": "Cache lookups by cache and result (hit, miss)",
+    "errors_total": "Errors returned by the API, by exception type",
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+# (name, labels) -> [per-bucket counts (last = +Inf), sum]
+_histograms: Dict[Tuple[str, Labels], List[Any]] = {}
+# (name, labels) -> value
+_counters: Dict[Tuple[str, Labels], float] = {}
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def observe(name: str, seconds: float, request_stage: Optional[str] = None, **labels: Any) -> None:
+    if request_stage is not None:
+        add_stage(request_stage, seconds)
+    key = (name, _labels(labels))
+    bucket = bisect_left(LATENCY_BUCKETS, seconds)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0]
+        histogram[0][bucket] += 1
+        histogram[1] += seconds
+
+
+@contextmanager
+def timed(name: str, request_stage: Optional[str] = None, **labels: Any) -> Iterator[None]:
+    """Observe the duration of the with-block (also when it raises)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, request_stage, **labels)
+
+
+def count(name: str, value: float = 1, **labels: Any) -> None:
+    key = (name, _labels(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def record_llm_usage(stage: str, response: Any) -> None:
+    """Token counters from an OpenAI chat completion's usage block."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    count("llm_tokens_total", usage.prompt_tokens or 0, stage=stage, kind="prompt")
+    count("llm_tokens_total", usage.completion_tokens or 0, stage=stage, kind="completion")
+    count("llm_tokens_total", getattr(details, "cached_tokens", None) or 0, stage=stage, kind="cached")
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    count("cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+
+def record_error(exc: BaseException) -> None:
+    count("errors_total", type=type(exc).__name__)
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _header(lines: List[str], name: str, kind: str) -> None:
+    lines.append(f"# HELP {PREFIX}{name} {HELP.get(name, name)}")
+    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+
+
+def render() -> str:
+    """All metrics in Prometheus text exposition format."""
+    with _lock:
+        histograms = {key: (list(value[0]), value[1]) for key, value in _histograms.items()}
+        counters = dict(_counters)
+
+    lines: List[str] = []
+    for name in sorted({name for name, _ in histograms}):
+        _header(lines, name, "histogram")
+        for (series, labels), (buckets, total) in sorted(histograms.items()):
+            if series != name:
+                continue
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS + (float("inf"),), buckets):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{PREFIX}{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} {cumulative}")
+
+    for name in sorted({name for name, _ in counters}):
+        _header(lines, name, "counter")
+        for (series, labels), value in sorted(counters.items()):
+            if series == name:
+                lines.append(f"{PREFIX}{name}{_format_labels(labels)} {value:g}")
+
+    # pdflatex compile pool: live gauges plus its cumulative counters
+    pool = latex_pool.stats()
+    for key in ("workers", "busy", "waiting", "max_queue"):
+        lines.append(f"# TYPE {PREFIX}latex_pool_{key} gauge")
+        lines.append(f"{PREFIX}latex_pool_{key} {pool[key]}")
+    for key in ("completed", "failed", "rejected"):
+        lines.append(f"# TYPE {PREFIX}latex_pool_{key}_total counter")
+        lines.append(f"{PREFIX}latex_pool_{key}_total {pool[key]}")
+    for key in ("queue_wait", "compile"):
+        lines.append(f"# TYPE {PREFIX}latex_pool_{key}_seconds_total counter")
+        lines.append(f"{PREFIX}latex_pool_{key}_seconds_total {pool[key + '_ms_total'] / 1000}")
+
+    return "\n".join(lines) + "\n"
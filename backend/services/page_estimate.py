@@ -0,0 +1,223 @@
+"""
+Render-free estimate of how much of a page a Resume fills.
+
+Wraps every paragraph greedily with the template's own Times glyph widths
+and usable text width (the same line breaking as the native renderer), then
+adds up the line heights and vertical spaces of page_layout's parameters.
+A typical resume is estimated in well under a millisecond, so the tailor
+and reformat engines can use it for compact_mode, the headline/summary
+decision and per-bullet length targets without compiling anything.
+
+Estimates follow pdf_native's layout; pdflatex's optimal line breaking and
+hyphenation can occasionally save a line, so treat results as +/- a line
+or two per page (fit_solver measures real renders when that matters).
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from models.resume_models import Resume
+from services.font_metrics import DEFAULT_GLYPH_WIDTH, FONT_BOLD, FONT_ITALIC, FONT_REGULAR, glyph_widths
+from services.page_layout import layout_params
+from services.pdf_native import (
+    EN_DASH,
+    ITEM_INDENT,
+    LEFT_COLUMN,
+    MARGIN,
+    NAME_LEADING,
+    PAGE_HEIGHT,
+    RULE_THICKNESS,
+    TEXT_WIDTH,
+)
+
+
+# Vertical space available for content on one page
+PAGE_TEXT_HEIGHT = PAGE_HEIGHT - 2 * MARGIN
+BULLET_WIDTH = TEXT_WIDTH - ITEM_INDENT
+
+# Bullets are never targeted at more lines than this
+MAX_BULLET_LINES = 3
+
+
+@lru_cache(maxsize=65536)
+def _word_width(word: str, font: str) -> float:
+    """Width of word in 1/1000 em; resumes reuse a small vocabulary, so this is mostly a lookup."""
+    widths = glyph_widths(font)
+    return sum(widths.get(ch, DEFAULT_GLYPH_WIDTH) for ch in word)
+
+
+def wrap_lines(text: str, width: float, size: float, font: str = FONT_REGULAR) -> Tuple[int, float]:
+    """
+    Greedy-wrapped line count of text set in width points, and how full its
+    last line is (0..1). Empty text is (0, 0.0).
+    """
+    limit = width * 1000 / size  # in glyph units, so words need no scaling
+    space = glyph_widths(font).get(" ", DEFAULT_GLYPH_WIDTH)
+    lines = 0
+    line = -1.0  # width of the current line; -1 = no word on it yet
+    for word in text.split():
+        word_width = _word_width(word, font)
+        if line >= 0 and line + space + word_width > limit:
+            lines += 1
+            line = word_width
+        else:
+            line = word_width if line < 0 else line + space + word_width
+    if line < 0:
+        return 0, 0.0
+    return lines + 1, min(line / limit, 1.0)
+
+
+def _dated_entries(resume: Resume) -> List[Tuple[str, Optional[str], List[str]]]:
+    """(name, subtitle, bullets) of every bulleted section, in template order."""
+    entries = [(exp.company, exp.title, exp.bullets) for exp in resume.experience]
+    entries += [(proj.name, proj.role, proj.bullets) for proj in resume.projects]
+    if not _is_minor_leadership(resume):
+        entries += [(lead.organization, lead.role, lead.bullets) for lead in resume.leadership]
+    entries += [(vol.organization, vol.role, vol.bullets) for vol in resume.volunteer_work]
+    return entries
+
+
+def _is_minor_leadership(resume: Resume) -> bool:
+    return len(resume.leadership) == 1 and len(resume.leadership[0].bullets) <= 1
+
+
+def estimate_page_height(resume: Resume, params: Optional[Dict[str, float]] = None) -> float:
+    """Points of vertical space resume takes up (one page holds PAGE_TEXT_HEIGHT)."""
+    if params is None:
+        params = layout_params(resume)
+    size, leading = params["font_size"], params["leading"]
+    entry_space = params["entry_space"]
+    section = params["section_before"] + leading + RULE_THICKNESS + params["section_after"]
+
+    def lines(text: Optional[str], width: float = TEXT_WIDTH, font: str = FONT_REGULAR) -> int:
+        return wrap_lines(text, width, size, font)[0] if text else 0
+
+    def heading(name: str, subtitle: Optional[str]) -> float:
+        left = f"{name} {EN_DASH} {subtitle}" if subtitle else name
+        return max(1, lines(left, LEFT_COLUMN, FONT_BOLD)) * leading + 1
+
+    # Name, contact line and their spacing
+    height = NAME_LEADING - 4 + 5
+    if resume.contact and (resume.contact.email or resume.contact.phone or resume.contact.linkedin):
+        height += leading
+    if resume.headline:
+        height += lines(resume.headline, font=FONT_ITALIC) * leading + 5
+    if resume.summary:
+        height += lines(resume.summary) * leading + 10
+
+    if resume.education:
+        height += section + entry_space * (len(resume.education) - 1)
+        for edu in resume.education:
+            height += heading(edu.school, edu.location)
+            second_line = ", ".join(part for part in (edu.degree, edu.major) if part)
+            height += (lines(second_line) + lines(edu.scholarships) + (1 if edu.gpa else 0)) * leading
+
+    for name, subtitle, bullets in _dated_entries(resume):
+        height += heading(name, subtitle)
+        height += sum(lines(bullet, BULLET_WIDTH) for bullet in bullets) * leading
+        if bullets:
+            height += entry_space
+    height += section * sum(
+        1 for present in (
+            resume.experience,
+            resume.projects,
+            resume.leadership and not _is_minor_leadership(resume),
+            resume.volunteer_work,
+            resume.awards,
+            resume.publications,
+        ) if present
+    )
+
+    for award in resume.awards:
+        height += heading(award.title, award.organization) + lines(award.description) * leading + entry_space
+    for pub in resume.publications:
+        details = ", ".join(part for part in (pub.authors, pub.venue, pub.date) if part)
+        height += (lines(pub.title, font=FONT_BOLD) + lines(details, font=FONT_ITALIC) + lines(pub.url)) * leading
+        height += entry_space
+
+    info = resume.additional_info
+    if info or resume.skills or resume.leadership:
+        height += section
+        skills = (info and (info.computer_skills or info.technical_skills)) or " | ".join(resume.skills)
+        label_lines = [f"Computer Skills: {skills}" if skills else None]
+        if info:
+            label_lines += [
+                "Certifications: " + ", ".join(info.certifications) if info.certifications else None,
+                "Languages: " + ", ".join(info.languages) if info.languages else None,
+                "Memberships: " + ", ".join(info.professional_memberships) if info.professional_memberships else None,
+                "Leadership: " + resume.leadership[0].organization if _is_minor_leadership(resume) else None,
+                "Work Eligibility: " + info.work_eligibility if info.work_eligibility else None,
+                info.other,
+            ]
+        height += sum(lines(text) for text in label_lines) * leading
+
+    return height
+
+
+def estimate_page_fill(resume: Resume, params: Optional[Dict[str, float]] = None) -> float:
+    """
+    Estimated pages of content (1.0 = exactly one full page). Without params
+    the memoized ResumeStats estimate at the resume's own layout is used.
+    """
+    if params is None:
+        from services.resume_stats import resume_stats
+
+        return resume_stats(resume).page_height / PAGE_TEXT_HEIGHT
+    return estimate_page_height(resume, params) / PAGE_TEXT_HEIGHT
+
+
+def free_lines(resume: Resume) -> int:
+    """Body lines still free on page one (negative when the resume overflows)."""
+    from services.resume_stats import resume_stats
+
+    stats = resume_stats(resume)
+    return int((PAGE_TEXT_HEIGHT - stats.page_height) // stats.leading)
+
+
+def bullet_length_targets(resume: Resume) -> List[int]:
+    """
+    Character budget per bullet of experience, projects, leadership and
+    volunteer work (in that order, as the rewrite prompt lists them; see
+    resume_stats.PROMPT_BULLET_SECTIONS) so the rewritten resume
+    fills one page: overflowing resumes lose a line from the bullets whose
+    last line is emptiest, resumes with room gain a line on the shortest
+    bullets. Each budget fills its bullet's target lines at its own average
+    character width.
+    """
+    from services.resume_stats import resume_stats
+
+    stats = resume_stats(resume)
+    size = layout_params(resume)["font_size"]
+    bullets = stats.prompt_bullets
+    wrapped = stats.bullet_wraps
+    targets = [lines for lines, _ in wrapped]
+
+    slack = free_lines(resume)
+    if slack < 0:
+        # Dropping a nearly empty last line costs the fewest words
+        order = sorted(range(len(bullets)), key=lambda i: wrapped[i][1])
+        while slack < 0 and any(targets[i] > 1 for i in order):
+            for i in order:
+                if slack >= 0:
+                    break
+                if targets[i] > 1:
+                    targets[i] -= 1
+                    slack += 1
+    else:
+        order = sorted(range(len(bullets)), key=lambda i: wrapped[i][0])
+        for i in order:
+            if slack <= 0:
+                break
+            if targets[i] < MAX_BULLET_LINES:
+                targets[i] += 1
+                slack -= 1
+
+    widths = glyph_widths(FONT_REGULAR)
+    space = widths.get(" ", DEFAULT_GLYPH_WIDTH)
+    budgets = []
+    for bullet, lines in zip(bullets, targets):
+        text = bullet or "x"
+        average = sum(widths.get(ch, DEFAULT_GLYPH_WIDTH) for ch in text) / len(text) or space
+        chars_per_line = BULLET_WIDTH * 1000 / size / average
+        # Leave a few characters of each line for greedy wrapping losses
+        budgets.append(int(lines * chars_per_line * 0.95))
+    return budgets
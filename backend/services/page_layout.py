@@ -0,0 +1,49 @@
+"""
+Spacing and font-size parameters shared by both PDF renderers.
+
+Resume.layout_tightness (0..1) interpolates every parameter from the
+template's normal values (0) to the tightest layout still considered
+readable (1). services/fit_solver.py searches for the smallest tightness
+that fits the resume on one page; compact_mode only picks the starting
+entry spacing.
+"""
+from typing import Dict, Optional
+
+from models.resume_models import Resume
+
+
+BODY_SIZE = 10.0  # \documentclass[10pt]
+BODY_LEADING = 12.0
+ENTRY_SPACE = 5.0
+ENTRY_SPACE_COMPACT = 1.0
+SECTION_BEFORE = 10.0  # \titlespacing*{\section}{0pt}{10pt}{2pt}
+SECTION_AFTER = 2.0
+
+# Parameter -> value at layout_tightness = 1
+TIGHTEST = {
+    "font_size": 9.0,
+    "leading": 10.8,
+    "entry_space": 0.0,
+    "section_before": 4.0,
+    "section_after": 1.0,
+}
+
+
+def layout_params(resume: Resume, compact: Optional[bool] = None) -> Dict[str, float]:
+    """
+    Point sizes for resume's layout_tightness, rounded to 0.01pt.
+    compact overrides resume.compact_mode (e.g. to measure before deciding it).
+    """
+    if compact is None:
+        compact = resume.compact_mode
+    loose = {
+        "font_size": BODY_SIZE,
+        "leading": BODY_LEADING,
+        "entry_space": ENTRY_SPACE_COMPACT if compact else ENTRY_SPACE,
+        "section_before": SECTION_BEFORE,
+        "section_after": SECTION_AFTER,
+    }
+    t = min(max(resume.layout_tightness, 0.0), 1.0)
+    params = {name: round(value + (TIGHTEST[name] - value) * t, 2) for name, value in loose.items()}
+    params["tightness"] = t
+    return params
@@ -0,0 +1,174 @@
+"""
+Disk-backed cache of rendered resume PDFs.
+
+The same tailored Resume is often rendered more than once (download after
+viewing, frontend retries, repeated output=pdf requests). Rendered PDFs are
+stored under a key derived from the canonical Resume JSON and the template
+version, and hits are served straight from disk with FileResponse so the
+PDF never has to be loaded into Python memory.
+
+Entries are evicted least-recently-used first (by mtime, bumped on every
+hit) once the directory grows past PDF_CACHE_MAX_MB.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from fastapi.responses import FileResponse, Response
+
+from core.config import settings
+from models.resume_models import Resume
+from services.metrics import record_cache
+from services.pdf_metadata import canonical_resume_json
+from services.pdf_writer import (
+    PREAMBLE_TEMPLATE,
+    RENDER_TIMING_HEADER,
+    RESUME_TEMPLATE,
+    TEMPLATES_DIR,
+    format_render_timings,
+    render_resume_pdf_async,
+    resolve_render_backend,
+)
+
+
+PDF_CACHE_HEADER = "X-PDF-Cache"
+CACHE_HIT = "HIT"
+CACHE_MISS = "MISS"
+
+# Entries used this recently are never evicted, so a hit being streamed by
+# FileResponse cannot have its file deleted underneath it
+EVICT_GRACE_SECONDS = 60
+
+# Files whose contents define each backend's output
+_PAGE_LAYOUT = os.path.join(os.path.dirname(__file__), "page_layout.py")
+RENDERER_FILES = {
+    "latex": [os.path.join(TEMPLATES_DIR, RESUME_TEMPLATE), os.path.join(TEMPLATES_DIR, PREAMBLE_TEMPLATE), _PAGE_LAYOUT],
+    "native": [os.path.join(os.path.dirname(__file__), "pdf_native.py"), _PAGE_LAYOUT],
+}
+
+_evict_lock = threading.Lock()
+_template_versions: Dict[str, str] = {}
+
+
+def cache_dir() -> str:
+    return settings.pdf_cache_dir or os.path.join(tempfile.gettempdir(), "resume-pdf-cache")
+
+
+def template_version(backend: str = "latex") -> str:
+    """Hash of the backend's templates/layout code; any edit invalidates previously rendered PDFs."""
+    version = _template_versions.get(backend)
+    if version is None or settings.template_hot_reload:
+        digest = hashlib.sha256(backend.encode("utf-8"))
+        for path in RENDERER_FILES[backend]:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        version = _template_versions[backend] = digest.hexdigest()[:16]
+    return version
+
+
+def pdf_cache_key(resume: Resume, backend: str = "latex") -> str:
+    digest = hashlib.sha256(canonical_resume_json(resume))
+    digest.update(template_version(backend).encode("utf-8"))
+    # The embedded JSON payload changes the bytes, so keep both variants apart
+    digest.update(b"embed" if settings.embed_resume_json else b"plain")
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(cache_dir(), key + ".pdf")
+
+
+def get_cached_pdf(key: str) -> Optional[str]:
+    """Path of the cached PDF for key, marking it recently used, or None."""
+    path = _entry_path(key)
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def store_rendered_pdf(key: str, pdf_bytes: bytes) -> Optional[str]:
+    """Write a rendered PDF into the cache and return its path (None if the write failed)."""
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+        # Atomic, so concurrent readers never see a partial file
+        os.replace(tmp_path, _entry_path(key))
+    except OSError:
+        return None
+
+    _evict(keep=key)
+    return _entry_path(key)
+
+
+def _evict(keep: str) -> None:
+    """Delete least recently used entries until the cache fits in pdf_cache_max_mb."""
+    limit = settings.pdf_cache_max_mb * 1024 * 1024
+    directory = cache_dir()
+    cutoff = time.time() - EVICT_GRACE_SECONDS
+    with _evict_lock:
+        entries = []
+        total = 0
+        for entry in os.scandir(directory):
+            if not entry.name.endswith(".pdf"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            if entry.name != keep + ".pdf" and stat.st_mtime < cutoff:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+async def rendered_pdf_response(
+    resume: Resume,
+    filename: str,
+    headers: Optional[Dict[str, str]] = None,
+    timings: Optional[Dict[str, float]] = None,
+    backend: Optional[str] = None,
+) -> Response:
+    """
+    PDF download response for resume, rendering it only on a cache miss.
+    Hits are streamed from disk. Raises latex_pool.RenderQueueFull when a
+    miss cannot get a compile slot.
+    """
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"', **(headers or {})}
+    if timings is None:
+        timings = {}
+
+    backend = resolve_render_backend(backend)
+    enabled = settings.pdf_cache_max_mb > 0
+    key = pdf_cache_key(resume, backend) if enabled else None
+
+    path = get_cached_pdf(key) if enabled else None
+    if enabled:
+        record_cache("pdf", path is not None)
+    if path is not None:
+        headers[PDF_CACHE_HEADER] = CACHE_HIT
+        return FileResponse(path, media_type="application/pdf", headers=headers)
+
+    pdf_bytes = await render_resume_pdf_async(resume, timings, backend)
+    if enabled:
+        store_rendered_pdf(key, pdf_bytes)
+
+    # Just rendered, so the bytes are in memory already; no need to re-read the file
+    headers[PDF_CACHE_HEADER] = CACHE_MISS
+    headers[RENDER_TIMING_HEADER] = format_render_timings(timings)
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
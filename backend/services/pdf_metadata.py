@@ -0,0 +1,108 @@
+"""
+Embed the structured Resume inside generated PDFs and read it back.
+
+Every PDF we render carries the canonical Resume JSON as an embedded file
+(resume.json), plus its schema version and content hash in the document
+info dictionary. When such a PDF is uploaded again, the parser loads that
+payload directly and skips text extraction and the LLM parse entirely.
+"""
+import hashlib
+import json
+from io import BytesIO
+from typing import Optional
+
+from models.resume_models import Resume
+from services.pdf_reader import PdfSource, rewind_source
+
+
+RESUME_ATTACHMENT_NAME = "resume.json"
+# Bump when the Resume model changes incompatibly; older payloads are then ignored
+RESUME_SCHEMA_VERSION = 1
+
+SCHEMA_VERSION_KEY = "/ResumeSchemaVersion"
+CONTENT_HASH_KEY = "/ResumeContentHash"
+
+
+def canonical_resume_json(resume: Resume) -> bytes:
+    """Stable JSON encoding of a Resume (sorted keys, no whitespace)."""
+    return json.dumps(resume.model_dump(mode="json"), sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def resume_content_hash(resume: Resume) -> str:
+    return hashlib.sha256(canonical_resume_json(resume)).hexdigest()
+
+
+def embed_resume_payload(pdf_bytes: bytes, resume: Resume) -> bytes:
+    """Return a copy of pdf_bytes with the Resume JSON attached and tagged in the metadata."""
+    from PyPDF2 import PdfReader, PdfWriter
+
+    resume_json = canonical_resume_json(resume)
+    content_hash = hashlib.sha256(resume_json).hexdigest()
+    payload = json.dumps({
+        "schema_version": RESUME_SCHEMA_VERSION,
+        "content_hash": content_hash,
+        "resume": json.loads(resume_json),
+    }).encode("utf-8")
+
+    reader = PdfReader(BytesIO(pdf_bytes))
+    writer = PdfWriter()
+    # Pages carry the content and link annotations; PyPDF2's whole-document
+    # clone drops writer-side edits to the catalog, so copy pages instead
+    writer.append_pages_from_reader(reader)
+    if reader.metadata:
+        writer.add_metadata(dict(reader.metadata))
+    writer.add_metadata({
+        SCHEMA_VERSION_KEY: str(RESUME_SCHEMA_VERSION),
+        CONTENT_HASH_KEY: content_hash,
+    })
+    writer.add_attachment(RESUME_ATTACHMENT_NAME, payload)
+
+    out = BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def _find_attachment(reader, name: str) -> Optional[bytes]:
+    """Walk /Root/Names/EmbeddedFiles directly so this works across PyPDF2 versions."""
+    names_tree = reader.trailer["/Root"].get("/Names")
+    if not names_tree or "/EmbeddedFiles" not in names_tree:
+        return None
+    entries = names_tree["/EmbeddedFiles"].get("/Names", [])
+    for i in range(0, len(entries) - 1, 2):
+        if entries[i] == name:
+            filespec = entries[i + 1].get_object()
+            return filespec["/EF"]["/F"].get_object().get_data()
+    return None
+
+
+def read_embedded_resume(source: PdfSource) -> Optional[Resume]:
+    """
+    Load the Resume embedded by embed_resume_payload, or None when the PDF
+    has no payload, a different schema version, or a hash mismatch.
+    """
+    from PyPDF2 import PdfReader
+
+    try:
+        reader = PdfReader(rewind_source(source))
+        metadata = reader.metadata or {}
+        if metadata.get(SCHEMA_VERSION_KEY) != str(RESUME_SCHEMA_VERSION):
+            return None
+
+        data = _find_attachment(reader, RESUME_ATTACHMENT_NAME)
+        if data is None:
+            return None
+
+        payload = json.loads(data)
+        if payload.get("schema_version") != RESUME_SCHEMA_VERSION:
+            return None
+
+        resume = Resume.model_validate(payload["resume"])
+        if resume_content_hash(resume) != payload.get("content_hash"):
+            # Edited or corrupted payload; re-parse from the visible content
+            return None
+        return resume
+    except Exception:
+        # Malformed PDFs or payloads are handled by the regular parsing path
+        return None
+    finally:
+        rewind_source(source)
@@ -0,0 +1,455 @@
+"""
+Pure-Python PDF renderer for Resume models (no pdflatex required).
+
+Lays the Resume out directly onto letter pages using the built-in Times
+fonts, following resume_template.tex: the same section order, the same
+0.7/0.25 two-column headings, 14pt bullet indent, section rules, and the
+spacing and font size from page_layout.py. Output is close to, but not
+byte-identical with, the LaTeX rendering: lines are justified greedily (no
+hyphenation or Knuth-Plass paragraph breaking).
+
+Selected with PDF_RENDER_BACKEND=native or the per-request "renderer" form field.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+from models.resume_models import Resume
+from services.font_metrics import FONT_BOLD, FONT_BOLD_ITALIC, FONT_ITALIC, FONT_REGULAR, text_width
+from services.page_layout import layout_params
+
+
+# Letter paper, 0.5in margins (\usepackage[margin=0.5in]{geometry})
+PAGE_WIDTH = 612.0
+PAGE_HEIGHT = 792.0
+MARGIN = 36.0
+TEXT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+
+NAME_SIZE = 20.74  # \huge at 10pt
+NAME_LEADING = 25.0
+# Baseline sits this fraction of the line height below the top of the line box
+BASELINE_RATIO = 0.78
+
+LEFT_COLUMN = 0.7 * TEXT_WIDTH
+ITEM_INDENT = 14.0  # \setlist[itemize]{leftmargin=14pt}
+LABEL_SEP = 5.0
+RULE_THICKNESS = 0.4
+
+FONT_RESOURCES = {
+    FONT_REGULAR: "F1",
+    FONT_BOLD: "F2",
+    FONT_ITALIC: "F3",
+    FONT_BOLD_ITALIC: "F4",
+}
+
+BULLET = "•"
+EN_DASH = "–"
+MIDDLE_DOT = "·"
+
+# A piece of text in one font, optionally a hyperlink target
+Run = Tuple[str, str, Optional[str]]
+
+
+def _winansi(text: str) -> str:
+    """Replace characters the standard fonts' WinAnsiEncoding cannot show."""
+    return text.encode("cp1252", errors="replace").decode("cp1252")
+
+
+def _pdf_string(text: str) -> bytes:
+    raw = text.encode("cp1252", errors="replace")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+class _PdfDocument:
+    """Minimal PDF writer: Type1 standard fonts, text, rules and URI links."""
+
+    def __init__(self):
+        self.pages: List[Tuple[List[bytes], List[Tuple[float, float, float, float, str]]]] = []
+
+    def new_page(self) -> None:
+        self.pages.append(([], []))
+
+    def text(
+        self,
+        x: float,
+        y: float,
+        segments: List[Tuple[str, str, bool]],
+        size: float,
+        word_spacing: float = 0.0,
+    ) -> None:
+        """
+        Draw (text, font, is_link) segments as one text object starting at (x, y).
+        Spaces are real characters, so copied/extracted text keeps its word
+        breaks; justification stretches them with Tw.
+        """
+        ops = [b"BT", f"{_fmt(x)} {_fmt(y)} Td".encode()]
+        if word_spacing:
+            ops.append(f"{_fmt(word_spacing)} Tw".encode())
+        for text, font, link in segments:
+            ops.append(f"/{FONT_RESOURCES[font]} {_fmt(size)} Tf".encode())
+            ops.append(b"0 0 1 rg " + _pdf_string(text) + b" Tj 0 g" if link else _pdf_string(text) + b" Tj")
+        ops.append(b"ET")
+        self.pages[-1][0].append(b" ".join(ops))
+
+    def rule(self, x1: float, x2: float, y: float, thickness: float) -> None:
+        self.pages[-1][0].append(f"{_fmt(x1)} {_fmt(y)} {_fmt(x2 - x1)} {_fmt(thickness)} re f".encode())
+
+    def link(self, x1: float, y1: float, x2: float, y2: float, uri: str) -> None:
+        self.pages[-1][1].append((x1, y1, x2, y2, uri))
+
+    def to_bytes(self, title: str) -> bytes:
+        objects: List[bytes] = []
+
+        def add(body: bytes) -> int:
+            objects.append(body)
+            return len(objects)
+
+        catalog = add(b"")  # filled in once the page tree exists
+        pages_ref = add(b"")
+        font_refs = {
+            resource: add(
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} /Encoding /WinAnsiEncoding >>".encode()
+            )
+            for font, resource in FONT_RESOURCES.items()
+        }
+        fonts = " ".join(f"/{resource} {ref} 0 R" for resource, ref in font_refs.items())
+
+        page_refs = []
+        for ops, links in self.pages:
+            stream = b"\n".join(ops)
+            content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+            annots = [
+                add(
+                    f"<< /Type /Annot /Subtype /Link /Rect [{_fmt(x1)} {_fmt(y1)} {_fmt(x2)} {_fmt(y2)}] "
+                    f"/Border [0 0 0] /A << /S /URI /URI ".encode() + _pdf_string(uri) + b" >> >>"
+                )
+                for x1, y1, x2, y2, uri in links
+            ]
+            annots_entry = (" /Annots [" + " ".join(f"{ref} 0 R" for ref in annots) + "]") if annots else ""
+            page_refs.append(add(
+                f"<< /Type /Page /Parent {pages_ref} 0 R /MediaBox [0 0 {_fmt(PAGE_WIDTH)} {_fmt(PAGE_HEIGHT)}] "
+                f"/Resources << /Font << {fonts} >> >> /Contents {content} 0 R{annots_entry} >>".encode()
+            ))
+
+        objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages_ref} 0 R >>".encode()
+        kids = " ".join(f"{ref} 0 R" for ref in page_refs)
+        objects[pages_ref - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_refs)} >>".encode()
+        info = add(b"<< /Title " + _pdf_string(title) + b" /Producer (Auto Resume Tailor) >>")
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        for offset in offsets:
+            out += b"%010d 00000 n \n" % offset
+        out += b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1, catalog, info, xref,
+        )
+        return bytes(out)
+
+
+class _Layout:
+    """Top-down flow of resume blocks over pages, mirroring the LaTeX template's spacing."""
+
+    def __init__(self, params: Dict[str, float]):
+        self.doc = _PdfDocument()
+        self.size = params["font_size"]
+        self.leading = params["leading"]
+        self.entry_space = params["entry_space"]
+        self.section_before = params["section_before"]
+        self.section_after = params["section_after"]
+        self._new_page()
+
+    def _new_page(self) -> None:
+        self.doc.new_page()
+        self.y = PAGE_HEIGHT - MARGIN  # top of the remaining space
+
+    def vspace(self, points: float) -> None:
+        self.y -= points
+
+    def ensure(self, height: float) -> None:
+        """Start a new page unless height points still fit on this one."""
+        if self.y - height < MARGIN and self.y < PAGE_HEIGHT - MARGIN:
+            self._new_page()
+
+    # -- text flow ---------------------------------------------------------
+
+    @staticmethod
+    def _words(runs: List[Run]) -> List[List[Run]]:
+        """Split runs into words; a word may span runs (e.g. bold label + text with no space)."""
+        words: List[List[Run]] = [[]]
+        for text, font, link in runs:
+            for piece in re.split(r"(\s+)", _winansi(text)):
+                if not piece:
+                    continue
+                if piece.isspace():
+                    if words[-1]:
+                        words.append([])
+                else:
+                    words[-1].append((piece, font, link))
+        return [word for word in words if word]
+
+    @staticmethod
+    def _word_width(word: List[Run], size: float) -> float:
+        return sum(text_width(text, font, size) for text, font, _ in word)
+
+    def wrap(self, runs: List[Run], width: float, size: Optional[float] = None) -> List[List[List[Run]]]:
+        size = size or self.size
+        space = text_width(" ", FONT_REGULAR, size)
+        lines: List[List[List[Run]]] = []
+        line: List[List[Run]] = []
+        line_width = 0.0
+        for word in self._words(runs):
+            word_width = self._word_width(word, size)
+            if line and line_width + space + word_width > width:
+                lines.append(line)
+                line, line_width = [], 0.0
+            line_width += (space if line else 0) + word_width
+            line.append(word)
+        if line:
+            lines.append(line)
+        return lines
+
+    def _draw_line(self, line: List[List[Run]], x: float, baseline: float, size: float, extra_space: float = 0.0) -> None:
+        space = text_width(" ", FONT_REGULAR, size) + extra_space
+        segments: List[Tuple[str, str, bool]] = []
+        cursor = x
+        for index, word in enumerate(line):
+            for position, (text, font, link) in enumerate(word):
+                width = text_width(text, font, size)
+                if link:
+                    self.doc.link(cursor, baseline - 0.22 * size, cursor + width, baseline + 0.7 * size, link)
+                # The inter-word space rides on the last piece of each word
+                if position == len(word) - 1 and index < len(line) - 1:
+                    text += " "
+                segments.append((text, font, link is not None))
+                cursor += width
+            cursor += space
+        self.doc.text(x, baseline, segments, size, extra_space)
+
+    def _line_width(self, line: List[List[Run]], size: float) -> float:
+        space = text_width(" ", FONT_REGULAR, size)
+        return sum(self._word_width(word, size) for word in line) + space * (len(line) - 1)
+
+    def paragraph(
+        self,
+        runs: List[Run],
+        indent: float = 0.0,
+        justify: bool = True,
+        align: str = "left",
+        size: Optional[float] = None,
+        leading: Optional[float] = None,
+    ) -> None:
+        size = size or self.size
+        leading = leading or self.leading
+        width = TEXT_WIDTH - indent
+        lines = self.wrap(runs, width, size)
+        for index, line in enumerate(lines):
+            self.ensure(leading)
+            baseline = self.y - leading * BASELINE_RATIO
+            natural = self._line_width(line, size)
+            x = MARGIN + indent
+            extra = 0.0
+            if align == "center":
+                x += (width - natural) / 2
+            elif justify and index < len(lines) - 1 and len(line) > 1:
+                extra = (width - natural) / (len(line) - 1)
+            self._draw_line(line, x, baseline, size, extra)
+            self.y -= leading
+
+    def heading_row(self, left: List[Run], right: str) -> None:
+        """\\resumeSubheading-style row: left minipage (0.7) and right-aligned date (0.25)."""
+        lines = self.wrap(left, LEFT_COLUMN)
+        self.ensure(self.leading * max(1, len(lines)))
+        top = self.y
+        for line in lines:
+            self._draw_line(line, MARGIN, self.y - self.leading * BASELINE_RATIO, self.size)
+            self.y -= self.leading
+        if right:
+            right = _winansi(right)
+            width = text_width(right, FONT_REGULAR, self.size)
+            self.doc.text(MARGIN + TEXT_WIDTH - width, top - self.leading * BASELINE_RATIO, [(right, FONT_REGULAR, False)], self.size)
+        if not lines:
+            self.y -= self.leading
+        self.vspace(1)
+
+    def section(self, title: str) -> None:
+        # Keep the heading with at least two lines of its first entry
+        self.ensure(self.section_before + self.leading * 3)
+        if self.y < PAGE_HEIGHT - MARGIN:
+            self.vspace(self.section_before)
+        baseline = self.y - self.leading * BASELINE_RATIO
+        self.doc.text(MARGIN, baseline, [(_winansi(title.upper()), FONT_BOLD, False)], self.size)
+        self.y -= self.leading
+        self.doc.rule(MARGIN, MARGIN + TEXT_WIDTH, self.y, RULE_THICKNESS)
+        self.vspace(RULE_THICKNESS + self.section_after)
+
+    def bullets(self, items: List[str]) -> None:
+        for item in items:
+            self.ensure(self.leading)
+            label_x = MARGIN + ITEM_INDENT - LABEL_SEP - text_width(BULLET, FONT_REGULAR, self.size)
+            self.doc.text(label_x, self.y - self.leading * BASELINE_RATIO, [(BULLET, FONT_REGULAR, False)], self.size)
+            self.paragraph([(item, FONT_REGULAR, None)], indent=ITEM_INDENT)
+
+
+def _dates(start: Optional[str], end: Optional[str]) -> str:
+    end = end or "Present"
+    return f"{start} {EN_DASH} {end}" if start else end
+
+
+def _titled(name: str, subtitle: Optional[str]) -> List[Run]:
+    """Bold name -- italic subtitle, as in \\resumeSubheading / \\resumeProjectHeading."""
+    runs: List[Run] = [(name, FONT_BOLD, None)]
+    if subtitle:
+        runs += [(f" {EN_DASH} ", FONT_REGULAR, None), (subtitle, FONT_ITALIC, None)]
+    return runs
+
+
+def _is_minor_leadership(resume: Resume) -> bool:
+    return len(resume.leadership) == 1 and len(resume.leadership[0].bullets) <= 1
+
+
+def _label_line(layout: _Layout, label: str, value: str) -> None:
+    layout.paragraph([(f"{label}:", FONT_BOLD, None), (" " + value, FONT_REGULAR, None)])
+
+
+def render_resume_pdf_native(resume: Resume) -> bytes:
+    """Render a Resume to PDF bytes in-process, following resume_template.tex."""
+    layout = _Layout(layout_params(resume))
+
+    # Name and contact line
+    layout.paragraph([(resume.name, FONT_BOLD, None)], align="center", size=NAME_SIZE, leading=NAME_LEADING)
+    layout.vspace(-4)
+    if resume.contact:
+        contact = resume.contact
+        parts: List[List[Run]] = []
+        if contact.email:
+            parts.append([(contact.email, FONT_REGULAR, None)])
+        if contact.phone:
+            parts.append([(contact.phone, FONT_REGULAR, None)])
+        if contact.linkedin:
+            url = contact.linkedin if "://" in contact.linkedin else "https://" + contact.linkedin
+            parts.append([(contact.linkedin, FONT_REGULAR, url)])
+        runs: List[Run] = []
+        for index, part in enumerate(parts):
+            if index:
+                runs.append((f" {MIDDLE_DOT} ", FONT_REGULAR, None))
+            runs += part
+        if runs:
+            layout.paragraph(runs, align="center")
+    layout.vspace(5)
+
+    if resume.headline:
+        layout.paragraph([(resume.headline, FONT_ITALIC, None)], align="center")
+        layout.vspace(5)
+
+    if resume.summary:
+        layout.paragraph([(resume.summary, FONT_REGULAR, None)])
+        layout.vspace(10)
+
+    if resume.education:
+        layout.section("Education")
+        for index, edu in enumerate(resume.education):
+            first_line = f"{edu.school} {EN_DASH} {edu.location}" if edu.location else edu.school
+            second_line = ", ".join(part for part in (edu.degree, edu.major) if part)
+            layout.heading_row([(first_line, FONT_BOLD, None)], edu.graduation_date or "")
+            if second_line:
+                layout.paragraph([(second_line, FONT_REGULAR, None)])
+            if edu.scholarships:
+                layout.paragraph([("Scholarships: " + edu.scholarships, FONT_REGULAR, None)])
+            if edu.gpa:
+                layout.paragraph([("Overall GPA: " + edu.gpa, FONT_REGULAR, None)])
+            if index < len(resume.education) - 1:
+                layout.vspace(layout.entry_space)
+
+    if resume.experience:
+        layout.section("Experience")
+        for exp in resume.experience:
+            layout.heading_row(_titled(exp.company, exp.title), _dates(exp.start_date, exp.end_date))
+            if exp.bullets:
+                layout.bullets(exp.bullets)
+                layout.vspace(layout.entry_space)
+
+    if resume.projects:
+        layout.section("Projects")
+        for proj in resume.projects:
+            layout.heading_row(_titled(proj.name, proj.role), proj.semester or "")
+            if proj.bullets:
+                layout.bullets(proj.bullets)
+                layout.vspace(layout.entry_space)
+
+    # Minor leadership (1 entry with 1 bullet) goes to Additional Information instead
+    if resume.leadership and not _is_minor_leadership(resume):
+        layout.section("Leadership")
+        for index, lead in enumerate(resume.leadership):
+            layout.heading_row(_titled(lead.organization, lead.role), _dates(lead.start_date, lead.end_date))
+            if lead.bullets:
+                layout.bullets(lead.bullets)
+                if index < len(resume.leadership) - 1:
+                    layout.vspace(layout.entry_space)
+
+    if resume.volunteer_work:
+        layout.section("Volunteer Work")
+        for vol in resume.volunteer_work:
+            layout.heading_row(_titled(vol.organization, vol.role), _dates(vol.start_date, vol.end_date))
+            if vol.bullets:
+                layout.bullets(vol.bullets)
+                layout.vspace(layout.entry_space)
+
+    if resume.awards:
+        layout.section("Awards & Honors")
+        for award in resume.awards:
+            layout.heading_row(_titled(award.title, award.organization), award.date or "")
+            if award.description:
+                layout.paragraph([(award.description, FONT_REGULAR, None)])
+            layout.vspace(layout.entry_space)
+
+    if resume.publications:
+        layout.section("Publications")
+        for pub in resume.publications:
+            layout.paragraph([(pub.title, FONT_BOLD, None)], justify=False)
+            details = ", ".join(part for part in (pub.authors, pub.venue) if part)
+            if pub.date:
+                details = f"{details} ({pub.date})" if details else pub.date
+            if details:
+                layout.paragraph([(details, FONT_ITALIC, None)], justify=False)
+            if pub.url:
+                layout.paragraph([(pub.url, FONT_REGULAR, pub.url)], justify=False)
+            layout.vspace(layout.entry_space)
+
+    info = resume.additional_info
+    if info or resume.skills or resume.leadership:
+        layout.section("Additional Information")
+        skills_line = " | ".join(resume.skills)
+        if info and info.computer_skills:
+            _label_line(layout, "Computer Skills", info.computer_skills)
+        elif info and info.technical_skills:
+            _label_line(layout, "Technical Skills", info.technical_skills)
+        elif skills_line:
+            _label_line(layout, "Skills", skills_line)
+
+        if info:
+            if info.certifications:
+                _label_line(layout, "Certifications", ", ".join(info.certifications))
+            if info.languages:
+                _label_line(layout, "Languages", ", ".join(info.languages))
+            if info.professional_memberships:
+                _label_line(layout, "Professional Memberships", ", ".join(info.professional_memberships))
+            if resume.leadership and _is_minor_leadership(resume):
+                lead = resume.leadership[0]
+                text = lead.organization + (f" - {lead.role}" if lead.role else "")
+                if lead.start_date:
+                    text += f" ({lead.start_date} - {lead.end_date or 'Present'})"
+                _label_line(layout, "Leadership", text)
+            if info.work_eligibility:
+                _label_line(layout, "Work Eligibility", info.work_eligibility)
+            if info.other:
+                layout.paragraph([(info.other, FONT_REGULAR, None)])
+
+    return layout.doc.to_bytes(resume.name)
@@ -1,9 +1,245 @@
-import pdfplumber
-
-def extract_text_from_pdf(path: str) -> str:
-    text = ""
-    with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
-            text += page_text + "\n"
-    return text.strip()
+import os
+import re
+import sys
+from io import BytesIO
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+from core.config import settings
+from services.metrics import timed
+
+
+# Documents shorter than this are extracted serially; pool overhead isn't worth it
+PARALLEL_MIN_PAGES = 6
+PAGES_PER_CHUNK = 4
+
+# Word attributes kept by the layout pass (the rest of pdfplumber's word dict is not used)
+LAYOUT_WORD_KEYS = ("text", "x0", "x1", "top", "fontname", "size")
+
+# Worker count -> process pool, so a call asking for a different count gets its own pool
+_page_pools: Dict[int, Any] = {}
+
+# A filesystem path or a readable, seekable binary file object (e.g. an upload)
+PdfSource = Union[str, BinaryIO]
+
+
+def _peak_rss_kb() -> int:
+    """Peak resident set size of the current process in KiB (0 where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def rewind_source(source: PdfSource) -> PdfSource:
+    if not isinstance(source, str):
+        source.seek(0)
+    return source
+
+
+def _extract_page_range(
+    source: Union[PdfSource, bytes], start: int, end: int, words: bool = False
+) -> Tuple[List[Any], int]:
+    """
+    Extract pages [start, end) with pdfplumber, releasing each page's cached
+    chars/layout objects as soon as its text has been taken.
+    Returns one entry per page (its text, or with words=True its words with
+    LAYOUT_WORD_KEYS) and this process's peak RSS.
+    """
+    import pdfplumber
+
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+
+    pages: List[Any] = []
+    with pdfplumber.open(rewind_source(source)) as pdf:
+        for page in pdf.pages[start:end]:
+            if words:
+                page_words = page.extract_words(extra_attrs=["fontname", "size"], keep_blank_chars=False)
+                pages.append([{key: word[key] for key in LAYOUT_WORD_KEYS} for word in page_words])
+            else:
+                pages.append(page.extract_text() or "")
+            page.flush_cache()
+    return pages, _peak_rss_kb()
+
+
+def _get_page_pool(workers: int):
+    pool = _page_pools.get(workers)
+    if pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = _page_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+
+def _resolve_workers() -> int:
+    if settings.pdf_extract_workers > 0:
+        return settings.pdf_extract_workers
+    return min(4, os.cpu_count() or 1)
+
+
+def _extract_pages(source: PdfSource, workers: Optional[int], words: bool) -> Tuple[List[Any], Dict[str, int]]:
+    """Per-page results of _extract_page_range over the whole document, in page order."""
+    import pdfplumber
+
+    workers = workers or _resolve_workers()
+    with pdfplumber.open(rewind_source(source)) as pdf:
+        page_count = len(pdf.pages)
+
+    if page_count < PARALLEL_MIN_PAGES or workers <= 1:
+        pages, peak_rss_kb = _extract_page_range(source, 0, page_count, words)
+        stats = {"pages": page_count, "workers": 1, "chunks": 1, "peak_rss_kb": peak_rss_kb}
+        return pages, stats
+
+    bounds = [(start, min(start + PAGES_PER_CHUNK, page_count)) for start in range(0, page_count, PAGES_PER_CHUNK)]
+    payload = source if isinstance(source, str) else rewind_source(source).read()
+    pool = _get_page_pool(workers)
+    futures = [pool.submit(_extract_page_range, payload, start, end, words) for start, end in bounds]
+
+    pages: List[Any] = []
+    peak_rss_kb = 0
+    for future in futures:
+        chunk_pages, chunk_peak = future.result()
+        pages.extend(chunk_pages)
+        peak_rss_kb = max(peak_rss_kb, chunk_peak)
+
+    stats = {"pages": page_count, "workers": min(workers, len(bounds)), "chunks": len(bounds), "peak_rss_kb": peak_rss_kb}
+    return pages, stats
+
+
+def extract_pdfplumber_pages(source: PdfSource, workers: Optional[int] = None) -> Tuple[str, Dict[str, int]]:
+    """
+    Layout-aware pdfplumber extraction that stays memory-bounded on long CVs.
+
+    Long documents are split into PAGES_PER_CHUNK-page chunks that are
+    extracted in parallel worker processes; each worker only ever holds one
+    page's layout objects at a time. Page texts are joined once at the end.
+
+    Returns (text, stats) where stats has pages, workers, chunks and
+    peak_rss_kb (the largest peak RSS of any process that did extraction,
+    which is the number to size per-worker memory limits by).
+
+    File-object sources are read into bytes once for the worker processes;
+    path sources are reopened by each worker.
+    """
+    texts, stats = _extract_pages(source, workers, words=False)
+    return "\n".join(texts).strip(), stats
+
+
+def extract_pdfplumber_words(source: PdfSource, workers: Optional[int] = None) -> List[List[dict]]:
+    """
+    Words of every page with their font name and size (LAYOUT_WORD_KEYS),
+    for the layout-aware section segmenter. Extracted like
+    extract_pdfplumber_pages: page-parallel on long documents, one page's
+    layout objects in memory at a time.
+    """
+    with timed("pdf_extract_seconds", "extract", backend="layout"):
+        pages, _ = _extract_pages(source, workers, words=True)
+    return pages
+
+
+def _extract_with_pdfplumber(source: PdfSource) -> str:
+    """Full layout-aware extraction (slowest, most faithful)."""
+    text, _ = extract_pdfplumber_pages(source)
+    return text
+
+
+def _extract_with_pypdf(source: PdfSource) -> str:
+    """Content-stream extraction via PyPDF2 (fastest, no layout analysis)."""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(source)
+    pages = [page.extract_text() or "" for page in reader.pages]
+    return "\n".join(pages).strip()
+
+
+def _extract_with_pdfminer(source: PdfSource) -> str:
+    """
+    pdfminer extraction with advanced layout analysis disabled.
+    boxes_flow=None skips the hierarchical text-box ordering pass, which is
+    where most of pdfminer's (and therefore pdfplumber's) time goes.
+    """
+    from pdfminer.high_level import extract_text
+    from pdfminer.layout import LAParams
+
+    laparams = LAParams(boxes_flow=None, detect_vertical=False, all_texts=False)
+    return (extract_text(source, laparams=laparams) or "").strip()
+
+
+EXTRACTION_BACKENDS: Dict[str, Callable[[PdfSource], str]] = {
+    "pdfplumber": _extract_with_pdfplumber,
+    "pypdf": _extract_with_pypdf,
+    "pdfminer": _extract_with_pdfminer,
+}
+
+# Order tried by "auto": fastest first, most faithful last
+AUTO_BACKEND_ORDER = ["pypdf", "pdfplumber"]
+
+_CID_RE = re.compile(r"\(cid:\d+\)")
+_WORD_RE = re.compile(r"\S+")
+
+
+def looks_garbled(text: str) -> bool:
+    """
+    Heuristic check for extraction output that should not be sent to the LLM:
+    - (almost) no text, e.g. scanned or image-only pages
+    - unmapped glyphs showing up as (cid:NN) markers or replacement chars
+    - mostly non-printable / non-word characters
+    - words glued together because inter-word spacing was lost
+    """
+    stripped = text.strip() if text else ""
+    if len(stripped) < 50:
+        return True
+
+    if len(_CID_RE.findall(stripped)) > 5 or stripped.count("�") > 5:
+        return True
+
+    readable = sum(1 for ch in stripped if ch.isalnum() or ch.isspace() or ch in ".,;:()-–—|/@&+%$#'\"•·")
+    if readable / len(stripped) < 0.85:
+        return True
+
+    words = _WORD_RE.findall(stripped)
+    avg_word_length = sum(len(w) for w in words) / len(words) if words else 0
+    if avg_word_length > 12:
+        return True
+
+    return False
+
+
+def _run_backend(name: str, source: PdfSource) -> str:
+    with timed("pdf_extract_seconds", "extract", backend=name):
+        return EXTRACTION_BACKENDS[name](rewind_source(source))
+
+
+def extract_text_from_pdf(source: PdfSource, backend: Optional[str] = None) -> str:
+    """
+    Extract raw text from a PDF path or binary file object using the
+    selected backend.
+
+    backend: "pdfplumber", "pypdf", "pdfminer", or "auto" (default from
+    settings.pdf_extract_backend). "auto" tries the fast backend first and
+    falls back to pdfplumber when the output looks garbled.
+    """
+    backend = (backend or settings.pdf_extract_backend or "auto").lower()
+
+    if backend != "auto":
+        if backend not in EXTRACTION_BACKENDS:
+            raise ValueError(
+                f"Unknown PDF extraction backend '{backend}'. "
+                f"Choose one of: auto, {', '.join(EXTRACTION_BACKENDS)}"
+            )
+        return _run_backend(backend, source)
+
+    fast_backends, final_backend = AUTO_BACKEND_ORDER[:-1], AUTO_BACKEND_ORDER[-1]
+    for name in fast_backends:
+        try:
+            text = _run_backend(name, source)
+        except Exception:
+            # A fast backend choking on an odd PDF should not fail the request
+            continue
+        if not looks_garbled(text):
+            return text
+
+    return _run_backend(final_backend, source)
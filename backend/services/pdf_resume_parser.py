@@ -1,29 +1,20 @@
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from services.pdf_reader import extract_text_from_pdf
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from core.config import settings
+from services.pdf_metadata import read_embedded_resume
+from services.pdf_reader import PdfSource, extract_text_from_pdf, looks_garbled
+from services.section_segmenter import HEADER_SECTION, extract_layout_lines, segment_resume_sections
+from services.template_parser import MIN_CONFIDENCE as TEMPLATE_MIN_CONFIDENCE, is_pdftex_document, parse_template_resume
 from models.resume_models import Resume
-from services.llm_client import client
-
-
-ENRICHMENT_PATTERNS = {
-    "next.js": r"\bnext\.?js\b",
-    "typescript": r"\btypescript\b",
-    "javascript": r"\bjavascript\b",
-    "html5": r"\bhtml5\b",
-    "css": r"\bcss\b",
-    "react": r"\breact\b",
-    "node.js": r"\bnode\.?js\b",
-    "python": r"\bpython\b",
-    "sql": r"\bsql\b",
-    "postgresql": r"\bpostgresql\b|\bpostgres\b",
-    "mysql": r"\bmysql\b",
-    "jira": r"\bjira\b",
-    "tableau": r"\btableau\b",
-    "power bi": r"\bpower\s*bi\b",
-    "excel": r"\bexcel\b",
-    "loRa": r"\blora\b",
-}
+from services.llm_client import LLMAuthenticationError, chat_completion
+from services.server_timing import stage
+from services.skill_matcher import ENRICHMENT_MATCHER
 
 
 def _merge_and_dedupe_skills(existing: list[str], new_items: list[str]) -> list[str]:
@@ -44,12 +35,7 @@ def _enrich_skills_from_text(raw_text: str, current_skills: list[str]) -> list[s
     if not raw_text:
         return current_skills
 
-    found = []
-    lower_text = raw_text.lower()
-    for canonical, pattern in ENRICHMENT_PATTERNS.items():
-        if re.search(pattern, lower_text, re.IGNORECASE):
-            found.append(canonical)
-
+    found = ENRICHMENT_MATCHER.find_skills(raw_text)
     return _merge_and_dedupe_skills(current_skills, found)
 
 
@@ -85,14 +71,16 @@ def format_date(date_str: str) -> str:
     return date_str
 
 
-def parse_pdf_resume_to_json(file_path: str) -> Resume:
+def parse_pdf_resume_to_json(source: PdfSource, raw_text: Optional[str] = None) -> Resume:
     """
-    1) Extract raw text from the PDF
+    1) Extract raw text from the PDF (a path or an uploaded file object),
+       unless raw_text already holds it
     2) Ask the LLM to convert it into the Resume JSON structure
     3) Validate that JSON against the Resume Pydantic model
     """
 
-    raw_text = extract_text_from_pdf(file_path)
+    if raw_text is None:
+        raw_text = extract_text_from_pdf(source)
 
     prompt = f"""
 You are a resume parser.
@@ -258,7 +246,8 @@ RAW RESUME TEXT:
 \"\"\"{raw_text}\"\"\"
 """
 
-    response = client.chat.completions.create(
+    response = chat_completion(
+        "resume_parse",
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}],
         temperature=0,
@@ -275,6 +264,11 @@ RAW RESUME TEXT:
             + raw_content[:500]
         ) from e
 
+    return _finalize_resume(parsed, raw_text)
+
+
+def _finalize_resume(parsed: dict, raw_text: str) -> Resume:
+    """Validate parsed JSON, enrich skills from the raw text and normalize dates."""
     # 2) Validate against the Resume model
     resume_obj = Resume.model_validate(parsed)
 
@@ -294,4 +288,246 @@ RAW RESUME TEXT:
         if exp.end_date and exp.end_date != "Present":
             exp.end_date = format_date(exp.end_date)
     
-    return resume_obj
\ No newline at end of file
+    return resume_obj
+
+
+# -----------------------------------------------------------------------------
+# Section-parallel parsing
+# -----------------------------------------------------------------------------
+
+_ENTRY_DATES = '"start_date": "string (Month YYYY)", "end_date": "string (Month YYYY or Present)"'
+
+# Per-section output schema and section-specific rules. Every section also
+# reports the skills/tools it mentions so the merged skills list matches what
+# the single-call parser extracts from the whole document.
+SECTION_SCHEMAS = {
+    "header": (
+        '''{
+  "name": "string",
+  "headline": "string (professional headline/title below the name, if present)",
+  "summary": "string (professional summary/objective, if present)",
+  "contact": {"email": "string", "phone": "string", "linkedin": "string", "location": "string"},
+  "skills": ["string", ...]
+}''',
+        "The name is the first line of the resume. Extract the COMPLETE full name exactly as written; "
+        "if it looks truncated, use the email address for clues.",
+    ),
+    "summary": (
+        '{"summary": "string", "skills": ["string", ...]}',
+        "Copy the professional summary/objective text.",
+    ),
+    "education": (
+        '''{
+  "education": [{"school": "string", "degree": "string (e.g. 'Bachelor of Science')", "major": "string (e.g. 'Computer Science')",
+                 "location": "string", "graduation_date": "string (Month YYYY)", "gpa": "string",
+                 "scholarships": "string (comma-separated scholarships/honors)"}],
+  "skills": ["string", ...]
+}''',
+        "Split 'Bachelor of Science in Computer Science' into degree='Bachelor of Science' and major='Computer Science'. "
+        "Use the key 'school', never 'institution'.",
+    ),
+    "experience": (
+        f'''{{
+  "experience": [{{"title": "string", "company": "string", "location": "string", {_ENTRY_DATES}, "bullets": ["string", ...]}}],
+  "skills": ["string", ...]
+}}''',
+        "One entry per role, bullets copied verbatim.",
+    ),
+    "projects": (
+        '''{
+  "projects": [{"name": "string", "role": "string", "semester": "string (e.g. 'Fall 2025' or 'Month YYYY')", "bullets": ["string", ...]}],
+  "skills": ["string", ...]
+}''',
+        "Put ANY date or semester in 'semester', never in 'role'.",
+    ),
+    "leadership": (
+        f'''{{
+  "leadership": [{{"organization": "string", "role": "string", "location": "string", {_ENTRY_DATES}, "bullets": ["string", ...]}}],
+  "skills": ["string", ...]
+}}''',
+        "One entry per organization/role.",
+    ),
+    "volunteer_work": (
+        f'''{{
+  "volunteer_work": [{{"organization": "string", "role": "string", "location": "string", {_ENTRY_DATES}, "bullets": ["string", ...]}}],
+  "skills": ["string", ...]
+}}''',
+        "Only actual volunteer service; professional associations belong in memberships, not here.",
+    ),
+    "awards": (
+        '{"awards": [{"title": "string", "organization": "string", "date": "string (Month YYYY or YYYY)", "description": "string"}]}',
+        "One entry per award.",
+    ),
+    "publications": (
+        '{"publications": [{"title": "string", "authors": "string", "venue": "string", "date": "string (Month YYYY or YYYY)", "url": "string"}]}',
+        "One entry per publication.",
+    ),
+    "additional_info": (
+        '''{
+  "additional_info": {
+    "computer_skills": "string (raw skills line, separators preserved, for technical/IT roles)",
+    "technical_skills": "string (alternative to computer_skills for non-tech roles)",
+    "certifications": ["string", ...],
+    "languages": ["string", ...],
+    "work_eligibility": "string",
+    "professional_memberships": ["string", ...],
+    "other": "string"
+  },
+  "skills": ["string", ...]
+}''',
+        "Put the dedicated skills line in computer_skills (or technical_skills) AND list each skill in 'skills'.",
+    ),
+}
+
+# Sections that must be found for the segmentation to be trusted
+_REQUIRED_SECTIONS = {HEADER_SECTION}
+_MIN_BODY_SECTIONS = 2
+
+
+def _strip_code_fences(raw: str) -> str:
+    if raw.startswith("```"):
+        first_newline = raw.find("\n")
+        last_fence = raw.rfind("```")
+        if first_newline != -1 and last_fence != -1:
+            raw = raw[first_newline + 1:last_fence].strip()
+    return raw
+
+
+def _parse_section(key: str, text: str) -> dict:
+    """Parse one resume section with its small section-specific schema."""
+    schema, section_rules = SECTION_SCHEMAS[key]
+    prompt = f"""
+You are a resume parser. Below is ONE section of a resume ({key.replace("_", " ")}).
+Convert it into a JSON object with EXACTLY this structure:
+
+{schema}
+
+RULES:
+- Extract ONLY information that appears in the text. Do NOT invent anything.
+- Missing fields: empty string or empty list.
+- Format dates as "Month YYYY" (e.g. "December 2026"); use "YYYY" if only the year is known.
+- "skills": concrete tools, technologies, methodologies and competencies mentioned in this section.
+- {section_rules}
+- Return ONLY valid JSON. No comments, no markdown, no explanations.
+
+SECTION TEXT:
+\"\"\"{text}\"\"\"
+"""
+
+    response = chat_completion(
+        "resume_parse",
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0,
+    )
+
+    raw_content = _strip_code_fences(response.choices[0].message.content.strip())
+    try:
+        return json.loads(raw_content)
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f"LLM did not return valid JSON for the {key} section. First 500 chars:\n"
+            + raw_content[:500]
+        ) from e
+
+
+def _merge_section_results(results: list[dict]) -> dict:
+    """Assemble per-section JSON objects (in document order) into one Resume dict."""
+    merged: dict = {"skills": []}
+    for result in results:
+        for field, value in result.items():
+            if value in (None, "", [], {}):
+                continue
+            if isinstance(value, list):
+                merged.setdefault(field, []).extend(value)
+            elif isinstance(value, dict):
+                target = merged.setdefault(field, {})
+                for sub_field, sub_value in value.items():
+                    if sub_value in (None, "", []):
+                        continue
+                    if isinstance(sub_value, list):
+                        target.setdefault(sub_field, []).extend(sub_value)
+                    else:
+                        target.setdefault(sub_field, sub_value)
+            else:
+                merged.setdefault(field, value)
+
+    merged["skills"] = _merge_and_dedupe_skills([], [s for s in merged["skills"] if isinstance(s, str)])
+    return merged
+
+
+def parse_pdf_resume_by_sections(source: PdfSource, lines: Optional[List[dict]] = None) -> Resume:
+    """
+    Segment the resume locally, parse each section with a small schema in
+    parallel, and assemble the results into a Resume.
+
+    Falls back to the single-call parse_pdf_resume_to_json when the layout
+    segmentation is not trustworthy (no header, too few recognised sections,
+    no name found) or any section fails to parse. The fallback reuses the
+    layout pass's text rather than extracting the PDF again.
+    """
+    raw_text, sections = segment_resume_sections(source, lines=lines)
+    fallback_text = None if looks_garbled(raw_text) else raw_text
+
+    keys = {section["key"] for section in sections}
+    if not _REQUIRED_SECTIONS <= keys or len(keys - {HEADER_SECTION}) < _MIN_BODY_SECTIONS:
+        return parse_pdf_resume_to_json(source, fallback_text)
+
+    try:
+        # Pool threads do not see the request's Server-Timing dict; time the parallel phase as a whole
+        with stage("parse_llm"), ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            results = list(pool.map(lambda section: _parse_section(section["key"], section["text"]), sections))
+    except LLMAuthenticationError:
+        raise
+    except Exception:
+        return parse_pdf_resume_to_json(source, fallback_text)
+
+    merged = _merge_section_results(results)
+    if not merged.get("name"):
+        return parse_pdf_resume_to_json(source, fallback_text)
+
+    return _finalize_resume(merged, raw_text)
+
+
+def _layout_text(lines: List[dict]) -> Optional[str]:
+    """Text of the layout lines for the single-call parser, or None to extract it afresh when garbled."""
+    text = "\n".join(line["text"] for line in lines)
+    return None if looks_garbled(text) else text
+
+
+def _parse_own_template(lines: List[dict]) -> Optional[Resume]:
+    """Rule-based rebuild of PDFs rendered from resume_template.tex, or None if not confident."""
+    parsed, confidence = parse_template_resume(lines)
+    if parsed is None or confidence < TEMPLATE_MIN_CONFIDENCE:
+        return None
+    try:
+        return _finalize_resume(parsed, "\n".join(line["text"] for line in lines))
+    except ValidationError:
+        return None
+
+
+def parse_pdf_resume(source: PdfSource) -> Resume:
+    """
+    Parse a resume PDF:
+    1) PDFs we rendered ourselves carry the Resume JSON as an attachment;
+       load it directly (no extraction, no LLM call)
+    2) PDFs rendered from resume_template.tex without a payload are rebuilt
+       deterministically from their layout, with no LLM call
+    3) everything else uses the configured strategy ("sections" or "single")
+    """
+    embedded = read_embedded_resume(source)
+    if embedded is not None:
+        return embedded
+
+    lines = None
+    # The "single" strategy doesn't need layout lines, so only pay for them
+    # when the PDF could have come from our LaTeX template
+    if settings.resume_parse_strategy != "single" or is_pdftex_document(source):
+        lines = extract_layout_lines(source)
+        resume = _parse_own_template(lines)
+        if resume is not None:
+            return resume
+
+    if settings.resume_parse_strategy == "single":
+        return parse_pdf_resume_to_json(source, _layout_text(lines) if lines else None)
+    return parse_pdf_resume_by_sections(source, lines=lines)
\ No newline at end of file
@@ -1,133 +1,363 @@
+import asyncio
 import os
+import re
 import subprocess
 import tempfile
 import shutil
-from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader
+import time
+from typing import Dict, List, Optional, Tuple
 
+from core.config import settings
 from models.resume_models import Resume
+from services import latex_pool
+from services.latex_format import discard_format, get_preamble_format
+from services.metrics import observe, timed
+from services.page_layout import layout_params
+from services.pdf_metadata import embed_resume_payload
+from services.server_timing import add_stage
 
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "templates")
 
 
+RESUME_TEMPLATE = "resume_template.tex"
+PREAMBLE_TEMPLATE = "resume_preamble.tex"
+RENDER_TIMING_HEADER = "X-Render-Timing"
+# "latex": pdflatex + resume_template.tex; "native": in-process layout (services/pdf_native.py)
+PDF_RENDER_BACKENDS = ("latex", "native")
+
+# Special LaTeX characters -> escapes, applied in a single str.translate pass.
+# One pass means replacements are never re-escaped (the old chained
+# str.replace turned "\" into "\textbackslash\{\}"), so order does not matter.
+LATEX_ESCAPES = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+})
+
+
 def escape_latex(text: str) -> str:
-    """
-    Escape special LaTeX characters in text.
-    IMPORTANT: Backslash must be escaped FIRST before other characters!
-    """
+    """Escape special LaTeX characters in text."""
     if not text:
         return ""
     
     if not isinstance(text, str):
         text = str(text)
     
-    # Escape backslash first, then other characters
-    # Order matters! Do backslash first so other escapes work correctly
-    text = text.replace('\\', r'\textbackslash{}')
+    return text.translate(LATEX_ESCAPES)
+
+
+_env = None
+_resume_template = None
+
+
+def get_latex_env():
+    """
+    Custom Jinja2 environment for LaTeX, created on first use (keeps jinja2
+    off the startup path). Uses VAR{} instead of {{ }} to avoid conflicts
+    with LaTeX. In production templates are compiled once and cached; set
+    TEMPLATE_HOT_RELOAD=true while editing them to re-read on every render.
+    """
+    global _env
+    if _env is None:
+        from jinja2 import Environment, FileSystemLoader
+
+        env = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR),
+            block_start_string='%{',
+            block_end_string='%}',
+            variable_start_string='VAR{',
+            variable_end_string='}',
+            comment_start_string='%#{',
+            comment_end_string='#%}',
+            trim_blocks=True,
+            autoescape=False,
+            auto_reload=settings.template_hot_reload,
+            cache_size=0 if settings.template_hot_reload else 50,
+        )
+        # Add escape_latex as a filter
+        env.filters['escape_latex'] = escape_latex
+        _env = env
+    return _env
+
+
+def _load_resume_template():
+    env = get_latex_env()
+    env.get_template(PREAMBLE_TEMPLATE)  # compiled into the cache for the include
+    return env.get_template(RESUME_TEMPLATE)
+
+
+def get_resume_template():
+    """The compiled resume template: compiled once on first use (app warm-up) unless hot reload is on."""
+    global _resume_template
+    if settings.template_hot_reload:
+        return _load_resume_template()
+    if _resume_template is None:
+        _resume_template = _load_resume_template()
+    return _resume_template
+
+
+def resolve_render_backend(name: Optional[str] = None) -> str:
+    """Validate a requested render backend, defaulting to settings.pdf_render_backend."""
+    backend = (name or settings.pdf_render_backend).strip().lower()
+    if backend not in PDF_RENDER_BACKENDS:
+        raise ValueError(f"Unknown PDF renderer '{backend}'. Choose one of: {', '.join(PDF_RENDER_BACKENDS)}")
+    return backend
+
+
+def format_render_timings(timings: Dict[str, float]) -> str:
+    """Header value for RENDER_TIMING_HEADER, e.g. "template=1.8ms, latex=412.0ms"."""
+    return ", ".join(f"{stage}={ms:.1f}ms" for stage, ms in timings.items())
+
+
+# pdflatex/package log messages asking for another pass
+RERUN_PATTERN = re.compile(
+    r"Rerun to get|Label\(s\) may have changed|Please rerun LaTeX|Rerun LaTeX",
+    re.IGNORECASE,
+)
+# .aux entries that only take effect on the next pass (labels, citations, TOC lines)
+AUX_REFERENCE_PATTERN = re.compile(rb"\\newlabel|\\bibcite|\\@writefile")
+MAX_LATEX_PASSES = 2
+
+
+def _read_file(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _needs_rerun(temp_dir: str, aux_before: Optional[bytes]) -> bool:
+    """
+    True when the pass that just finished left work for another pass: LaTeX
+    asked for a rerun in the log, or the .aux gained or changed references.
+    The resume template has no labels or TOC, so this is normally False.
+    """
+    log = _read_file(os.path.join(temp_dir, "resume.log")) or b""
+    if RERUN_PATTERN.search(log.decode("utf-8", errors="ignore")):
+        return True
+
+    aux_after = _read_file(os.path.join(temp_dir, "resume.aux"))
+    return aux_after != aux_before and bool(aux_after and AUX_REFERENCE_PATTERN.search(aux_after))
+
+
+PDFLATEX_NOT_FOUND = (
+    "pdflatex not found. Please install TeX Live or MiKTeX.\n"
+    "Linux: sudo apt-get install texlive-latex-base texlive-fonts-recommended\n"
+    "Mac: brew install --cask mactex-no-gui\n"
+    "Windows: Download and install MiKTeX from https://miktex.org/"
+)
+
+
+def _prepare_compile(temp_dir: str, latex_str: str, fmt_path: Optional[str]) -> Tuple[List[str], Optional[Dict[str, str]]]:
+    """
+    Write latex_str to resume.tex in temp_dir and return the pdflatex command
+    and environment. fmt_path is a precompiled preamble format to start from
+    (see latex_format).
+    """
+    # Write LaTeX file
+    tex_path = os.path.join(temp_dir, "resume.tex")
+    with open(tex_path, "w", encoding="utf-8") as f:
+        f.write(latex_str)
+
+    command = ["pdflatex", "-interaction=nonstopmode"]
+    run_env = None
+    if fmt_path:
+        # -fmt takes a format name; point kpathsea at our format directory
+        command.append("-fmt=" + os.path.splitext(os.path.basename(fmt_path))[0])
+        run_env = {**os.environ, "TEXFORMATS": os.path.dirname(fmt_path) + os.pathsep}
+    command += ["-output-directory", temp_dir, tex_path]
+    return command, run_env
+
+
+def _compile_error(temp_dir: str, stderr: str) -> RuntimeError:
+    """Build the error for a failed pdflatex run from its stderr and log."""
+    # Check if pdflatex is installed
+    if "not found" in stderr or "No such file" in stderr:
+        return RuntimeError(PDFLATEX_NOT_FOUND)
+    
+    # LaTeX compilation error
+    log_path = os.path.join(temp_dir, "resume.log")
+    error_msg = "LaTeX compilation failed."
+    if os.path.exists(log_path):
+        with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
+            log_content = f.read()
+            # Extract error lines
+            error_lines = [line for line in log_content.split('\n') if '!' in line or 'Error' in line]
+            if error_lines:
+                error_msg += f"\n{chr(10).join(error_lines[:5])}"
     
-    # Then escape other special characters
-    replacements = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\textasciicircum{}',
-    }
+    return RuntimeError(error_msg)
+
+
+def _compile_latex(temp_dir: str, latex_str: str, fmt_path: Optional[str] = None, min_passes: int = 1) -> int:
+    """
+    Compile latex_str with pdflatex in temp_dir (blocking).
+    A second pass only runs when the first one asks for it (or min_passes=2).
+    Returns the number of passes run.
+    """
+    command, run_env = _prepare_compile(temp_dir, latex_str, fmt_path)
+
+    # Compile with pdflatex
+    aux_path = os.path.join(temp_dir, "resume.aux")
+    for passes in range(1, MAX_LATEX_PASSES + 1):
+        aux_before = _read_file(aux_path)
+        try:
+            with timed("pdflatex_pass_seconds", f"render_pass{passes}", pdflatex_pass=passes):
+                result = subprocess.run(
+                    command,
+                    cwd=temp_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=settings.latex_compile_timeout,
+                    env=run_env,
+                )
+        except FileNotFoundError:
+            raise RuntimeError(PDFLATEX_NOT_FOUND)
+        
+        if result.returncode != 0:
+            raise _compile_error(temp_dir, result.stderr)
+
+        if passes >= min_passes and not _needs_rerun(temp_dir, aux_before):
+            break
+
+    return passes
+
+
+async def _compile_latex_async(temp_dir: str, latex_str: str, fmt_path: Optional[str] = None) -> int:
+    """_compile_latex on an asyncio subprocess, so the event loop is never blocked."""
+    command, run_env = _prepare_compile(temp_dir, latex_str, fmt_path)
+
+    aux_path = os.path.join(temp_dir, "resume.aux")
+    for passes in range(1, MAX_LATEX_PASSES + 1):
+        aux_before = _read_file(aux_path)
+        pass_start = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=temp_dir,
+                env=run_env,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(PDFLATEX_NOT_FOUND)
+
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=settings.latex_compile_timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(f"LaTeX compilation timed out after {settings.latex_compile_timeout}s.")
+        finally:
+            observe(
+                "pdflatex_pass_seconds", time.perf_counter() - pass_start, f"render_pass{passes}", pdflatex_pass=passes
+            )
+
+        if process.returncode != 0:
+            raise _compile_error(temp_dir, stderr.decode("utf-8", errors="ignore"))
+
+        if not _needs_rerun(temp_dir, aux_before):
+            break
+
+    return passes
+
+
+def _render_latex(resume: Resume, fmt_path: Optional[str], timings: Dict[str, float]) -> str:
+    # Render the LaTeX template
+    # LaTeX escaping is handled by the |escape_latex filter in the template
+    start = time.perf_counter()
+    latex_str = get_resume_template().render(
+        resume=resume,
+        layout=layout_params(resume),
+        preamble_format=fmt_path is not None,
+    )
+    elapsed = time.perf_counter() - start
+    timings["template"] = elapsed * 1000
+    observe("template_render_seconds", elapsed, "template", template="latex")
+    return latex_str
+
+
+def _read_output_pdf(temp_dir: str) -> bytes:
+    # Read the generated PDF
+    pdf_path = os.path.join(temp_dir, "resume.pdf")
+    if not os.path.exists(pdf_path):
+        raise RuntimeError("PDF file was not generated by pdflatex")
     
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+
+def _embed_resume(pdf_bytes: bytes, resume: Resume) -> bytes:
+    # Attach the structured Resume so a re-upload of this PDF skips parsing
+    if settings.embed_resume_json:
+        try:
+            pdf_bytes = embed_resume_payload(pdf_bytes, resume)
+        except Exception:
+            pass  # The plain PDF is still a valid result
     
-    return text
-
-
-# Custom Jinja2 environment for LaTeX
-# Use VAR{} instead of {{ }} to avoid conflicts with LaTeX
-env = Environment(
-    loader=FileSystemLoader(TEMPLATES_DIR),
-    block_start_string='%{',
-    block_end_string='%}',
-    variable_start_string='VAR{',
-    variable_end_string='}',
-    comment_start_string='%#{',
-    comment_end_string='#%}',
-    trim_blocks=True,
-    autoescape=False,
-    auto_reload=True,  # Force template reload on every render
-    cache_size=0,  # Disable template caching
-)
+    return pdf_bytes
+
+
+def _render_native(resume: Resume, timings: Dict[str, float]) -> bytes:
+    from services.pdf_native import render_resume_pdf_native
 
-# Add escape_latex as a filter
-env.filters['escape_latex'] = escape_latex
+    start = time.perf_counter()
+    pdf_bytes = render_resume_pdf_native(resume)
+    elapsed = time.perf_counter() - start
+    timings["layout"] = elapsed * 1000
+    add_stage("render", elapsed)
+    return _embed_resume(pdf_bytes, resume)
 
 
-def render_resume_pdf(resume: Resume) -> bytes:
+def render_resume_pdf(
+    resume: Resume,
+    timings: Optional[Dict[str, float]] = None,
+    backend: Optional[str] = None,
+) -> bytes:
     """
     Render a Resume model into a PDF bytes object using a LaTeX template.
     Uses pdflatex for professional typography and precise formatting.
+    If a timings dict is given, per-stage durations in ms ("template",
+    "latex", or "layout" for the native backend) are recorded into it.
+    backend overrides settings.pdf_render_backend ("latex" or "native").
+
+    Blocking; request handlers use render_resume_pdf_async instead.
     """
+    if timings is None:
+        timings = {}
+    if resolve_render_backend(backend) == "native":
+        return _render_native(resume, timings)
     # Create a temporary directory for LaTeX compilation
     temp_dir = tempfile.mkdtemp()
     
     try:
-        # Render the LaTeX template
-        # LaTeX escaping is handled by the |escape_latex filter in the template
-        template = env.get_template("resume_template.tex")
-        latex_str = template.render(resume=resume)
-        
-        # Write LaTeX file
-        tex_path = os.path.join(temp_dir, "resume.tex")
-        with open(tex_path, "w", encoding="utf-8") as f:
-            f.write(latex_str)
+        # Start from the precompiled preamble when available; the template
+        # then leaves the preamble out and only emits the per-resume part
+        fmt_path = get_preamble_format()
+        latex_str = _render_latex(resume, fmt_path, timings)
         
-        # Compile with pdflatex
-        # Run twice to resolve references and get correct spacing
-        for _ in range(2):
-            result = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, tex_path],
-                cwd=temp_dir,
-                capture_output=True,
-                text=True,
-                timeout=120  # Longer timeout for first-time package installation
-            )
-            
-            if result.returncode != 0:
-                # Check if pdflatex is installed
-                if "not found" in result.stderr or "No such file" in result.stderr:
-                    raise RuntimeError(
-                        "pdflatex not found. Please install TeX Live or MiKTeX.\n"
-                        "Linux: sudo apt-get install texlive-latex-base texlive-fonts-recommended\n"
-                        "Mac: brew install --cask mactex-no-gui\n"
-                        "Windows: Download and install MiKTeX from https://miktex.org/"
-                    )
-                
-                # LaTeX compilation error
-                log_path = os.path.join(temp_dir, "resume.log")
-                error_msg = "LaTeX compilation failed."
-                if os.path.exists(log_path):
-                    with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-                        log_content = f.read()
-                        # Extract error lines
-                        error_lines = [line for line in log_content.split('\n') if '!' in line or 'Error' in line]
-                        if error_lines:
-                            error_msg += f"\n{chr(10).join(error_lines[:5])}"
-                
-                raise RuntimeError(error_msg)
-        
-        # Read the generated PDF
-        pdf_path = os.path.join(temp_dir, "resume.pdf")
-        if not os.path.exists(pdf_path):
-            raise RuntimeError("PDF file was not generated by pdflatex")
-        
-        with open(pdf_path, "rb") as f:
-            pdf_bytes = f.read()
+        start = time.perf_counter()
+        try:
+            _compile_latex(temp_dir, latex_str, fmt_path)
+        except RuntimeError:
+            if fmt_path is None:
+                raise
+            # Retry with the full preamble; if that works the format itself
+            # is bad (e.g. TeX Live upgraded in place), so stop using it
+            _compile_latex(temp_dir, _render_latex(resume, None, {}))
+            discard_format(fmt_path)
+        timings["latex"] = (time.perf_counter() - start) * 1000
         
-        return pdf_bytes
+        return _embed_resume(_read_output_pdf(temp_dir), resume)
     
     finally:
         # Clean up temporary directory
@@ -137,4 +367,40 @@ def render_resume_pdf(resume: Resume) -> bytes:
             pass  # Ignore cleanup errors
 
 
+async def render_resume_pdf_async(
+    resume: Resume,
+    timings: Optional[Dict[str, float]] = None,
+    backend: Optional[str] = None,
+) -> bytes:
+    """
+    render_resume_pdf for request handlers: pdflatex runs as an asyncio
+    subprocess in one of latex_pool's reusable RAM-backed work directories,
+    with at most LATEX_WORKERS compiles at a time. Also records "queue"
+    (ms spent waiting for a compile slot) into timings.
+
+    Raises latex_pool.RenderQueueFull when too many renders are already waiting.
+    """
+    if timings is None:
+        timings = {}
+    if resolve_render_backend(backend) == "native":
+        # No subprocess to wait on; keep the layout work off the event loop
+        return await asyncio.to_thread(_render_native, resume, timings)
+
+    # Built once; only the very first render (without a Docker-prebuilt format) waits on it
+    fmt_path = await asyncio.to_thread(get_preamble_format)
+    latex_str = _render_latex(resume, fmt_path, timings)
+
+    async with latex_pool.compile_slot(timings) as work_dir:
+        start = time.perf_counter()
+        try:
+            await _compile_latex_async(work_dir, latex_str, fmt_path)
+        except RuntimeError:
+            if fmt_path is None:
+                raise
+            await _compile_latex_async(work_dir, _render_latex(resume, None, {}))
+            discard_format(fmt_path)
+        timings["latex"] = (time.perf_counter() - start) * 1000
+        pdf_bytes = _read_output_pdf(work_dir)
 
+    # Outside the slot: embedding does not need pdflatex's work directory
+    return _embed_resume(pdf_bytes, resume)
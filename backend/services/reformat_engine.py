@@ -1,37 +1,21 @@
-import json
 from typing import Optional
 from models.resume_models import Resume
 from services.llm_client import generate_headline_summary
+from services.page_estimate import free_lines
 from services.tailor_engine import (
-    estimate_resume_fullness,
+    needs_compact_mode,
     conditionally_remove_headline_summary,
     format_skills_list,
 )
 
+# Lines a generated headline (1) and 2-3 sentence summary (3) plus their spacing take
+HEADLINE_SUMMARY_LINES = 5
 
-def _compute_compact_mode(resume: Resume) -> int:
-    """
-    Mirror the compactness logic from tailor_engine to decide spacing.
-    Returns the fullness score for downstream decisions.
-    """
-    fullness_score = estimate_resume_fullness(resume)
-
-    total_bullets = (
-        sum(len(exp.bullets) for exp in resume.experience) +
-        sum(len(proj.bullets) for proj in resume.projects) +
-        sum(len(lead.bullets) for lead in resume.leadership) +
-        sum(len(vol.bullets) for vol in resume.volunteer_work)
-    )
-
-    has_work_experience = len(resume.experience) > 0
-
-    resume.compact_mode = (
-        has_work_experience and
-        total_bullets >= 15 and
-        fullness_score >= 35
-    )
 
-    return fullness_score
+def _compute_compact_mode(resume: Resume) -> bool:
+    """Same compactness rule as tailor_engine (estimated one-page overflow)."""
+    resume.compact_mode = needs_compact_mode(resume)
+    return resume.compact_mode
 
 
 def _strip_text(text: Optional[str]) -> Optional[str]:
@@ -115,7 +99,7 @@ def _generate_headline_summary_if_missing(resume: Resume) -> Resume:
     if not needs_headline and not needs_summary:
         return resume
 
-    resume_json = json.loads(resume.model_dump_json())
+    resume_json = resume.model_dump(mode="json")
     generated = generate_headline_summary(resume_json)
 
     if needs_headline and generated.get("headline"):
@@ -133,14 +117,14 @@ def reformat_resume(resume: Resume) -> Resume:
     - Normalize spacing/strings
     - Preserve bullets; no rewriting
     - Drop headline/summary when compact/full
-    - Add headline/summary ONLY when missing and resume is not compact
+    - Add headline/summary ONLY when missing and the page has room for them
     """
     resume = _trim_resume_strings(resume)
     _compute_compact_mode(resume)
 
     if resume.compact_mode:
         resume = conditionally_remove_headline_summary(resume)
-    else:
+    elif free_lines(resume) >= HEADLINE_SUMMARY_LINES:
         resume = _generate_headline_summary_if_missing(resume)
 
     # Format skills (tools stay as-is, concept phrases title-cased)
@@ -0,0 +1,86 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Tuple
+
+from core.config import settings
+from models.resume_models import Resume
+from services.history_store import link_owner, load_resume, save_resume
+from services.metrics import record_cache
+from services.pdf_resume_parser import parse_pdf_resume
+from services.serialization import decode_model, encode_model
+
+
+CACHE_HEADER = "X-Resume-Cache"
+CACHE_HIT = "HIT"
+CACHE_MISS = "MISS"
+
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# content hash -> validated Resume (after skill enrichment and date formatting)
+# as an encode_model payload rather than a model instance, so every request
+# gets its own mutable Resume and nothing downstream can edit the cached copy.
+_parsed_resume_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def hash_pdf(f: BinaryIO) -> str:
+    """SHA-256 of a binary file object, read in chunks. Leaves the file rewound."""
+    f.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    f.seek(0)
+    return digest.hexdigest()
+
+
+def get_cached_resume(content_hash: str) -> Optional[Resume]:
+    with _cache_lock:
+        cached = _parsed_resume_cache.get(content_hash)
+        record_cache("resume", cached is not None)
+        if cached is None:
+            return None
+        _parsed_resume_cache.move_to_end(content_hash)
+    return decode_model(cached, Resume)
+
+
+def store_parsed_resume(content_hash: str, resume: Resume) -> None:
+    if settings.resume_cache_size <= 0:
+        return
+    payload = encode_model(resume)
+    with _cache_lock:
+        _parsed_resume_cache[content_hash] = payload
+        _parsed_resume_cache.move_to_end(content_hash)
+        while len(_parsed_resume_cache) > settings.resume_cache_size:
+            _parsed_resume_cache.popitem(last=False)
+
+
+def parse_pdf_resume_cached(f: BinaryIO, owner: Optional[str] = None) -> Tuple[Resume, str, str]:
+    """
+    Parse an uploaded resume, skipping text extraction and the parse LLM call
+    when the exact same PDF bytes have been parsed before (in memory, or
+    in the persistent history). owner, when given, is linked to the upload
+    in the history.
+
+    Returns (resume, content_hash, cache_status) where cache_status is
+    CACHE_HIT or CACHE_MISS.
+    """
+    content_hash = hash_pdf(f)
+
+    cached = get_cached_resume(content_hash)
+    if cached is not None:
+        if owner:
+            link_owner(owner, content_hash)
+        return cached, content_hash, CACHE_HIT
+
+    cached = load_resume(content_hash)
+    if cached is not None:
+        store_parsed_resume(content_hash, cached)
+        if owner:
+            link_owner(owner, content_hash)
+        return cached, content_hash, CACHE_HIT
+
+    resume = parse_pdf_resume(f)
+    store_parsed_resume(content_hash, resume)
+    save_resume(content_hash, resume, owner)
+    return resume, content_hash, CACHE_MISS
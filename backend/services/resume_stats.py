@@ -0,0 +1,96 @@
+"""
+ResumeStats: every count and measurement the fullness/compactness decisions
+need, computed in one walk over the resume and memoized per resume state.
+
+tailor_engine (compact_mode, headline/summary), reformat_engine, the
+page estimate helpers and rewrite_resume_sections all read the same
+ResumeStats, so their numbers agree and a request computes them once.
+
+The memo lives on the Resume instance (a private attribute, never
+serialized) together with a snapshot of the resume's content. Any change,
+including in-place edits of nested lists such as exp.bullets.append(...),
+makes the snapshot differ and the stats are recomputed on the next call.
+"""
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from pydantic import BaseModel
+
+from models.resume_models import Resume
+from services.page_estimate import BULLET_WIDTH, estimate_page_height, wrap_lines
+from services.page_layout import layout_params
+
+
+# Bulleted sections in template order
+BULLET_SECTIONS = ("experience", "projects", "leadership", "volunteer_work")
+# Sections the rewrite prompt lists bullet by bullet (and gets length targets for):
+# every section it rewrites, so no rewritten bullet grows without a budget
+PROMPT_BULLET_SECTIONS = ("experience", "projects", "leadership", "volunteer_work")
+# Average bullet length assumed for resumes without bullets
+DEFAULT_BULLET_LENGTH = 150
+
+
+class ResumeStats(NamedTuple):
+    bullet_counts: Dict[str, List[int]]   # section -> bullets per entry
+    total_bullets: int                    # across all bulleted sections
+    section_count: int                    # non-empty content sections
+    prompt_bullets: List[str]             # experience, projects, leadership, volunteer bullets in order
+    avg_bullet_length: float              # characters, over non-empty prompt_bullets
+    bullet_wraps: List[Tuple[int, float]]  # (lines, last-line fill) of each prompt bullet
+    page_height: float                    # estimated points at the resume's layout
+    loose_page_height: float              # same at normal (non-compact) spacing
+    leading: float                        # line height at the resume's layout
+
+
+def _snapshot(value: Any) -> Any:
+    """Immutable copy of a model's content for change detection (strings are shared, not copied)."""
+    if isinstance(value, BaseModel):
+        return tuple(_snapshot(field) for field in value.__dict__.values())
+    if isinstance(value, list):
+        return tuple(_snapshot(item) for item in value)
+    return value
+
+
+def compute_resume_stats(resume: Resume) -> ResumeStats:
+    params = layout_params(resume)
+    bullet_counts = {section: [len(entry.bullets) for entry in getattr(resume, section)] for section in BULLET_SECTIONS}
+    prompt_bullets = [
+        bullet for section in PROMPT_BULLET_SECTIONS for entry in getattr(resume, section) for bullet in entry.bullets
+    ]
+    lengths = [len(bullet) for bullet in prompt_bullets if bullet]
+
+    page_height = estimate_page_height(resume, params)
+    if resume.compact_mode:
+        loose_page_height = estimate_page_height(resume, layout_params(resume, compact=False))
+    else:
+        loose_page_height = page_height
+
+    return ResumeStats(
+        bullet_counts=bullet_counts,
+        total_bullets=sum(sum(counts) for counts in bullet_counts.values()),
+        section_count=sum(1 for section in (
+            resume.experience,
+            resume.projects,
+            resume.leadership,
+            resume.education,
+            resume.volunteer_work,
+            resume.awards,
+            resume.publications,
+        ) if section),
+        prompt_bullets=prompt_bullets,
+        avg_bullet_length=sum(lengths) / len(lengths) if lengths else DEFAULT_BULLET_LENGTH,
+        bullet_wraps=[wrap_lines(bullet, BULLET_WIDTH, params["font_size"]) for bullet in prompt_bullets],
+        page_height=page_height,
+        loose_page_height=loose_page_height,
+        leading=params["leading"],
+    )
+
+
+def resume_stats(resume: Resume) -> ResumeStats:
+    """ResumeStats for resume's current content, recomputed only after it changed."""
+    snapshot = _snapshot(resume)
+    cached = resume._stats
+    if cached is not None and cached[0] == snapshot:
+        return cached[1]
+    stats = compute_resume_stats(resume)
+    resume._stats = (snapshot, stats)
+    return stats
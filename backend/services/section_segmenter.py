@@ -0,0 +1,185 @@
+"""
+Layout-aware resume section segmenter.
+
+Splits a resume PDF into its sections locally (no LLM) using pdfplumber
+character metadata: font size, bold runs, capitalisation and the heading
+vocabulary the resume parser prompt already knows about. The resulting
+sections can then be parsed independently and in parallel.
+"""
+import re
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+from services.pdf_reader import PdfSource, extract_pdfplumber_words
+
+
+# Normalized heading text -> canonical section key.
+# Keys match the Resume field each section's content is parsed into;
+# skills sections live in additional_info (and feed the skills list).
+HEADING_ALIASES: Dict[str, str] = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "profile": "summary",
+    "professional profile": "summary",
+    "objective": "summary",
+    "career objective": "summary",
+    "education": "education",
+    "academic background": "education",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "relevant experience": "experience",
+    "employment history": "experience",
+    "work history": "experience",
+    "projects": "projects",
+    "academic projects": "projects",
+    "personal projects": "projects",
+    "extracurricular activities": "projects",
+    "leadership": "leadership",
+    "leadership experience": "leadership",
+    "leadership experience and activities": "leadership",
+    "leadership activities": "leadership",
+    "leadership and activities": "leadership",
+    "volunteer": "volunteer_work",
+    "volunteer work": "volunteer_work",
+    "volunteer experience": "volunteer_work",
+    "volunteering": "volunteer_work",
+    "community service": "volunteer_work",
+    "awards": "awards",
+    "honors": "awards",
+    "awards and honors": "awards",
+    "honors and awards": "awards",
+    "publications": "publications",
+    "skills": "additional_info",
+    "technical skills": "additional_info",
+    "computer skills": "additional_info",
+    "core competencies": "additional_info",
+    "certifications": "additional_info",
+    "languages": "additional_info",
+    "additional information": "additional_info",
+    "additional info": "additional_info",
+    "professional memberships": "additional_info",
+}
+
+# Substrings of embedded font names that indicate a bold face
+# (e.g. TimesNewRomanPS-BoldMT, NimbusRomNo9L-Medi from mathptmx, CMBX10)
+BOLD_FONT_MARKERS = ("bold", "medi", "black", "heavy", "demi", "cmbx")
+
+HEADER_SECTION = "header"
+
+# Vertical tolerance (pt) for grouping words into one line
+_LINE_TOLERANCE = 2.0
+_MAX_HEADING_WORDS = 6
+
+
+def _normalize_heading(text: str) -> str:
+    text = text.lower().replace("&", " and ")
+    text = re.sub(r"[^a-z ]", " ", text)
+    return " ".join(text.split())
+
+
+def is_bold(fontname: str) -> bool:
+    lowered = (fontname or "").lower()
+    return any(marker in lowered for marker in BOLD_FONT_MARKERS)
+
+
+def _group_lines(words: List[dict]) -> List[List[dict]]:
+    """Group pdfplumber words into visual lines by their top coordinate."""
+    lines: List[List[dict]] = []
+    for word in sorted(words, key=lambda w: (round(w["top"]), w["x0"])):
+        if lines and abs(lines[-1][0]["top"] - word["top"]) <= _LINE_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return [sorted(line, key=lambda w: w["x0"]) for line in lines]
+
+
+def extract_layout_lines(source: PdfSource) -> List[dict]:
+    """
+    Return one dict per visual line, in reading order:
+    text, size (max font size), bold (ratio of bold characters), x0/x1,
+    page number and the line's words (text, x0, x1, fontname).
+    """
+    lines: List[dict] = []
+    for page_number, words in enumerate(extract_pdfplumber_words(source)):
+        for line_words in _group_lines(words):
+            text = " ".join(w["text"] for w in line_words)
+            chars = sum(len(w["text"]) for w in line_words) or 1
+            bold_chars = sum(len(w["text"]) for w in line_words if is_bold(w["fontname"]))
+            lines.append({
+                "text": text,
+                "size": max(w["size"] for w in line_words),
+                "bold": bold_chars / chars,
+                "x0": line_words[0]["x0"],
+                "x1": line_words[-1]["x1"],
+                "page": page_number,
+                "words": [
+                    {"text": w["text"], "x0": w["x0"], "x1": w["x1"], "fontname": w["fontname"]}
+                    for w in line_words
+                ],
+            })
+    return lines
+
+
+def body_font_size(lines: List[dict]) -> float:
+    sizes = [line["size"] for line in lines for _ in range(len(line["text"]))]
+    return statistics.median(sizes) if sizes else 10.0
+
+
+def heading_key(line: dict, body_size: float) -> str:
+    """Canonical section key if this line is a section heading, else ""."""
+    text = line["text"].strip()
+    if not text or len(text.split()) > _MAX_HEADING_WORDS or any(ch.isdigit() for ch in text):
+        return ""
+
+    key = HEADING_ALIASES.get(_normalize_heading(text.rstrip(":")))
+    if not key:
+        return ""
+
+    letters = [ch for ch in text if ch.isalpha()]
+    is_caps = bool(letters) and all(ch.isupper() for ch in letters)
+    is_styled = line["bold"] >= 0.6 or line["size"] > body_size + 0.5
+    # A bare "Experience" inside a sentence-case bullet must not start a section
+    return key if (is_caps or is_styled) else ""
+
+
+def segment_resume_sections(source: PdfSource, lines: Optional[List[dict]] = None) -> Tuple[str, List[Dict[str, str]]]:
+    """
+    Split a resume PDF into sections. Pass already-extracted layout lines
+    to avoid re-reading the PDF.
+
+    Returns (raw_text, sections) where sections is a list of
+    {"key", "heading", "text"} dicts in document order. Everything above the
+    first recognised heading (name, contact line, headline) is the "header"
+    section. Repeated keys (e.g. "Technical Skills" and "Certifications"
+    both mapping to additional info) are merged into one section.
+    """
+    if lines is None:
+        lines = extract_layout_lines(source)
+    raw_text = "\n".join(line["text"] for line in lines)
+    body_size = body_font_size(lines)
+
+    sections: List[Dict[str, str]] = []
+    by_key: Dict[str, dict] = {}
+    current = {"key": HEADER_SECTION, "heading": "", "lines": []}
+    ordered = [current]
+
+    for line in lines:
+        key = heading_key(line, body_size)
+        if key:
+            if key in by_key:
+                current = by_key[key]
+                current["lines"].append(line["text"])
+            else:
+                current = {"key": key, "heading": line["text"].strip(), "lines": []}
+                by_key[key] = current
+                ordered.append(current)
+            continue
+        current["lines"].append(line["text"])
+
+    for section in ordered:
+        text = "\n".join(section["lines"]).strip()
+        if text:
+            sections.append({"key": section["key"], "heading": section["heading"], "text": text})
+
+    return raw_text, sections
@@ -0,0 +1,61 @@
+"""
+Fast JSON responses and compact binary cache payloads.
+
+Responses: routes return FastJSONResponse, which serializes dicts of
+pydantic models in one pass with pydantic-core's Rust encoder
+(pydantic_core.to_json), skipping FastAPI's recursive jsonable_encoder
+and json.dumps.
+
+Cache payloads: encode_model() stores a model as a 4-byte header (magic,
+type tag, schema version) followed by zlib-compressed compact JSON.
+decode_model() returns None for payloads of another type or an older
+schema version, so caches treat them as misses after a model change.
+"""
+import zlib
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from models.job_models import JobDescription
+from models.resume_models import Resume
+from models.session_models import EditSession
+from services.pdf_metadata import RESUME_SCHEMA_VERSION
+
+
+PAYLOAD_MAGIC = b"RT"
+# Fast compression: cache payloads are written once per request and read often
+PAYLOAD_COMPRESS_LEVEL = 1
+
+# Model -> (type tag, schema version). Bump a version when the model changes incompatibly.
+PAYLOAD_TYPES: Dict[type, tuple] = {
+    Resume: (1, RESUME_SCHEMA_VERSION),
+    JobDescription: (2, 1),
+    EditSession: (3, 1),
+}
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """Compact binary cache payload for a Resume, JobDescription or EditSession."""
+    tag, version = PAYLOAD_TYPES[type(model)]
+    return PAYLOAD_MAGIC + bytes((tag, version)) + zlib.compress(model.model_dump_json().encode("utf-8"), PAYLOAD_COMPRESS_LEVEL)
+
+
+def decode_model(payload: bytes, model_type: Type[M]) -> Optional[M]:
+    """Model from an encode_model payload, or None if it is not a current payload of model_type."""
+    tag, version = PAYLOAD_TYPES[model_type]
+    if payload[:4] != PAYLOAD_MAGIC + bytes((tag, version)):
+        return None
+    return model_type.model_validate_json(zlib.decompress(payload[4:]))
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with pydantic-core; content may contain pydantic models."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,66 @@
+"""
+Per-request stage timings for the Server-Timing response header.
+
+The app middleware opens a timings dict for every request. Instrumented
+stages add their duration to it in ms, either through metrics.timed/observe
+with request_stage=... or directly with add_stage/stage. The middleware
+then sends the dict as e.g.
+    Server-Timing: upload;dur=12.0, extract;dur=41.2, parse_llm;dur=5120.4, total;dur=9870.1
+
+A stage that runs several times in one request (e.g. render_pass1 during
+the one-page fit) is summed. Code in asyncio.to_thread and FastAPI's
+threadpool sees the request's dict; plain ThreadPoolExecutor workers do
+not, so parallel phases are timed around the pool instead.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+# (request start, stage -> ms) of the request being handled
+_request: ContextVar[Optional[Tuple[float, Dict[str, float]]]] = ContextVar("request_timings", default=None)
+
+
+def start_request() -> Dict[str, float]:
+    """Open the timings dict for the current request and return it."""
+    timings: Dict[str, float] = {}
+    _request.set((time.perf_counter(), timings))
+    return timings
+
+
+def add_stage(name: str, seconds: float) -> None:
+    current = _request.get()
+    if current is not None:
+        timings = current[1]
+        timings[name] = timings.get(name, 0.0) + seconds * 1000
+
+
+def mark_stage(name: str) -> None:
+    """Record the time since the request started as stage name (e.g. "upload")."""
+    current = _request.get()
+    if current is not None:
+        add_stage(name, time.perf_counter() - current[0])
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_stage(name, time.perf_counter() - start)
+
+
+def request_timings() -> Optional[Dict[str, float]]:
+    """Stage durations so far (ms, rounded) for a JSON "timings" block, or None outside a request."""
+    current = _request.get()
+    if current is None:
+        return None
+    return {name: round(ms, 1) for name, ms in current[1].items()}
+
+
+def format_server_timing(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{name};dur={ms:.1f}" for name, ms in timings.items())
@@ -0,0 +1,121 @@
+"""
+Shared, precompiled skill matching.
+
+- SkillMatcher scans text ONCE and reports every canonical skill whose
+  phrases appear in it. Phrases are stored in a token trie built at import
+  time, so adding thousands of patterns (loaded from a data file) does not
+  add a per-pattern cost to each scan.
+- The NON_SKILL_PATTERNS filter used by the JD parsers is compiled into a
+  single alternation instead of being re-evaluated pattern by pattern.
+"""
+import json
+import os
+import re
+from typing import Dict, Iterable, List
+
+
+SKILL_PATTERNS_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "skill_patterns.json")
+
+# Words are alphanumeric runs, optionally joined by . + # (next.js, c++, c#).
+# Anything else (spaces, slashes, hyphens, trailing punctuation) separates tokens,
+# which mirrors the \b word boundaries of the original per-skill regexes.
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.+#][a-z0-9]+)*[+#]*")
+
+# Marks the end of a phrase in the trie; holds the canonical skill index
+_END = ""
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SkillMatcher:
+    """Token-trie matcher mapping phrase variants to canonical skill names."""
+
+    def __init__(self, patterns: Dict[str, Iterable[str]]):
+        """patterns: canonical skill -> phrase variants (e.g. "node.js" -> ["node.js", "nodejs"])."""
+        self.canonical: List[str] = list(patterns)
+        self._trie: dict = {}
+        for index, variants in enumerate(patterns.values()):
+            for variant in variants:
+                tokens = tokenize(variant)
+                if not tokens:
+                    continue
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node.setdefault(_END, set()).add(index)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def find_skills(self, text: str) -> List[str]:
+        """All canonical skills mentioned in text, in pattern-file order."""
+        if not text:
+            return []
+
+        tokens = tokenize(text)
+        found = set()
+        trie = self._trie
+        for start in range(len(tokens)):
+            node = trie.get(tokens[start])
+            position = start + 1
+            while node is not None:
+                if _END in node:
+                    found.update(node[_END])
+                if position >= len(tokens):
+                    break
+                node = node.get(tokens[position])
+                position += 1
+
+        return [self.canonical[index] for index in sorted(found)]
+
+
+ENRICHMENT_MATCHER = SkillMatcher.from_file(SKILL_PATTERNS_PATH)
+
+
+NON_SKILL_PATTERNS = [
+    r"\b\d+\s*(\+)?\s*(years|year|yrs)\b",
+    r"\bexperience\b",
+    r"\bdegree\b",
+    r"\bbachelor",
+    r"\bmaster",
+    r"\bph\.?d",
+    r"\bself[-\s]?starter\b",
+    r"\bmotivated\b",
+    r"\bability to\b",
+    r"\bstrong\b",
+    r"\bcustomer service\b",
+    r"\bcommunication\b",
+    r"\binteract with vendors\b",
+    r"\borganized\b",
+]
+
+_NON_SKILL_RE = re.compile("|".join(f"(?:{pattern})" for pattern in NON_SKILL_PATTERNS), re.IGNORECASE)
+
+
+def is_non_skill(text: str) -> bool:
+    """True for requirements that are not concrete skills (degrees, tenure, traits)."""
+    return _NON_SKILL_RE.search(text) is not None
+
+
+def filter_concrete_skills(skills: List[str]) -> List[str]:
+    filtered: List[str] = []
+    seen = set()
+
+    for skill in skills:
+        cleaned = skill.strip()
+        if not cleaned:
+            continue
+
+        lowered = cleaned.lower()
+        if is_non_skill(lowered):
+            continue
+
+        if lowered not in seen:
+            filtered.append(cleaned)
+            seen.add(lowered)
+
+    return filtered
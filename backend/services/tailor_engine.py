@@ -1,97 +1,27 @@
 from models.resume_models import Resume
 from models.job_models import JobDescription
 from .llm_client import rewrite_resume_sections
-import json
+from .page_estimate import PAGE_TEXT_HEIGHT, bullet_length_targets
+from .resume_stats import resume_stats
+from pydantic import ValidationError
+from typing import Tuple
 import re
 
 
-def estimate_resume_fullness(resume: Resume) -> int:
-    """
-    Estimate how full/dense the resume content is by counting various elements.
-    Returns a score representing content density.
-    
-    Higher scores indicate fuller resumes that may not have room for headline/summary.
-    """
-    score = 0
-    
-    # Count experience entries and bullets (weighted heavily)
-    if resume.experience:
-        score += len(resume.experience) * 3  # Each experience entry counts as 3
-        for exp in resume.experience:
-            score += len(exp.bullets)  # Each bullet counts as 1
-    
-    # Count project entries and bullets
-    if resume.projects:
-        score += len(resume.projects) * 2  # Each project counts as 2
-        for proj in resume.projects:
-            score += len(proj.bullets)
-    
-    # Count leadership entries and bullets
-    if resume.leadership:
-        score += len(resume.leadership) * 2  # Each leadership entry counts as 2
-        for lead in resume.leadership:
-            score += len(lead.bullets)
-    
-    # Count education entries
-    if resume.education:
-        score += len(resume.education) * 2  # Each education entry counts as 2
-    
-    # Count other sections (lighter weight)
-    if resume.volunteer_work:
-        score += len(resume.volunteer_work) * 2
-        for vol in resume.volunteer_work:
-            score += len(vol.bullets)
-    
-    if resume.awards:
-        score += len(resume.awards)
-    
-    if resume.publications:
-        score += len(resume.publications) * 2
-    
-    # Skills section counts as 1
-    if resume.skills:
-        score += 1
-    
-    return score
+def needs_compact_mode(resume: Resume) -> bool:
+    """True when resume overflows one page at the template's normal spacing."""
+    return resume_stats(resume).loose_page_height > PAGE_TEXT_HEIGHT
 
 
 def conditionally_remove_headline_summary(resume: Resume) -> Resume:
     """
-    Remove headline and summary sections if the resume is too full to fit on one page.
-    ADD headline and summary if the resume is sparse and needs more content.
-    
-    Threshold guideline:
-    - Score < 35: Resume is sparse, KEEP or ADD headline/summary to fill space
-    - Score >= 35: Resume is full, REMOVE headline/summary to save space
+    Remove headline and summary sections if the resume does not fit on one page.
+    Sparse resumes keep them to fill space.
+
+    Uses the font-metric page estimate (page_estimate.py) at the resume's
+    current spacing rather than counting entries.
     """
-    FULLNESS_THRESHOLD = 35  # Raised from 30
-    
-    fullness_score = estimate_resume_fullness(resume)
-    
-    # Additional checks for sparseness
-    has_work_experience = len(resume.experience) > 0
-    total_bullets = (
-        sum(len(exp.bullets) for exp in resume.experience) +
-        sum(len(proj.bullets) for proj in resume.projects) +
-        sum(len(lead.bullets) for lead in resume.leadership) +
-        sum(len(vol.bullets) for vol in resume.volunteer_work)
-    )
-    
-    # Resume is SPARSE if:
-    # - No work experience, OR
-    # - Few bullets (< 15), OR
-    # - Low fullness score (< 35)
-    is_sparse = (
-        not has_work_experience or
-        total_bullets < 15 or
-        fullness_score < FULLNESS_THRESHOLD
-    )
-    
-    if is_sparse:
-        # Resume is sparse - KEEP headline/summary to fill space
-        # Don't remove even if they exist
-        pass  # Keep as is
-    else:
+    if (resume.headline or resume.summary) and resume_stats(resume).page_height > PAGE_TEXT_HEIGHT:
         # Resume is full - REMOVE headline/summary to save space
         resume.headline = None
         resume.summary = None
@@ -144,7 +74,7 @@ def reorder_skills(resume: Resume, jd: JobDescription) -> Resume:
     return resume
 
 
-def tailor_resume(resume: Resume, jd: JobDescription) -> Resume:
+def tailor_resume(resume: Resume, jd: JobDescription) -> Tuple[Resume, bool]:
     """
     Tailor resume to the job description:
     1. Reorder skills to prioritize JD-relevant ones.
@@ -152,83 +82,42 @@ def tailor_resume(resume: Resume, jd: JobDescription) -> Resume:
     3. Enforce:
        - company, title, dates, location stay EXACTLY the same
        - number of bullets per experience/project/leadership stays the same
-    4. Set compact_mode based on resume fullness
+    4. Set compact_mode based on the estimated page fill
+
+    Returns (resume, rewritten). rewritten is False when the LLM response
+    failed JSON/schema validation and only the rule-based adjustments were
+    applied, so callers can avoid persisting that fallback as the result.
     """
-    # Calculate resume fullness to determine compact mode
-    fullness_score = estimate_resume_fullness(resume)
-    
-    # Count total bullets for density analysis
-    total_bullets = 0
-    for exp in resume.experience:
-        total_bullets += len(exp.bullets)
-    for proj in resume.projects:
-        total_bullets += len(proj.bullets)
-    for lead in resume.leadership:
-        total_bullets += len(lead.bullets)
-    for vol in resume.volunteer_work:
-        total_bullets += len(vol.bullets)
-    
-    # Count sections
-    num_sections = sum([
-        1 if resume.experience else 0,
-        1 if resume.projects else 0,
-        1 if resume.leadership else 0,
-        1 if resume.education else 0,
-        1 if resume.volunteer_work else 0,
-        1 if resume.awards else 0,
-        1 if resume.publications else 0
-    ])
-    
-    # Calculate average bullet length
-    all_bullets = []
-    for exp in resume.experience:
-        all_bullets.extend(exp.bullets)
-    for proj in resume.projects:
-        all_bullets.extend(proj.bullets)
-    for lead in resume.leadership:
-        all_bullets.extend(lead.bullets)
-    for vol in resume.volunteer_work:
-        all_bullets.extend(vol.bullets)
-    
-    avg_bullet_length = sum(len(b) for b in all_bullets) / len(all_bullets) if all_bullets else 150
-    
-    # Check critical indicators
-    has_work_experience = len(resume.experience) > 0
-    has_headline = resume.headline not in [None, ""]
-    has_summary = resume.summary not in [None, ""]
-    
-    # Set compact mode for SPACING using RELAXED criteria
-    # Use minimal spacing if resume has substantial content, regardless of bullet length
-    # This ensures "Full but Verbose" resumes (like Aswath) get minimal spacing
-    resume.compact_mode = (
-        has_work_experience and              # Must have work experience
-        total_bullets >= 15 and              # At least 15 bullets
-        fullness_score >= 35                 # High fullness score
-        # NOTE: Don't check avg_bullet_length here - that's for LLM only
-        # Even if bullets are long/verbose, use minimal spacing to save space
-    )
+    # Set compact mode for SPACING (and bullet compression in the prompt)
+    # when the content overflows one page at normal spacing, going by the
+    # font-metric estimate of every wrapped line rather than entry counts
+    resume.compact_mode = needs_compact_mode(resume)
+
+    # Per-bullet character budgets that make the rewrite fill exactly one page
+    bullet_targets = bullet_length_targets(resume)
     
-    # Keep original experience, project, and leadership structures for safety
-    original_experience = [exp.model_copy(deep=True) for exp in resume.experience]
-    original_projects = [proj.model_copy(deep=True) for proj in resume.projects]
-    original_leadership = [lead.model_copy(deep=True) for lead in resume.leadership]
+    # Keep the original experience, project, and leadership entries to lock
+    # against. Shallow snapshots are enough: nothing below mutates them (the
+    # rewrite is validated into brand-new models), so no deep copies needed
+    original_experience = list(resume.experience)
+    original_projects = list(resume.projects)
+    original_leadership = list(resume.leadership)
 
     # Step 1: rule-based skills adjustment
     resume = reorder_skills(resume, jd)
 
-    # Step 2: LLM rewrite
-    resume_json = json.loads(resume.model_dump_json())
-    jd_json = json.loads(jd.model_dump_json())
+    # Step 2: LLM rewrite (plain JSON-compatible dicts straight from the models)
+    resume_json = resume.model_dump(mode="json")
+    jd_json = jd.model_dump(mode="json")
 
-    rewritten_json_str = rewrite_resume_sections(resume_json, jd_json)
+    rewritten_json_str = rewrite_resume_sections(resume_json, jd_json, bullet_targets, resume_stats(resume))
 
     try:
-        rewritten_data = json.loads(rewritten_json_str)
-    except json.JSONDecodeError:
-        # Fallback to rule-based resume if model breaks JSON
-        return resume
-
-    rewritten_resume = Resume.model_validate(rewritten_data)
+        # Parse and validate the response in one pass (pydantic-core, no json.loads)
+        rewritten_resume = Resume.model_validate_json(rewritten_json_str)
+    except ValidationError:
+        # Fallback to rule-based resume if model breaks JSON or the schema
+        return resume, False
     
     # Preserve compact_mode setting
     rewritten_resume.compact_mode = resume.compact_mode
@@ -305,4 +194,4 @@ def tailor_resume(resume: Resume, jd: JobDescription) -> Resume:
     # Step 5: Conditionally remove headline/summary if resume is too full
     rewritten_resume = conditionally_remove_headline_summary(rewritten_resume)
 
-    return rewritten_resume
+    return rewritten_resume, True
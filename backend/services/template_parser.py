@@ -0,0 +1,450 @@
+"""
+Deterministic fast-path parser for resumes rendered from our own
+templates/resume_template.tex.
+
+Those PDFs have a fully known layout: a large bold name, a dotted contact
+line, bold uppercase section headings in a fixed order, and entry headings
+whose dates sit in a right-aligned column. When the extracted layout lines
+match that structure closely enough, the Resume is rebuilt from text and
+character positions alone, with no LLM call.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+from services.pdf_reader import PdfSource, rewind_source
+from services.section_segmenter import body_font_size, heading_key, is_bold
+
+
+# Section headings emitted by resume_template.tex, in template order
+TEMPLATE_SECTIONS: List[Tuple[str, str]] = [
+    ("EDUCATION", "education"),
+    ("EXPERIENCE", "experience"),
+    ("PROJECTS", "projects"),
+    ("LEADERSHIP", "leadership"),
+    ("VOLUNTEER WORK", "volunteer_work"),
+    ("AWARDS & HONORS", "awards"),
+    ("PUBLICATIONS", "publications"),
+    ("ADDITIONAL INFORMATION", "additional_info"),
+]
+_TEMPLATE_HEADINGS = dict(TEMPLATE_SECTIONS)
+_TEMPLATE_ORDER = [key for _, key in TEMPLATE_SECTIONS]
+
+# Below this the PDF is handed to the LLM parser instead
+MIN_CONFIDENCE = 0.8
+
+# Left minipages are 0.7\textwidth; anything starting right of that is the
+# right-aligned date/semester column
+LEFT_COLUMN_FRACTION = 0.7
+# Justified lines end within this many points of the right margin
+FULL_LINE_SLACK = 15.0
+
+_CONTACT_SEPARATOR_RE = re.compile(r"\s*(?:·|⋅|•|\(cid:\d+\))\s*")
+_BULLET_CHARS = ("•", "∙", "◦")
+_DASHES = ("–", "—", "--")
+_ITALIC_FONT_MARKERS = ("ital", "oblique", "cmti")
+_TIMES_FONT_MARKERS = ("nimbusrom", "times", "ptmr")
+_LIGATURES = {"ﬁ": "fi", "ﬂ": "fl", "ﬀ": "ff", "ﬃ": "ffi", "ﬄ": "ffl"}
+
+# "Label:" prefixes in the ADDITIONAL INFORMATION section -> field
+_ADDITIONAL_LABELS = {
+    "computer skills": "computer_skills",
+    "technical skills": "technical_skills",
+    "skills": "skills",
+    "certifications": "certifications",
+    "languages": "languages",
+    "professional memberships": "professional_memberships",
+    "leadership": "leadership",
+    "work eligibility": "work_eligibility",
+}
+
+_MINOR_LEADERSHIP_RE = re.compile(r"^(?P<org>.*?)(?: - (?P<role>.*?))?(?: \((?P<start>.*?) - (?P<end>.*?)\))?$")
+_PUBLICATION_DETAILS_RE = re.compile(r"^(?P<body>.*?)(?:\s*\((?P<date>[^()]*)\))?$")
+
+
+def _clean(text: str) -> str:
+    for ligature, replacement in _LIGATURES.items():
+        text = text.replace(ligature, replacement)
+    return " ".join(text.split())
+
+
+def _is_italic(fontname: str) -> bool:
+    lowered = (fontname or "").lower()
+    return any(marker in lowered for marker in _ITALIC_FONT_MARKERS)
+
+
+def _join(words: List[dict]) -> str:
+    return _clean(" ".join(w["text"] for w in words))
+
+
+def _append(existing: str, continuation: str) -> str:
+    """Join a wrapped line onto the previous one, undoing end-of-line hyphenation."""
+    if not existing:
+        return continuation
+    if existing.endswith("-") and continuation[:1].islower():
+        return existing[:-1] + continuation
+    return f"{existing} {continuation}"
+
+
+def _split_on_dash(text: str, last: bool = False) -> Tuple[str, Optional[str]]:
+    """Split "A – B" into ("A", "B"); ("A", None) when there is no dash."""
+    positions = [(text.rfind if last else text.find)(f" {dash} ") for dash in _DASHES]
+    positions = [(pos, dash) for pos, dash in zip(positions, _DASHES) if pos != -1]
+    if not positions:
+        stripped = text.strip()
+        for dash in _DASHES:
+            # "-- Present" renders as a leading dash when there is no start date
+            if stripped.startswith(dash):
+                return "", stripped[len(dash):].strip() or None
+        return stripped, None
+    pos, dash = max(positions) if last else min(positions)
+    return text[:pos].strip(), text[pos + len(dash) + 2:].strip() or None
+
+
+def _is_bullet(line: dict) -> bool:
+    return line["text"].lstrip().startswith(_BULLET_CHARS)
+
+
+def _strip_bullet(text: str) -> str:
+    return _clean(text.lstrip().lstrip("".join(_BULLET_CHARS)))
+
+
+class _Layout:
+    """Page geometry shared by the section parsers."""
+
+    def __init__(self, lines: List[dict]):
+        self.left = min(line["x0"] for line in lines)
+        self.right = max(line["x1"] for line in lines)
+        self.right_column_x = self.left + LEFT_COLUMN_FRACTION * (self.right - self.left)
+
+    def starts_at_margin(self, line: dict) -> bool:
+        return line["x0"] <= self.left + 2
+
+    def is_full(self, line: dict) -> bool:
+        return line["x1"] >= self.right - FULL_LINE_SLACK
+
+    def split_columns(self, line: dict) -> Tuple[List[dict], List[dict]]:
+        left = [w for w in line["words"] if w["x0"] < self.right_column_x]
+        right = [w for w in line["words"] if w["x0"] >= self.right_column_x]
+        return left, right
+
+
+def _template_heading(line: dict) -> Optional[str]:
+    return _TEMPLATE_HEADINGS.get(_clean(line["text"])) if line["bold"] >= 0.6 else None
+
+
+def _collect_entries(lines: List[dict], layout: _Layout) -> Tuple[List[dict], int]:
+    """
+    Group a section's lines into entries. An entry starts at a bold line at
+    the left margin; bullet lines (and their wrapped continuations) and any
+    other detail lines belong to the most recent entry.
+    Returns (entries, anomalies) where anomalies counts unassignable lines.
+    """
+    entries: List[dict] = []
+    anomalies = 0
+    for line in lines:
+        if _is_bullet(line):
+            if not entries:
+                anomalies += 1
+                continue
+            entries[-1]["bullets"].append(_strip_bullet(line["text"]))
+        elif is_bold(line["words"][0]["fontname"]) and layout.starts_at_margin(line):
+            left, right = layout.split_columns(line)
+            entries.append({"left": left, "right": _join(right), "details": [], "bullets": []})
+        elif entries and entries[-1]["bullets"]:
+            entries[-1]["bullets"][-1] = _append(entries[-1]["bullets"][-1], _clean(line["text"]))
+        elif entries:
+            entries[-1]["details"].append(line)
+        else:
+            anomalies += 1
+    return entries, anomalies
+
+
+def _split_bold_italic(words: List[dict]) -> Tuple[str, str]:
+    """Split a "\\textbf{A} -- \\textit{B}" heading into (A, B) by font."""
+    bold = [w for w in words if is_bold(w["fontname"])]
+    italic = [w for w in words if _is_italic(w["fontname"]) and not is_bold(w["fontname"])]
+    return _join(bold), _join(italic)
+
+
+def _parse_dated_entries(lines: List[dict], layout: _Layout, name_key: str, role_key: str) -> Tuple[List[dict], int]:
+    """EXPERIENCE / LEADERSHIP / VOLUNTEER WORK entries: bold name -- italic role, dates on the right."""
+    entries, anomalies = _collect_entries(lines, layout)
+    parsed = []
+    for entry in entries:
+        name, role = _split_bold_italic(entry["left"])
+        if not entry["right"]:
+            # The template always renders a date column for these sections
+            anomalies += 1
+        start, end = _split_on_dash(entry["right"])
+        anomalies += len(entry["details"])
+        parsed.append({
+            name_key: name,
+            role_key: role or "",
+            "start_date": start or None,
+            "end_date": end,
+            "bullets": entry["bullets"],
+        })
+    return parsed, anomalies
+
+
+def _parse_education(lines: List[dict], layout: _Layout) -> Tuple[List[dict], int]:
+    entries, anomalies = _collect_entries(lines, layout)
+    parsed = []
+    for entry in entries:
+        school, location = _split_on_dash(_join(entry["left"]), last=True)
+        edu = {"school": school, "location": location, "graduation_date": entry["right"] or None, "degree": ""}
+        field = None
+        for detail in entry["details"]:
+            text = _clean(detail["text"])
+            if text.startswith("Scholarships:"):
+                field, edu["scholarships"] = "scholarships", text[len("Scholarships:"):].strip()
+            elif text.startswith("Overall GPA:"):
+                field, edu["gpa"] = "gpa", text[len("Overall GPA:"):].strip()
+            elif field is None and not edu["degree"]:
+                field, edu["degree"] = "degree", text
+            elif field:
+                edu[field] = _append(edu[field], text)
+            else:
+                anomalies += 1
+        degree, _, major = edu["degree"].partition(", ")
+        edu["degree"], edu["major"] = degree, major or None
+        anomalies += len(entry["bullets"])
+        parsed.append(edu)
+    return parsed, anomalies
+
+
+def _parse_projects(lines: List[dict], layout: _Layout) -> Tuple[List[dict], int]:
+    entries, anomalies = _collect_entries(lines, layout)
+    parsed = []
+    for entry in entries:
+        name, role = _split_bold_italic(entry["left"])
+        anomalies += len(entry["details"])
+        parsed.append({"name": name, "role": role or None, "semester": entry["right"] or None, "bullets": entry["bullets"]})
+    return parsed, anomalies
+
+
+def _parse_awards(lines: List[dict], layout: _Layout) -> Tuple[List[dict], int]:
+    entries, anomalies = _collect_entries(lines, layout)
+    parsed = []
+    for entry in entries:
+        title, organization = _split_bold_italic(entry["left"])
+        description = ""
+        for detail in entry["details"]:
+            description = _append(description, _clean(detail["text"]))
+        anomalies += len(entry["bullets"])
+        parsed.append({
+            "title": title,
+            "organization": organization or None,
+            "date": entry["right"] or None,
+            "description": description or None,
+        })
+    return parsed, anomalies
+
+
+def _parse_publications(lines: List[dict], layout: _Layout) -> Tuple[List[dict], int]:
+    entries, anomalies = _collect_entries(lines, layout)
+    parsed = []
+    for entry in entries:
+        pub = {"title": " ".join(part for part in (_join(entry["left"]), entry["right"]) if part)}
+        for detail in entry["details"]:
+            text = _clean(detail["text"])
+            if _is_italic(detail["words"][0]["fontname"]) and "authors" not in pub and "venue" not in pub:
+                match = _PUBLICATION_DETAILS_RE.match(text)
+                body, date = match.group("body").strip(), match.group("date")
+                authors, _, venue = body.rpartition(", ")
+                pub["authors"], pub["venue"] = (authors, venue) if authors else (body, None)
+                pub["date"] = date
+            elif " " not in text and "." in text:
+                pub["url"] = text
+            else:
+                anomalies += 1
+        anomalies += len(entry["bullets"])
+        parsed.append(pub)
+    return parsed, anomalies
+
+
+def _split_list(text: str, separator: str) -> List[str]:
+    return [item.strip() for item in text.split(separator) if item.strip()]
+
+
+def _parse_additional_info(lines: List[dict], layout: _Layout) -> Tuple[dict, List[str], List[dict], int]:
+    """Returns (additional_info, skills, minor_leadership, anomalies)."""
+    fields: Dict[str, str] = {}
+    others: List[str] = []
+    current: Optional[str] = None
+    previous: Optional[dict] = None
+
+    for line in lines:
+        bold_prefix = []
+        for word in line["words"]:
+            if not is_bold(word["fontname"]):
+                break
+            bold_prefix.append(word)
+        label = _join(bold_prefix).rstrip(":").lower() if bold_prefix else ""
+        text = _clean(line["text"])
+
+        if label in _ADDITIONAL_LABELS:
+            current = _ADDITIONAL_LABELS[label]
+            fields[current] = _clean(" ".join(w["text"] for w in line["words"][len(bold_prefix):]))
+        elif previous is not None and layout.is_full(previous) and (current or others):
+            # Wrapped continuation of the previous field or paragraph
+            if current:
+                fields[current] = _append(fields[current], text)
+            else:
+                others[-1] = _append(others[-1], text)
+        else:
+            current = None
+            others.append(text)
+        previous = line
+
+    info: dict = {}
+    skills: List[str] = []
+    for key in ("computer_skills", "technical_skills", "work_eligibility"):
+        if fields.get(key):
+            info[key] = fields[key]
+    for key in ("certifications", "languages", "professional_memberships"):
+        if fields.get(key):
+            info[key] = _split_list(fields[key], ", ")
+    if fields.get("skills"):
+        skills = _split_list(fields["skills"], "|")
+    if others:
+        info["other"] = " ".join(others)
+
+    leadership: List[dict] = []
+    if fields.get("leadership"):
+        match = _MINOR_LEADERSHIP_RE.match(fields["leadership"])
+        leadership.append({
+            "organization": match.group("org"),
+            "role": match.group("role"),
+            "start_date": match.group("start"),
+            "end_date": match.group("end"),
+            "bullets": [],
+        })
+
+    return info, skills, leadership, 0
+
+
+def _parse_contact(text: str) -> dict:
+    contact: dict = {}
+    for item in _CONTACT_SEPARATOR_RE.split(text):
+        item = item.strip()
+        if not item:
+            continue
+        lowered = item.lower()
+        if "@" in item and "email" not in contact:
+            contact["email"] = item
+        elif ("linkedin" in lowered or lowered.startswith(("http", "www."))) and "linkedin" not in contact:
+            contact["linkedin"] = item
+        elif sum(ch.isdigit() for ch in item) >= 7 and "phone" not in contact:
+            contact["phone"] = item
+        elif "location" not in contact:
+            contact["location"] = item
+    return contact
+
+
+def is_pdftex_document(source: PdfSource) -> bool:
+    """Cheap metadata check: only pdfTeX output can come from our template."""
+    import pdfplumber
+
+    with pdfplumber.open(rewind_source(source)) as pdf:
+        metadata = pdf.metadata or {}
+    producer = f"{metadata.get('Producer', '')} {metadata.get('Creator', '')}".lower()
+    return "pdftex" in producer or "latex" in producer
+
+
+def parse_template_resume(lines: List[dict]) -> Tuple[Optional[dict], float]:
+    """
+    Rebuild Resume JSON from the layout lines of a PDF rendered by
+    resume_template.tex.
+
+    Returns (resume_dict, confidence). confidence is 0 when the hard
+    structural checks fail (big bold name first, template headings present
+    and in template order, no foreign headings) or any line did not fit the
+    template structure (it would be dropped); otherwise it is the share of
+    soft checks (dotted contact line, Times fonts) that pass.
+    """
+    if len(lines) < 3:
+        return None, 0.0
+
+    layout = _Layout(lines)
+    body_size = body_font_size(lines)
+
+    name_line = lines[0]
+    headings = [(i, _template_heading(line)) for i, line in enumerate(lines)]
+    headings = [(i, key) for i, key in headings if key]
+    order = [_TEMPLATE_ORDER.index(key) for _, key in headings]
+    foreign_headings = [
+        line for line in lines
+        if not _template_heading(line) and line["bold"] >= 0.6 and heading_key(line, body_size)
+    ]
+
+    hard_checks = [
+        name_line["size"] >= body_size + 5 and name_line["bold"] >= 0.6,
+        bool(headings),
+        order == sorted(set(order)),
+        not foreign_headings,
+    ]
+    if not all(hard_checks):
+        return None, 0.0
+
+    header_lines = lines[1:headings[0][0]]
+    contact_text = _clean(header_lines[0]["text"]) if header_lines else ""
+    fonts = [w["fontname"].lower() for line in lines for w in line["words"]]
+    times_ratio = sum(any(m in f for m in _TIMES_FONT_MARKERS) for f in fonts) / len(fonts)
+
+    soft_checks = [
+        bool(_CONTACT_SEPARATOR_RE.search(contact_text)) or "@" in contact_text,
+        times_ratio >= 0.8,
+    ]
+
+    resume: dict = {"name": _clean(name_line["text"])}
+
+    # Header: contact line, optional italic centered headline, optional summary paragraph
+    body_header = header_lines
+    if contact_text and (soft_checks[0] or any(ch.isdigit() for ch in contact_text)):
+        resume["contact"] = _parse_contact(contact_text)
+        body_header = header_lines[1:]
+    summary = ""
+    for line in body_header:
+        text = _clean(line["text"])
+        if not summary and "headline" not in resume and all(_is_italic(w["fontname"]) for w in line["words"]):
+            resume["headline"] = text
+        else:
+            summary = _append(summary, text)
+    if summary:
+        resume["summary"] = summary
+
+    # Sections
+    anomalies = 0
+    bounds = [i for i, _ in headings] + [len(lines)]
+    for (start, key), end in zip(headings, bounds[1:]):
+        section_lines = lines[start + 1:end]
+        if key in ("experience", "leadership", "volunteer_work"):
+            name_key, role_key = ("company", "title") if key == "experience" else ("organization", "role")
+            entries, bad = _parse_dated_entries(section_lines, layout, name_key, role_key)
+            resume[key] = resume.get(key, []) + entries
+        elif key == "education":
+            resume[key], bad = _parse_education(section_lines, layout)
+        elif key == "projects":
+            resume[key], bad = _parse_projects(section_lines, layout)
+        elif key == "awards":
+            resume[key], bad = _parse_awards(section_lines, layout)
+        elif key == "publications":
+            resume[key], bad = _parse_publications(section_lines, layout)
+        else:
+            info, skills, minor_leadership, bad = _parse_additional_info(section_lines, layout)
+            resume["additional_info"] = info
+            resume["skills"] = skills
+            resume["leadership"] = resume.get("leadership", []) + minor_leadership
+        anomalies += bad
+
+    if not resume.get("skills"):
+        info = resume.get("additional_info") or {}
+        skill_line = info.get("computer_skills") or info.get("technical_skills") or ""
+        resume["skills"] = [s.strip() for s in re.split(r"[,|;]", skill_line) if s.strip()]
+
+    # A line that did not fit the template structure would be missing from
+    # the Resume, so any such line is a hard failure (the LLM parser gets it)
+    if anomalies:
+        return resume, 0.0
+    return resume, sum(soft_checks) / len(soft_checks)
@@ -0,0 +1,127 @@
+from typing import BinaryIO
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+
+# The PDF header must appear within the first 1024 bytes of the file
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
+# Some browsers/file pickers send a generic type (or none) for PDFs;
+# the magic-byte check is the real gate.
+ALLOWED_CONTENT_TYPES = {"application/pdf", "application/x-pdf", "application/octet-stream", ""}
+
+# Room for multipart boundaries and the jd_text/output form fields
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+REQUEST_TOO_LARGE_DETAIL = "Request body is too large. Please upload a smaller resume PDF."
+
+
+def max_upload_bytes() -> int:
+    return settings.max_upload_mb * 1024 * 1024
+
+
+def max_request_bytes() -> int:
+    """Largest request body the upload endpoints will accept (file + form fields)."""
+    return max_upload_bytes() + MULTIPART_OVERHEAD_BYTES
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject request bodies over max_request_bytes() with 413: up front from
+    Content-Length, and while the body streams in, so chunked uploads that
+    send no Content-Length are cut off at the limit instead of being spooled
+    in full first.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = max_request_bytes()
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            await JSONResponse(status_code=413, content={"detail": REQUEST_TOO_LARGE_DETAIL})(scope, receive, send)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised into whoever reads the body; FastAPI re-raises
+                    # HTTPExceptions from body parsing as they are
+                    raise HTTPException(status_code=413, detail=REQUEST_TOO_LARGE_DETAIL)
+            return message
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except HTTPException as e:
+            # Body read outside a route (nothing turned the 413 into a response)
+            if e.status_code != 413 or response_started:
+                raise
+            await JSONResponse(status_code=413, content={"detail": e.detail})(scope, receive, send)
+
+
+def open_pdf_upload(pdf: UploadFile) -> BinaryIO:
+    """
+    Validate an uploaded resume and return its file object, rewound.
+
+    Starlette already streams multipart file parts into a SpooledTemporaryFile
+    (in memory up to 1 MB, then a private temp file), so the extractor reads
+    that object directly: no extra copy into Python bytes, no shared
+    /tmp/{filename} path for concurrent uploads to clobber, and the buffer is
+    released when the upload is closed.
+
+    Raises HTTPException 413 for oversized files and 415 for non-PDF bodies.
+    """
+    content_type = (pdf.content_type or "").split(";")[0].strip().lower()
+    if content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported file type '{pdf.content_type}'. Please upload a PDF resume."
+        )
+
+    f = pdf.file
+    size = pdf.size
+    if size is None:
+        f.seek(0, 2)
+        size = f.tell()
+
+    if size > max_upload_bytes():
+        raise HTTPException(
+            status_code=413,
+            detail=f"Resume PDF is too large ({size / (1024 * 1024):.1f} MB). "
+                   f"The maximum upload size is {settings.max_upload_mb} MB."
+        )
+    if size == 0:
+        raise HTTPException(status_code=400, detail="The uploaded file is empty.")
+
+    f.seek(0)
+    header = f.read(PDF_HEADER_WINDOW)
+    f.seek(0)
+    if PDF_MAGIC not in header:
+        raise HTTPException(
+            status_code=415,
+            detail="The uploaded file is not a valid PDF. Please upload a PDF resume."
+        )
+
+    return f
@@ -73,7 +73,7 @@ export interface JobDescription {
   nice_to_have_skills: string[];
   responsibilities: string[];
   keywords: string[];
-  raw_text: string;
+  raw_text?: string;
 }
 
 export interface CompatibilityReport {